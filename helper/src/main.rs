@@ -11,16 +11,36 @@ use std::thread;
 use std::time::Duration;
 
 const MAX_LABEL_LEN: usize = 64;
+const MAX_BATCH_LEN: usize = 8;
+const MAX_DEVICES: i64 = 8;
 
 #[derive(Debug, Clone)]
 struct VideoParams {
     video_nr: i64,
     label: String,
     exclusive_caps: bool,
+    devices: i64,
     force: bool,
     always_reload: bool,
 }
 
+impl VideoParams {
+    /// AVream's loopback nodes: video_nr, video_nr + 1, ... with "<label>", "<label> 2", ...
+    fn slots(&self) -> Vec<(i64, String)> {
+        (0..self.devices)
+            .map(|i| (self.video_nr + i, slot_label(&self.label, i)))
+            .collect()
+    }
+}
+
+fn slot_label(label: &str, index: i64) -> String {
+    if index == 0 {
+        label.to_string()
+    } else {
+        format!("{} {}", label, index + 1)
+    }
+}
+
 #[derive(Debug, Clone)]
 struct V4l2Inspect {
     module_loaded: bool,
@@ -30,6 +50,7 @@ struct V4l2Inspect {
     config_matches: bool,
     requires_reload: bool,
     slot_index: Option<usize>,
+    devices: i64,
     reasons: Vec<String>,
 }
 
@@ -43,6 +64,7 @@ impl V4l2Inspect {
             "config_matches": self.config_matches,
             "requires_reload": self.requires_reload,
             "slot_index": self.slot_index,
+            "devices": self.devices,
             "reasons": self.reasons,
         })
     }
@@ -127,6 +149,7 @@ fn parse_video_params(params: &Value) -> Result<VideoParams, String> {
             "video_nr",
             "label",
             "exclusive_caps",
+            "devices",
             "force",
             "always_reload",
         ],
@@ -135,14 +158,19 @@ fn parse_video_params(params: &Value) -> Result<VideoParams, String> {
     if !(0..=255).contains(&video_nr) {
         return Err("video_nr must be in range 0..255".to_string());
     }
+    let devices = parse_i64(params, "devices", 1)?;
+    if !(1..=MAX_DEVICES).contains(&devices) || video_nr + devices - 1 > 255 {
+        return Err("devices must be in range 1..8 and keep video_nr within 0..255".to_string());
+    }
     let label = parse_string(params, "label", "AVream Camera")?;
-    if !valid_label(&label) {
+    if !(0..devices).all(|i| valid_label(&slot_label(&label, i))) {
         return Err("label must be 1..64 chars and use [A-Za-z0-9 _-]".to_string());
     }
     Ok(VideoParams {
         video_nr,
         label,
         exclusive_caps: parse_bool(params, "exclusive_caps", true)?,
+        devices,
         force: parse_bool(params, "force", false)?,
         always_reload: parse_bool(params, "always_reload", false)?,
     })
@@ -180,19 +208,39 @@ fn run_cmd(cmd: &str, args: &[String]) -> Result<(), String> {
     }
 }
 
-fn ensure_config(video_nr: i64, label: &str, exclusive_caps: bool) -> Result<Value, String> {
-    if !(0..=255).contains(&video_nr) {
+/// Module options for the pool as (video_nr, card_label, exclusive_caps) comma lists.
+fn module_option_values(p: &VideoParams) -> (String, Vec<String>, String) {
+    let slots = p.slots();
+    let nrs: Vec<String> = slots.iter().map(|(nr, _)| nr.to_string()).collect();
+    let labels: Vec<String> = slots.into_iter().map(|(_, label)| label).collect();
+    let excl = vec![if p.exclusive_caps { "1" } else { "0" }; p.devices as usize];
+    (nrs.join(","), labels, excl.join(","))
+}
+
+fn config_content(p: &VideoParams) -> String {
+    let (nrs, labels, excl) = module_option_values(p);
+    let quoted: Vec<String> = labels.iter().map(|l| format!("\"{}\"", l)).collect();
+    let devices = if p.devices > 1 {
+        format!("devices={} ", p.devices)
+    } else {
+        String::new()
+    };
+    format!(
+        "# Managed by AVream\noptions v4l2loopback {}video_nr={} card_label={} exclusive_caps={}\n",
+        devices,
+        nrs,
+        quoted.join(","),
+        excl
+    )
+}
+
+fn ensure_config(p: &VideoParams) -> Result<Value, String> {
+    if !(0..=255).contains(&p.video_nr) {
         return Err("video_nr out of range (0-255)".to_string());
     }
 
     let path = "/etc/modprobe.d/avream-v4l2loopback.conf";
-    let content = format!(
-        "# Managed by AVream\noptions v4l2loopback video_nr={} card_label=\"{}\" exclusive_caps={}\n",
-        video_nr,
-        label,
-        if exclusive_caps { 1 } else { 0 }
-    );
-    fs::write(path, content).map_err(|e| format!("failed to write {}: {}", path, e))?;
+    fs::write(path, config_content(p)).map_err(|e| format!("failed to write {}: {}", path, e))?;
     Ok(json!({"config_path": path}))
 }
 
@@ -246,15 +294,51 @@ fn read_sys_param(path: &str) -> Option<String> {
     fs::read_to_string(path).ok()
 }
 
-fn inspect_v4l2(video_nr: i64, label: &str, exclusive_caps: bool) -> V4l2Inspect {
-    let device = format!("/dev/video{}", video_nr);
+/// Checks one pool node against the module parameters; returns its slot index and mismatch reasons.
+fn check_slot(
+    values: &(Vec<String>, Vec<String>, Vec<String>),
+    video_nr: i64,
+    label: &str,
+    exclusive_caps: bool,
+) -> (Option<usize>, Vec<String>) {
+    let (nr_values, label_values, excl_values) = values;
+    let mut reasons: Vec<String> = Vec::new();
+    let target_nr = video_nr.to_string();
+    let slot_index = nr_values.iter().position(|v| v == &target_nr);
+    match slot_index {
+        None => reasons.push("video_nr_not_configured".to_string()),
+        Some(idx) => {
+            if let Some(current_label) = label_values.get(idx) {
+                if current_label != label {
+                    reasons.push("label_mismatch".to_string());
+                }
+            }
+            if let Some(current_excl) = excl_values.get(idx) {
+                match parse_bool_token(current_excl) {
+                    Some(parsed) if parsed == exclusive_caps => {}
+                    _ => reasons.push("exclusive_caps_mismatch".to_string()),
+                }
+            }
+        }
+    }
+    (slot_index, reasons)
+}
+
+/// Status of the first node; reasons for the other pool nodes are prefixed with "videoN:".
+fn inspect_v4l2(p: &VideoParams) -> V4l2Inspect {
+    let slots = p.slots();
+    let device = format!("/dev/video{}", p.video_nr);
     let module_loaded = module_loaded("v4l2loopback");
     let device_exists = Path::new(&device).exists();
-    let device_busy = device_exists && device_busy(video_nr);
+    // Unloading the module removes every node, so any busy pool node blocks a reload.
+    let device_busy = slots
+        .iter()
+        .any(|(nr, _)| Path::new(&format!("/dev/video{}", nr)).exists() && device_busy(*nr));
 
     let mut reasons: Vec<String> = Vec::new();
     let mut slot_index: Option<usize> = None;
     let mut config_matches = false;
+    let mut pool_ready = true;
 
     if !module_loaded {
         reasons.push("module_not_loaded".to_string());
@@ -267,45 +351,36 @@ fn inspect_v4l2(video_nr: i64, label: &str, exclusive_caps: bool) -> V4l2Inspect
             reasons.push("video_nr_param_unavailable".to_string());
         }
 
-        let nr_values = nr_raw.map(|v| split_param_csv(&v)).unwrap_or_default();
-        let label_values = labels_raw.map(|v| split_param_csv(&v)).unwrap_or_default();
-        let excl_values = excl_raw.map(|v| split_param_csv(&v)).unwrap_or_default();
-
-        let target_nr = video_nr.to_string();
-        slot_index = nr_values.iter().position(|v| v == &target_nr);
-        if slot_index.is_none() {
-            reasons.push("video_nr_not_configured".to_string());
-        } else {
-            let idx = slot_index.unwrap_or_default();
-            let mut label_ok = true;
-            let mut excl_ok = true;
-
-            if let Some(current_label) = label_values.get(idx) {
-                if current_label != label {
-                    label_ok = false;
-                    reasons.push("label_mismatch".to_string());
-                }
-            }
-
-            if let Some(current_excl) = excl_values.get(idx) {
-                match parse_bool_token(current_excl) {
-                    Some(parsed) if parsed == exclusive_caps => {}
-                    _ => {
-                        excl_ok = false;
-                        reasons.push("exclusive_caps_mismatch".to_string());
-                    }
-                }
+        let values = (
+            nr_raw.map(|v| split_param_csv(&v)).unwrap_or_default(),
+            labels_raw.map(|v| split_param_csv(&v)).unwrap_or_default(),
+            excl_raw.map(|v| split_param_csv(&v)).unwrap_or_default(),
+        );
+
+        config_matches = true;
+        for (i, (nr, label)) in slots.iter().enumerate() {
+            let (index, slot_reasons) = check_slot(&values, *nr, label, p.exclusive_caps);
+            config_matches = config_matches && slot_reasons.is_empty();
+            if i == 0 {
+                slot_index = index;
+                reasons.extend(slot_reasons);
+            } else {
+                reasons.extend(slot_reasons.into_iter().map(|r| format!("video{}:{}", nr, r)));
             }
-
-            config_matches = label_ok && excl_ok;
         }
     }
 
     if !device_exists {
         reasons.push("device_missing".to_string());
     }
+    for (nr, _) in slots.iter().skip(1) {
+        if !Path::new(&format!("/dev/video{}", nr)).exists() {
+            pool_ready = false;
+            reasons.push(format!("video{}:device_missing", nr));
+        }
+    }
 
-    let requires_reload = !module_loaded || !device_exists || !config_matches;
+    let requires_reload = !module_loaded || !device_exists || !config_matches || !pool_ready;
 
     V4l2Inspect {
         module_loaded,
@@ -315,29 +390,37 @@ fn inspect_v4l2(video_nr: i64, label: &str, exclusive_caps: bool) -> V4l2Inspect
         config_matches,
         requires_reload,
         slot_index,
+        devices: p.devices,
         reasons,
     }
 }
 
-fn wait_for_device(video_nr: i64, retries: usize, delay_ms: u64) -> bool {
-    let dev = format!("/dev/video{}", video_nr);
+fn wait_for_devices(p: &VideoParams, retries: usize, delay_ms: u64) -> bool {
+    let devs: Vec<String> = p.slots().iter().map(|(nr, _)| format!("/dev/video{}", nr)).collect();
+    let all_exist = || devs.iter().all(|dev| Path::new(dev).exists());
     for _ in 0..retries {
-        if Path::new(&dev).exists() {
+        if all_exist() {
             return true;
         }
         thread::sleep(Duration::from_millis(delay_ms));
     }
-    Path::new(&dev).exists()
+    all_exist()
 }
 
-fn modprobe_load(video_nr: i64, label: &str, exclusive_caps: bool) -> Result<(), String> {
-    let args = vec![
-        "v4l2loopback".to_string(),
-        format!("video_nr={}", video_nr),
-        format!("card_label={}", label),
-        format!("exclusive_caps={}", if exclusive_caps { 1 } else { 0 }),
-    ];
-    run_cmd("modprobe", &args)
+fn modprobe_args(p: &VideoParams) -> Vec<String> {
+    let (nrs, labels, excl) = module_option_values(p);
+    let mut args = vec!["v4l2loopback".to_string()];
+    if p.devices > 1 {
+        args.push(format!("devices={}", p.devices));
+    }
+    args.push(format!("video_nr={}", nrs));
+    args.push(format!("card_label={}", labels.join(",")));
+    args.push(format!("exclusive_caps={}", excl));
+    args
+}
+
+fn modprobe_load(p: &VideoParams) -> Result<(), String> {
+    run_cmd("modprobe", &modprobe_args(p))
 }
 
 fn modprobe_unload() -> Result<(), String> {
@@ -345,10 +428,64 @@ fn modprobe_unload() -> Result<(), String> {
     run_cmd("modprobe", &args)
 }
 
+/// Runs an ordered list of actions in this single (elevated) process and
+/// returns one response per action. With stop_on_error (default), actions
+/// after the first failure are reported as E_SKIPPED without running.
+fn handle_batch(params: &Value) -> Response {
+    if let Err(e) = validate_param_keys(params, &["requests", "stop_on_error"]) {
+        return Response::err("E_INVALID_PARAM", &e);
+    }
+    let stop_on_error = match parse_bool(params, "stop_on_error", true) {
+        Ok(v) => v,
+        Err(e) => return Response::err("E_INVALID_PARAM", &e),
+    };
+    let items = match params.get("requests").and_then(Value::as_array) {
+        Some(items) if !items.is_empty() && items.len() <= MAX_BATCH_LEN => items,
+        _ => {
+            return Response::err(
+                "E_INVALID_PARAM",
+                "requests must be a non-empty array of at most 8 actions",
+            )
+        }
+    };
+
+    let mut results: Vec<Value> = Vec::with_capacity(items.len());
+    let mut failed = false;
+    for item in items {
+        let action = item
+            .get("action")
+            .and_then(Value::as_str)
+            .unwrap_or("")
+            .to_string();
+        let resp = if failed && stop_on_error {
+            Response::err("E_SKIPPED", "skipped after an earlier action failed")
+        } else if let Err(e) = validate_param_keys(item, &["action", "params"]) {
+            Response::err("E_INVALID_PARAM", &e)
+        } else if action == "batch" {
+            Response::err("E_ACTION", "nested batch is not allowed")
+        } else {
+            let sub = Request {
+                request_id: String::new(),
+                action: action.clone(),
+                params: item.get("params").cloned().unwrap_or(Value::Null),
+            };
+            handle_request(&sub)
+        };
+        failed = failed || !resp.ok;
+        let mut entry = serde_json::to_value(&resp).unwrap_or_else(|_| json!({"ok": false}));
+        if let Some(obj) = entry.as_object_mut() {
+            obj.insert("action".to_string(), json!(action));
+        }
+        results.push(entry);
+    }
+    Response::ok(json!({"results": results}))
+}
+
 fn handle_request(req: &Request) -> Response {
     let params = &req.params;
 
     match req.action.as_str() {
+        "batch" => handle_batch(params),
         "noop" => {
             if let Err(e) = parse_empty_params(params) {
                 return Response::err("E_INVALID_PARAM", &e);
@@ -360,7 +497,7 @@ fn handle_request(req: &Request) -> Response {
                 Ok(p) => p,
                 Err(e) => return Response::err("E_INVALID_PARAM", &e),
             };
-            let status = inspect_v4l2(parsed.video_nr, &parsed.label, parsed.exclusive_caps);
+            let status = inspect_v4l2(&parsed);
             Response::ok(status.to_json())
         }
         "snd_aloop.status" => {
@@ -375,7 +512,7 @@ fn handle_request(req: &Request) -> Response {
                 Ok(p) => p,
                 Err(e) => return Response::err("E_INVALID_PARAM", &e),
             };
-            match ensure_config(parsed.video_nr, &parsed.label, parsed.exclusive_caps) {
+            match ensure_config(&parsed) {
                 Ok(data) => Response::ok(data),
                 Err(e) => Response::err("E_CONFIG_WRITE", &e),
             }
@@ -385,7 +522,7 @@ fn handle_request(req: &Request) -> Response {
                 Ok(p) => p,
                 Err(e) => return Response::err("E_INVALID_PARAM", &e),
             };
-            match modprobe_load(parsed.video_nr, &parsed.label, parsed.exclusive_caps) {
+            match modprobe_load(&parsed) {
                 Ok(_) => Response::ok(json!({"loaded": true})),
                 Err(e) => {
                     if e.contains("not found") {
@@ -401,7 +538,7 @@ fn handle_request(req: &Request) -> Response {
                 Ok(p) => p,
                 Err(e) => return Response::err("E_INVALID_PARAM", &e),
             };
-            let before = inspect_v4l2(parsed.video_nr, &parsed.label, parsed.exclusive_caps);
+            let before = inspect_v4l2(&parsed);
 
             if before.device_busy && !parsed.force {
                 if !before.requires_reload && !parsed.always_reload {
@@ -420,7 +557,7 @@ fn handle_request(req: &Request) -> Response {
             }
 
             if !before.requires_reload && !parsed.always_reload {
-                let _ = ensure_config(parsed.video_nr, &parsed.label, parsed.exclusive_caps);
+                let _ = ensure_config(&parsed);
                 return Response::ok(json!({
                     "reloaded": false,
                     "ensured": true,
@@ -430,7 +567,7 @@ fn handle_request(req: &Request) -> Response {
                 }));
             }
 
-            match ensure_config(parsed.video_nr, &parsed.label, parsed.exclusive_caps) {
+            match ensure_config(&parsed) {
                 Ok(_) => {}
                 Err(e) => return Response::err("E_CONFIG_WRITE", &e),
             }
@@ -439,16 +576,16 @@ fn handle_request(req: &Request) -> Response {
                 let _ = modprobe_unload();
             }
 
-            match modprobe_load(parsed.video_nr, &parsed.label, parsed.exclusive_caps) {
+            match modprobe_load(&parsed) {
                 Ok(_) => {
-                    let appeared = wait_for_device(parsed.video_nr, 30, 100);
+                    let appeared = wait_for_devices(&parsed, 30, 100);
                     if !appeared {
                         return Response::err(
                             "E_DEVICE_MISSING",
                             "reloaded module but target /dev/videoN did not appear",
                         );
                     }
-                    let after = inspect_v4l2(parsed.video_nr, &parsed.label, parsed.exclusive_caps);
+                    let after = inspect_v4l2(&parsed);
                     if !after.config_matches {
                         return Response::err("E_CONFIG_MISMATCH", "v4l2loopback loaded but effective params do not match requested config");
                     }
@@ -457,6 +594,7 @@ fn handle_request(req: &Request) -> Response {
                         "ensured": true,
                         "always_reload": parsed.always_reload,
                         "video_nr": parsed.video_nr,
+                        "devices": parsed.devices,
                         "status_before": before.to_json(),
                         "status_after": after.to_json(),
                     }))
@@ -560,6 +698,64 @@ mod tests {
         assert!(err.contains("unsupported param"));
     }
 
+    #[test]
+    fn test_parse_video_params_devices_range() {
+        assert_eq!(parse_video_params(&json!({})).unwrap().devices, 1);
+        assert_eq!(parse_video_params(&json!({"devices": 4})).unwrap().devices, 4);
+        assert!(parse_video_params(&json!({"devices": 0})).is_err());
+        assert!(parse_video_params(&json!({"devices": 9})).is_err());
+        assert!(parse_video_params(&json!({"video_nr": 254, "devices": 3})).is_err());
+    }
+
+    #[test]
+    fn test_single_device_module_options_unchanged() {
+        let parsed = parse_video_params(&json!({})).unwrap();
+        assert_eq!(
+            modprobe_args(&parsed),
+            vec!["v4l2loopback", "video_nr=10", "card_label=AVream Camera", "exclusive_caps=1"]
+        );
+        assert_eq!(
+            config_content(&parsed),
+            "# Managed by AVream\noptions v4l2loopback video_nr=10 card_label=\"AVream Camera\" exclusive_caps=1\n"
+        );
+    }
+
+    #[test]
+    fn test_device_pool_module_options() {
+        let parsed = parse_video_params(&json!({"devices": 3})).unwrap();
+        assert_eq!(
+            modprobe_args(&parsed),
+            vec![
+                "v4l2loopback",
+                "devices=3",
+                "video_nr=10,11,12",
+                "card_label=AVream Camera,AVream Camera 2,AVream Camera 3",
+                "exclusive_caps=1,1,1",
+            ]
+        );
+        assert!(config_content(&parsed).contains(
+            "devices=3 video_nr=10,11,12 card_label=\"AVream Camera\",\"AVream Camera 2\",\"AVream Camera 3\""
+        ));
+    }
+
+    #[test]
+    fn test_check_slot_reports_per_node_mismatches() {
+        let values = (
+            split_param_csv("10,11"),
+            split_param_csv("AVream Camera,Other"),
+            split_param_csv("1,1"),
+        );
+        assert_eq!(check_slot(&values, 10, "AVream Camera", true), (Some(0), vec![]));
+        assert_eq!(
+            check_slot(&values, 11, "AVream Camera 2", true),
+            (Some(1), vec!["label_mismatch".to_string()])
+        );
+        assert_eq!(
+            check_slot(&values, 12, "AVream Camera 3", true),
+            (None, vec!["video_nr_not_configured".to_string()])
+        );
+    }
+
     #[test]
     fn test_noop_rejects_params() {
         let req = Request {
@@ -571,6 +767,51 @@ mod tests {
         assert!(!resp.ok);
     }
 
+    #[test]
+    fn test_batch_runs_actions_in_order() {
+        let req = Request {
+            request_id: "rid-2".to_string(),
+            action: "batch".to_string(),
+            params: json!({"requests": [
+                {"action": "noop", "params": {}},
+                {"action": "snd_aloop.status", "params": {}},
+            ]}),
+        };
+        let resp = handle_request(&req);
+        assert!(resp.ok);
+        let results = resp.data.unwrap()["results"].as_array().unwrap().clone();
+        assert_eq!(results.len(), 2);
+        assert_eq!(results[0]["action"], "noop");
+        assert_eq!(results[0]["data"]["noop"], true);
+        assert_eq!(results[1]["action"], "snd_aloop.status");
+        assert_eq!(results[1]["ok"], true);
+    }
+
+    #[test]
+    fn test_batch_skips_after_failure_and_rejects_nesting() {
+        let req = Request {
+            request_id: "rid-3".to_string(),
+            action: "batch".to_string(),
+            params: json!({"requests": [
+                {"action": "batch", "params": {}},
+                {"action": "noop", "params": {}},
+            ]}),
+        };
+        let results = handle_request(&req).data.unwrap()["results"].as_array().unwrap().clone();
+        assert_eq!(results[0]["error"]["code"], "E_ACTION");
+        assert_eq!(results[1]["error"]["code"], "E_SKIPPED");
+    }
+
+    #[test]
+    fn test_batch_rejects_empty_list() {
+        let req = Request {
+            request_id: "rid-4".to_string(),
+            action: "batch".to_string(),
+            params: json!({"requests": []}),
+        };
+        assert!(!handle_request(&req).ok);
+    }
+
     #[test]
     fn test_request_id_validation() {
         assert!(validate_request_id("a-b_c.123").is_ok());
@@ -16,7 +16,10 @@ def _app_key(name: str) -> Any:
 STATE_STORE: Any = _app_key("state_store")
 PATHS: Any = _app_key("paths")
 VIDEO_MANAGER: Any = _app_key("video_manager")
+VIDEO_SESSIONS: Any = _app_key("video_sessions")
 AUDIO_MANAGER: Any = _app_key("audio_manager")
 ADB_ADAPTER: Any = _app_key("adb_adapter")
 PRIVILEGE_CLIENT: Any = _app_key("privilege_client")
 UPDATE_MANAGER: Any = _app_key("update_manager")
+DEVICE_REGISTRY: Any = _app_key("device_registry")
+EVENT_BUS: Any = _app_key("event_bus")
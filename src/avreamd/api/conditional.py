@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import hashlib
+
+from aiohttp import web
+
+
+def make_etag(*parts: object) -> str:
+    """Weak ETag built from cheap version counters instead of the response body."""
+    raw = "|".join(str(p) for p in parts).encode("utf-8")
+    return 'W/"' + hashlib.blake2s(raw, digest_size=8).hexdigest() + '"'
+
+
+def etag_matches(request: web.Request, etag: str) -> bool:
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    wanted = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        # Weak comparison (RFC 9110): W/ prefixes are ignored.
+        if candidate == "*" or candidate.removeprefix("W/") == wanted:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> web.Response:
+    return web.Response(status=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def with_etag(response: web.Response, etag: str) -> web.Response:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
@@ -1,22 +1,65 @@
 from __future__ import annotations
 
-import asyncio
-
 from aiohttp import web
 
-from avreamd.api.app_keys import ADB_ADAPTER
+from avreamd.api.app_keys import ADB_ADAPTER, DEVICE_REGISTRY, STATE_STORE
+from avreamd.api.conditional import etag_matches, make_etag, not_modified, with_etag
 from avreamd.api.errors import backend_error, dependency_error, validation_error
 from avreamd.api.schemas import success_envelope
-from avreamd.api.validation import read_json_object
+from avreamd.api.validation import get_bool, read_json_object
 from avreamd.constants import ADB_DEFAULT_PORT
 
 
+DEVICE_FIELDS = (
+    "id",
+    "state",
+    "transports",
+    "serials",
+    "transport",
+    "serial",
+    "wifi_candidate_ip",
+    "wifi_candidate_endpoint",
+)
+
+
+def _parse_fields(raw: str | None) -> list[str] | None:
+    if raw is None:
+        return None
+    fields = [f.strip() for f in raw.split(",") if f.strip()]
+    unknown = sorted(set(fields) - set(DEVICE_FIELDS))
+    if unknown:
+        raise validation_error("unknown device fields", {"unknown": unknown, "allowed": list(DEVICE_FIELDS)})
+    return fields
+
+
 async def handle_android_devices(request: web.Request) -> web.Response:
     request_id = request["request_id"]
+    query = dict(request.query)
+    probe = get_bool(query, "probe", True)
+    fields = _parse_fields(query.get("fields"))
     adb = request.app[ADB_ADAPTER]
     if not adb.available:
         raise dependency_error("adb is missing", {"tool": "adb", "package": "android-tools-adb"})
-    devices = await adb.list_devices()
+    registry = request.app[DEVICE_REGISTRY]
+    started_at = request.app[STATE_STORE].current()["started_at"]
+
+    def current_etag() -> str:
+        # The registry version moves on every device change (including probe
+        # results), so an unchanged version means an unchanged response.
+        return make_etag(started_at, "devices", probe, ",".join(fields or DEVICE_FIELDS), registry.version)
+
+    if not registry.tracking:
+        # One adb server query brings the version up to date; probes wait for a miss.
+        await registry.scan(probe=False)
+    if not (probe and registry.probe_pending()):
+        etag = current_etag()
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+    devices = await registry.devices(probe=probe, rescan=False)
+    etag = current_etag()
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
     groups: dict[str, dict[str, object]] = {}
     available_transports: set[str] = set()
@@ -26,13 +69,11 @@ async def handle_android_devices(request: web.Request) -> web.Response:
         state = str(d.get("state", "")).strip()
         if not serial:
             continue
-        transport = adb.transport_of(serial)
+        transport = str(d.get("transport") or adb.transport_of(serial))
         available_transports.add(transport)
 
-        identity = None
-        if state == "device":
-            identity = await adb.device_identity(serial=serial)
-        group_key = identity or f"adb:{serial}"
+        identity = d.get("identity") if state == "device" else None
+        group_key = str(identity) if identity else f"adb:{serial}"
 
         g = groups.get(group_key)
         if g is None:
@@ -58,15 +99,14 @@ async def handle_android_devices(request: web.Request) -> web.Response:
         if current_state != "device" and state == "device":
             g["state"] = "device"
 
-        # For USB devices, probe Wi-Fi IP candidate so Scan can show endpoint
-        # before adb tcpip/connect is fully set up.
-        if state == "device" and transport == "usb":
-            ip = await adb.detect_device_ip(serial=serial)
-            if ip:
-                g["wifi_candidate_ip"] = ip
-                g["wifi_candidate_endpoint"] = adb.normalize_endpoint(ip)
-                # Allow selecting Wi-Fi mode when candidate endpoint is known.
-                available_transports.add("wifi")
+        # USB devices carry a probed Wi-Fi IP candidate so Scan can show the
+        # endpoint before adb tcpip/connect is fully set up.
+        ip = d.get("wifi_candidate_ip")
+        if state == "device" and transport == "usb" and ip:
+            g["wifi_candidate_ip"] = ip
+            g["wifi_candidate_endpoint"] = adb.normalize_endpoint(str(ip))
+            # Allow selecting Wi-Fi mode when candidate endpoint is known.
+            available_transports.add("wifi")
 
     enriched: list[dict[str, object]] = []
     for g in groups.values():
@@ -116,20 +156,43 @@ async def handle_android_devices(request: web.Request) -> web.Response:
         recommended = enriched[0].get("serial")
         recommended_id = enriched[0].get("id")
 
-    return web.json_response(
-        success_envelope(
-            {
-                "devices": enriched,
-                "recommended": recommended,
-                "recommended_id": recommended_id,
-                "available_transports": sorted(available_transports),
-            },
-            request_id=request_id,
+    if fields is not None:
+        enriched = [{k: d.get(k) for k in fields} for d in enriched]
+
+    return with_etag(
+        web.json_response(
+            success_envelope(
+                {
+                    "devices": enriched,
+                    "recommended": recommended,
+                    "recommended_id": recommended_id,
+                    "available_transports": sorted(available_transports),
+                },
+                request_id=request_id,
+            ),
+            status=200,
         ),
-        status=200,
+        etag,
     )
 
 
+async def handle_android_endpoint_status(request: web.Request) -> web.Response:
+    request_id = request["request_id"]
+    endpoint = request.match_info.get("endpoint", "").strip()
+    if not endpoint:
+        raise validation_error("endpoint is required")
+
+    adb = request.app[ADB_ADAPTER]
+    if not adb.available:
+        raise dependency_error("adb is missing", {"tool": "adb", "package": "android-tools-adb"})
+    registry = request.app[DEVICE_REGISTRY]
+    if not registry.tracking:
+        await registry.scan(probe=False)
+    status = registry.endpoint_status(adb.normalize_endpoint(endpoint))
+    status["connected"] = status.get("match") == "serial" and status.get("state") == "device"
+    return web.json_response(success_envelope(status, request_id=request_id), status=200)
+
+
 async def handle_android_wifi_enable(request: web.Request) -> web.Response:
     request_id = request["request_id"]
     payload = await read_json_object(request)
@@ -169,7 +232,8 @@ async def handle_android_wifi_setup(request: web.Request) -> web.Response:
     if not adb.available:
         raise dependency_error("adb is missing", {"tool": "adb", "package": "android-tools-adb"})
 
-    result = await adb.wifi_setup(serial=serial, port=port)
+    registry = request.app[DEVICE_REGISTRY]
+    result = await adb.wifi_setup(serial=serial, port=port, wait_ready=registry.wait_for_state)
     if int(result.get("returncode", 1)) != 0:
         raise backend_error(
             "failed to setup adb over Wi-Fi",
@@ -209,13 +273,7 @@ async def handle_android_wifi_connect(request: web.Request) -> web.Response:
             {"endpoint": normalized, "result": result},
             retryable=True,
         )
-    wifi_ready = False
-    for _ in range(12):
-        devices = await adb.list_devices()
-        if any(d.get("serial") == normalized and d.get("state") == "device" for d in devices):
-            wifi_ready = True
-            break
-        await asyncio.sleep(0.5)
+    wifi_ready = await request.app[DEVICE_REGISTRY].wait_for_state(normalized, state="device", timeout_s=6.0)
     if not wifi_ready:
         raise backend_error(
             "Wi-Fi device did not reach ready state after connect",
@@ -247,6 +305,7 @@ async def handle_android_wifi_disconnect(request: web.Request) -> web.Response:
 
 def register_android_routes(app: web.Application) -> None:
     app.router.add_get("/android/devices", handle_android_devices)
+    app.router.add_get("/android/endpoints/{endpoint}", handle_android_endpoint_status)
     app.router.add_post("/android/wifi/enable", handle_android_wifi_enable)
     app.router.add_post("/android/wifi/setup", handle_android_wifi_setup)
     app.router.add_post("/android/wifi/connect", handle_android_wifi_connect)
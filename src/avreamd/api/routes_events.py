@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+
+from aiohttp import web
+
+from avreamd.api.app_keys import EVENT_BUS
+from avreamd.api.errors import validation_error
+
+
+SSE_KEEPALIVE_S = 15.0
+
+
+def _resume_position(request: web.Request) -> int | None:
+    # Browsers/EventSource send Last-Event-ID on reconnect; scripts can use ?since=.
+    raw = request.headers.get("Last-Event-ID") or request.query.get("since")
+    if raw is None or raw == "":
+        return None
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise validation_error("since/Last-Event-ID must be an integer") from exc
+    if value < 0:
+        raise validation_error("since/Last-Event-ID must be >= 0")
+    return value
+
+
+async def handle_events(request: web.Request) -> web.StreamResponse:
+    bus = request.app[EVENT_BUS]
+    since = _resume_position(request)
+
+    resp = web.StreamResponse(
+        status=200,
+        headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+    await resp.prepare(request)
+    subscription = bus.subscribe(since=since)
+    try:
+        await resp.write(f"retry: 1000\n: last_seq={bus.last_seq}\n\n".encode("utf-8"))
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=SSE_KEEPALIVE_S)
+            except asyncio.TimeoutError:
+                await resp.write(b": keepalive\n\n")
+                continue
+            if event is None:
+                break
+            await resp.write(event.to_sse())
+    except (ConnectionResetError, ConnectionError):
+        pass
+    finally:
+        subscription.close()
+    return resp
+
+
+def register_event_routes(app: web.Application) -> None:
+    app.router.add_get("/events", handle_events)
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+
 from aiohttp import web
 
-from avreamd.api.app_keys import PATHS, PRIVILEGE_CLIENT, STATE_STORE, UPDATE_MANAGER, VIDEO_MANAGER
+from avreamd.api.app_keys import EVENT_BUS, PATHS, PRIVILEGE_CLIENT, STATE_STORE, UPDATE_MANAGER, VIDEO_MANAGER
+from avreamd.api.conditional import etag_matches, make_etag, not_modified, with_etag
+from avreamd.api.errors import validation_error
+from avreamd.api.validation import get_int
 from avreamd.api.schemas import success_envelope
 from avreamd.constants import API_VERSION, APP_NAME, DAEMON_NAME
+from avreamd.core.state_store import SubsystemState, thaw
+
+
+STATUS_WAIT_DEFAULT_S = 10.0
+STATUS_WAIT_MAX_S = 60.0
 
 
 async def handle_status(request: web.Request) -> web.Response:
@@ -15,8 +26,23 @@ async def handle_status(request: web.Request) -> web.Response:
     privilege_client = request.app[PRIVILEGE_CLIENT]
     request_id = request["request_id"]
 
-    runtime = await state_store.snapshot()
+    runtime = state_store.current()
     video_runtime = await video_manager.runtime_status()
+    # State transitions bump the store version; reconnect and update progress
+    # go through the event bus. The exit code covers a process dying on its own.
+    # Session log housekeeping and scrcpy's fps reports move neither counter,
+    # so those (small, in-memory) parts go into the tag as they are.
+    etag = make_etag(
+        runtime["started_at"],
+        runtime["version"],
+        request.app[EVENT_BUS].last_seq,
+        video_manager.last_exit_code(),
+        video_runtime["session_logs"],
+        video_runtime["backend"],
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     update_runtime = await update_manager.runtime_status()
     data = {
         "service": {
@@ -28,10 +54,65 @@ async def handle_status(request: web.Request) -> web.Response:
         },
         "video_runtime": video_runtime,
         "update_runtime": update_runtime,
-        "runtime": runtime,
+        "runtime": thaw(runtime),
     }
+    return with_etag(web.json_response(success_envelope(data, request_id=request_id), status=200), etag)
+
+
+def _parse_wait_conditions(query: dict[str, str]) -> tuple[dict[str, str], int | None, float]:
+    states: dict[str, str] = {}
+    for subsystem in ("video", "audio"):
+        raw = query.get(subsystem)
+        if raw is None:
+            continue
+        value = raw.strip().upper()
+        if value not in {s.value for s in SubsystemState}:
+            raise validation_error(
+                f"{subsystem} must be one of: {','.join(s.value for s in SubsystemState)}",
+                {subsystem: raw},
+            )
+        states[subsystem] = value
+
+    since_version = get_int(query, "since_version", -1, minimum=0) if "since_version" in query else None
+    if not states and since_version is None:
+        raise validation_error("at least one of video, audio or since_version is required")
+
+    raw_timeout = query.get("timeout", STATUS_WAIT_DEFAULT_S)
+    try:
+        timeout_s = float(raw_timeout)
+    except (TypeError, ValueError) as exc:
+        raise validation_error("timeout must be a number of seconds") from exc
+    if not 0 <= timeout_s <= STATUS_WAIT_MAX_S:
+        raise validation_error(f"timeout must be between 0 and {STATUS_WAIT_MAX_S:g} seconds")
+    return states, since_version, timeout_s
+
+
+def _wait_matches(runtime: dict[str, Any], states: dict[str, str], since_version: int | None) -> bool:
+    if since_version is not None and runtime["version"] <= since_version:
+        return False
+    return all(runtime[subsystem]["state"] == state for subsystem, state in states.items())
+
+
+async def handle_status_wait(request: web.Request) -> web.Response:
+    state_store = request.app[STATE_STORE]
+    request_id = request["request_id"]
+    states, since_version, timeout_s = _parse_wait_conditions(dict(request.query))
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_s
+    runtime = thaw(state_store.current())
+    matched = _wait_matches(runtime, states, since_version)
+    while not matched and not state_store.closed:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        runtime = await state_store.changed(runtime["version"], timeout_s=remaining)
+        matched = _wait_matches(runtime, states, since_version)
+
+    data = {"matched": matched, "runtime": runtime}
     return web.json_response(success_envelope(data, request_id=request_id), status=200)
 
 
 def register_status_routes(app: web.Application) -> None:
     app.router.add_get("/status", handle_status)
+    app.router.add_get("/status/wait", handle_status_wait)
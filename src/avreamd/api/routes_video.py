@@ -1,20 +1,22 @@
 from __future__ import annotations
 
+from typing import Any
+
 from aiohttp import web
 
 from avreamd.api.errors import validation_error
-from avreamd.api.app_keys import VIDEO_MANAGER
+from avreamd.api.app_keys import VIDEO_MANAGER, VIDEO_SESSIONS
 from avreamd.api.schemas import success_envelope
-from avreamd.api.validation import get_bool, read_json_object
+from avreamd.api.validation import get_bool, get_int, read_json_object
+from avreamd.core.process_supervisor import OUTPUT_TAIL_LINES
 
 
-async def handle_video_start(request: web.Request) -> web.Response:
-    request_id = request["request_id"]
-    payload = await read_json_object(request)
-    serial = payload.get("serial") if isinstance(payload, dict) else None
-    camera_facing = payload.get("camera_facing") if isinstance(payload, dict) else None
-    camera_rotation = payload.get("camera_rotation") if isinstance(payload, dict) else None
-    preview_window = payload.get("preview_window") if isinstance(payload, dict) else None
+def _parse_start_options(payload: dict[str, Any]) -> dict[str, Any]:
+    camera_facing = payload.get("camera_facing")
+    camera_rotation = payload.get("camera_rotation")
+    preview_window = payload.get("preview_window")
+    on_demand = get_bool(payload, "on_demand", default=False)
+    idle_grace_s = payload.get("idle_grace_s")
     if camera_facing is not None:
         if not isinstance(camera_facing, str) or camera_facing not in {"front", "back"}:
             raise validation_error("camera_facing must be 'front' or 'back'")
@@ -25,12 +27,33 @@ async def handle_video_start(request: web.Request) -> web.Response:
             raise validation_error("camera_rotation must be one of: 0, 90, 180, 270")
         if camera_rotation not in {0, 90, 180, 270}:
             raise validation_error("camera_rotation must be one of: 0, 90, 180, 270")
-    result = await request.app[VIDEO_MANAGER].start(
-        serial=serial,
-        camera_facing=camera_facing,
-        camera_rotation=camera_rotation,
-        preview_window=preview_window,
-    )
+    if idle_grace_s is not None:
+        if isinstance(idle_grace_s, bool) or not isinstance(idle_grace_s, (int, float)):
+            raise validation_error("idle_grace_s must be a number")
+        if not 0 <= idle_grace_s <= 3600:
+            raise validation_error("idle_grace_s must be between 0 and 3600")
+    return {
+        "camera_facing": camera_facing,
+        "camera_rotation": camera_rotation,
+        "preview_window": preview_window,
+        "on_demand": on_demand,
+        "idle_grace_s": float(idle_grace_s) if idle_grace_s is not None else None,
+    }
+
+
+def _require_serial(payload: dict[str, Any]) -> str:
+    serial = payload.get("serial")
+    if not isinstance(serial, str) or not serial.strip():
+        raise validation_error("serial is required")
+    return serial.strip()
+
+
+async def handle_video_start(request: web.Request) -> web.Response:
+    request_id = request["request_id"]
+    payload = await read_json_object(request)
+    serial = payload.get("serial")
+    options = _parse_start_options(payload)
+    result = await request.app[VIDEO_MANAGER].start(serial=serial, **options)
     return web.json_response(success_envelope(result, request_id=request_id), status=200)
 
 
@@ -48,7 +71,41 @@ async def handle_video_reset(request: web.Request) -> web.Response:
     return web.json_response(success_envelope(result, request_id=request_id), status=200)
 
 
+async def handle_video_log(request: web.Request) -> web.Response:
+    request_id = request["request_id"]
+    tail = get_int(dict(request.query), "tail", default=50, minimum=1, maximum=OUTPUT_TAIL_LINES)
+    result = request.app[VIDEO_MANAGER].output_log(tail)
+    return web.json_response(success_envelope(result, request_id=request_id), status=200)
+
+
+async def handle_video_sessions(request: web.Request) -> web.Response:
+    request_id = request["request_id"]
+    registry = request.app[VIDEO_SESSIONS]
+    data = {"sessions": await registry.list_sessions(), "max_sessions": registry.max_sessions}
+    return web.json_response(success_envelope(data, request_id=request_id), status=200)
+
+
+async def handle_video_session_start(request: web.Request) -> web.Response:
+    request_id = request["request_id"]
+    payload = await read_json_object(request)
+    serial = _require_serial(payload)
+    options = _parse_start_options(payload)
+    result = await request.app[VIDEO_SESSIONS].start(serial, **options)
+    return web.json_response(success_envelope(result, request_id=request_id), status=200)
+
+
+async def handle_video_session_stop(request: web.Request) -> web.Response:
+    request_id = request["request_id"]
+    payload = await read_json_object(request)
+    result = await request.app[VIDEO_SESSIONS].stop(_require_serial(payload))
+    return web.json_response(success_envelope(result, request_id=request_id), status=200)
+
+
 def register_video_routes(app: web.Application) -> None:
     app.router.add_post("/video/start", handle_video_start)
     app.router.add_post("/video/stop", handle_video_stop)
     app.router.add_post("/video/reset", handle_video_reset)
+    app.router.add_get("/video/log", handle_video_log)
+    app.router.add_get("/video/sessions", handle_video_sessions)
+    app.router.add_post("/video/sessions/start", handle_video_session_start)
+    app.router.add_post("/video/sessions/stop", handle_video_session_stop)
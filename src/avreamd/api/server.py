@@ -5,15 +5,19 @@ from aiohttp import web
 from avreamd.api.app_keys import (
     ADB_ADAPTER,
     AUDIO_MANAGER,
+    DEVICE_REGISTRY,
+    EVENT_BUS,
     PATHS,
     PRIVILEGE_CLIENT,
     STATE_STORE,
     UPDATE_MANAGER,
     VIDEO_MANAGER,
+    VIDEO_SESSIONS,
 )
 from avreamd.api.middleware import request_context_middleware
 from avreamd.api.routes_audio import register_audio_routes
 from avreamd.api.routes_android import register_android_routes
+from avreamd.api.routes_events import register_event_routes
 from avreamd.api.routes_status import register_status_routes
 from avreamd.api.routes_update import register_update_routes
 from avreamd.api.routes_video import register_video_routes
@@ -24,23 +28,30 @@ def create_api_app(
     state_store,
     paths,
     video_manager,
+    video_sessions,
     audio_manager,
     update_manager,
     adb_adapter,
+    device_registry,
     privilege_client,
+    event_bus,
 ) -> web.Application:
     app = web.Application(middlewares=[request_context_middleware])
     app[STATE_STORE] = state_store
     app[PATHS] = paths
     app[VIDEO_MANAGER] = video_manager
+    app[VIDEO_SESSIONS] = video_sessions
     app[AUDIO_MANAGER] = audio_manager
     app[UPDATE_MANAGER] = update_manager
     app[ADB_ADAPTER] = adb_adapter
+    app[DEVICE_REGISTRY] = device_registry
     app[PRIVILEGE_CLIENT] = privilege_client
+    app[EVENT_BUS] = event_bus
 
     register_status_routes(app)
     register_video_routes(app)
     register_audio_routes(app)
     register_update_routes(app)
     register_android_routes(app)
+    register_event_routes(app)
     return app
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import os
 
 from aiohttp import web
 
 from avreamd.api.server import create_api_app
 from avreamd.bootstrap import build_daemon_deps
 from avreamd.config import ensure_directories, remove_stale_socket
+from avreamd.constants import HANDOVER_FILENAME
 
 
 logger = logging.getLogger(__name__)
@@ -17,6 +20,7 @@ class AvreamDaemon:
     def __init__(self, paths) -> None:
         self.paths = paths
         deps = build_daemon_deps(paths)
+        self.event_bus = deps.event_bus
         self.state_store = deps.state_store
         self.supervisor = deps.supervisor
         self.privilege_client = deps.privilege_client
@@ -24,26 +28,38 @@ class AvreamDaemon:
         self.pactl = deps.pactl
         self.v4l2 = deps.v4l2
         self.adb = deps.adb
+        self.device_registry = deps.device_registry
         self.audio_manager = deps.audio_manager
         self.android_backend = deps.android_backend
         self.video_manager = deps.video_manager
+        self.video_sessions = deps.video_sessions
         self.update_manager = deps.update_manager
         self._runner: web.AppRunner | None = None
         self._site: web.UnixSite | None = None
         self._shutdown_event = asyncio.Event()
+        self._keep_sessions = False
 
     async def start(self) -> None:
         ensure_directories(self.paths)
         remove_stale_socket(self.paths)
 
+        # Backends a previous daemon handed over keep streaming; pick them up
+        # before the API can start or stop anything.
+        if self.supervisor.adopt():
+            adopted = await self.video_sessions.adopt()
+            logger.info("avreamd adopted running video sessions: %s", adopted)
+
         app = create_api_app(
             state_store=self.state_store,
             paths=self.paths,
             video_manager=self.video_manager,
+            video_sessions=self.video_sessions,
             audio_manager=self.audio_manager,
             update_manager=self.update_manager,
             adb_adapter=self.adb,
+            device_registry=self.device_registry,
             privilege_client=self.privilege_client,
+            event_bus=self.event_bus,
         )
         self._runner = web.AppRunner(app, access_log=None)
         assert self._runner is not None
@@ -52,12 +68,24 @@ class AvreamDaemon:
         assert self._site is not None
         await self._site.start()
         await self.update_manager.start_background()
+        await self.device_registry.start_background()
         logger.info("avreamd listening on unix socket: %s", self.paths.socket_path)
 
     async def stop(self) -> None:
         self._shutdown_event.set()
         await self.update_manager.stop_background()
-        await self.supervisor.stop_all()
+        await self.device_registry.stop_background()
+        await self.video_sessions.stop_background()
+        if self._keep_sessions:
+            detached = await self.supervisor.detach_all()
+            if detached:
+                logger.info("avreamd left running for the next daemon: %s", detached)
+        else:
+            await self.supervisor.stop_all()
+        # Ends open /events streams and /status/wait long polls so the HTTP
+        # runner can shut down promptly.
+        self.event_bus.close()
+        self.state_store.close()
         if self._runner is not None:
             await self._runner.cleanup()
         remove_stale_socket(self.paths)
@@ -66,5 +94,20 @@ class AvreamDaemon:
     async def wait_until_shutdown(self) -> None:
         await self._shutdown_event.wait()
 
-    def request_shutdown(self) -> None:
+    def request_shutdown(self, *, keep_sessions: bool = False) -> None:
+        """keep_sessions leaves running backends to be adopted by the next daemon instead of stopping them."""
+        self._keep_sessions = keep_sessions
         self._shutdown_event.set()
+
+    def consume_handover(self) -> bool:
+        """True once if the restart path asked this daemon to hand its sessions over."""
+        marker = self.paths.runtime_dir / HANDOVER_FILENAME
+        try:
+            owner = marker.read_text(encoding="utf-8").strip()
+        except OSError:
+            return False
+        with contextlib.suppress(OSError):
+            marker.unlink()
+        # A marker left by an earlier daemon (e.g. one that crashed before its
+        # restart) must not keep this daemon's sessions alive on a plain stop.
+        return owner == str(os.getpid())
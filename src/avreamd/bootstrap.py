@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from avreamd.backends.android_video import AndroidVideoBackend
+from avreamd.core.event_bus import EventBus
 from avreamd.core.process_supervisor import ProcessSupervisor
 from avreamd.core.state_store import DaemonStateStore
 from avreamd.integrations.adb import AdbAdapter
@@ -11,34 +12,49 @@ from avreamd.integrations.pipewire import PipeWireIntegration
 from avreamd.integrations.scrcpy import ScrcpyAdapter
 from avreamd.integrations.v4l2loopback import V4L2LoopbackIntegration
 from avreamd.managers.audio_manager import AudioManager
+from avreamd.managers.device_cache import DeviceInfoCache
+from avreamd.managers.device_registry import AndroidDeviceRegistry
 from avreamd.managers.privilege_client import PrivilegeClient
 from avreamd.managers.update_manager import UpdateManager
+from avreamd.managers.video import LoopbackDevicePool
 from avreamd.managers.video_manager import VideoManager
+from avreamd.managers.video_sessions import VideoSessionRegistry
 
 
 @dataclass
 class DaemonDeps:
+    event_bus: EventBus
     state_store: DaemonStateStore
     supervisor: ProcessSupervisor
     privilege_client: PrivilegeClient
     pipewire: PipeWireIntegration
     pactl: PactlIntegration
+    loopback_pool: LoopbackDevicePool
     v4l2: V4L2LoopbackIntegration
     adb: AdbAdapter
+    device_registry: AndroidDeviceRegistry
     audio_manager: AudioManager
     android_backend: AndroidVideoBackend
     video_manager: VideoManager
+    video_sessions: VideoSessionRegistry
     update_manager: UpdateManager
 
 
 def build_daemon_deps(paths) -> DaemonDeps:
-    state_store = DaemonStateStore()
-    supervisor = ProcessSupervisor(log_dir=paths.log_dir)
+    event_bus = EventBus()
+    state_store = DaemonStateStore(event_bus=event_bus)
+    supervisor = ProcessSupervisor(log_dir=paths.log_dir, manifest_dir=paths.runtime_dir / "processes")
     privilege_client = PrivilegeClient()
     pipewire = PipeWireIntegration()
     pactl = PactlIntegration()
-    v4l2 = V4L2LoopbackIntegration(video_nr=10)
+    loopback_pool = LoopbackDevicePool(base_nr=10)
+    v4l2 = loopback_pool.device(0)
     adb = AdbAdapter()
+    device_registry = AndroidDeviceRegistry(
+        adb=adb,
+        cache=DeviceInfoCache(cache_file=paths.cache_dir / "devices.json"),
+        event_bus=event_bus,
+    )
     audio_manager = AudioManager(
         state_store=state_store,
         pipewire=pipewire,
@@ -54,23 +70,40 @@ def build_daemon_deps(paths) -> DaemonDeps:
         privilege_client=privilege_client,
         v4l2=v4l2,
         audio_manager=audio_manager,
+        event_bus=event_bus,
+        pool=loopback_pool,
+    )
+    video_sessions = VideoSessionRegistry(
+        primary=video_manager,
+        pool=loopback_pool,
+        state_store=state_store,
+        backend=android_backend,
+        supervisor=supervisor,
+        privilege_client=privilege_client,
+        device_registry=device_registry,
+        event_bus=event_bus,
     )
     update_manager = UpdateManager(
         paths=paths,
         state_store=state_store,
         video_manager=video_manager,
         audio_manager=audio_manager,
+        event_bus=event_bus,
     )
     return DaemonDeps(
+        event_bus=event_bus,
         state_store=state_store,
         supervisor=supervisor,
         privilege_client=privilege_client,
         pipewire=pipewire,
         pactl=pactl,
+        loopback_pool=loopback_pool,
         v4l2=v4l2,
         adb=adb,
+        device_registry=device_registry,
         audio_manager=audio_manager,
         android_backend=android_backend,
         video_manager=video_manager,
+        video_sessions=video_sessions,
         update_manager=update_manager,
     )
@@ -6,6 +6,7 @@ import json
 import os
 import sys
 from typing import Any
+from urllib.parse import urlencode
 
 from aiohttp import ClientSession, ClientTimeout, UnixConnector
 
@@ -17,15 +18,24 @@ class CliApiClient:
     def __init__(self, socket_path: str, timeout_s: float = 20.0) -> None:
         self.socket_path = socket_path
         self.timeout_s = timeout_s
+        # path -> (etag, body) of the last 200 GET; replayed on 304.
+        self._etag_cache: dict[str, tuple[str, dict[str, Any]]] = {}
 
     async def request(self, method: str, path: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
         connector = UnixConnector(path=self.socket_path)
         timeout = ClientTimeout(total=self.timeout_s, connect=5, sock_connect=5, sock_read=self.timeout_s)
+        cached = self._etag_cache.get(path) if method == "GET" else None
+        headers = {"If-None-Match": cached[0]} if cached else None
         try:
             async with ClientSession(connector=connector, timeout=timeout) as session:
-                async with session.request(method, f"http://localhost{path}", json=payload) as resp:
+                async with session.request(method, f"http://localhost{path}", json=payload, headers=headers) as resp:
+                    if resp.status == 304 and cached:
+                        return {"status": 200, "body": cached[1], "not_modified": True}
                     try:
                         body = await resp.json(content_type=None)
+                        etag = resp.headers.get("ETag")
+                        if method == "GET" and resp.status == 200 and etag and isinstance(body, dict):
+                            self._etag_cache[path] = (etag, body)
                     except Exception:
                         body = {
                             "ok": False,
@@ -115,7 +125,40 @@ def _pick_serial_for_mode(devices_data: dict[str, Any], mode: str) -> str | None
     return None
 
 
+def _wait_condition(value: str) -> tuple[str, str]:
+    key, sep, expected = value.partition("=")
+    key = key.strip().lower()
+    if not sep or key not in {"video", "audio", "since_version"} or not expected.strip():
+        raise argparse.ArgumentTypeError("expected video=STATE, audio=STATE or since_version=N")
+    return key, expected.strip()
+
+
+def _wait_for_status(args: argparse.Namespace, api: CliApiClient) -> int:
+    query = dict(args.wait)
+    query["timeout"] = f"{float(args.wait_timeout):g}"
+    # The daemon holds the request open for up to wait_timeout seconds.
+    api.timeout_s = max(api.timeout_s, float(args.wait_timeout) + 5.0)
+    data, _ = _request_data(api, method="GET", path=f"/status/wait?{urlencode(query)}")
+    if data is None:
+        return 1
+    if not data.get("matched"):
+        runtime = data.get("runtime", {})
+        video = runtime.get("video", {}) if isinstance(runtime, dict) else {}
+        audio = runtime.get("audio", {}) if isinstance(runtime, dict) else {}
+        print(
+            f"Error: condition not met within {float(args.wait_timeout):g}s "
+            f"(camera: {video.get('state', 'unknown')}, microphone: {audio.get('state', 'unknown')}).",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
 def cmd_status(args: argparse.Namespace, api: CliApiClient) -> int:
+    if getattr(args, "wait", None):
+        rc = _wait_for_status(args, api)
+        if rc != 0:
+            return rc
     data, result = _request_data(api, method="GET", path="/status")
     if data is None:
         return 1
@@ -244,12 +287,20 @@ def cmd_camera_start(args: argparse.Namespace, api: CliApiClient) -> int:
     }
     if args.serial:
         payload["serial"] = args.serial
+    if getattr(args, "on_demand", False):
+        payload["on_demand"] = True
+        if args.idle_grace is not None:
+            payload["idle_grace_s"] = float(args.idle_grace)
     data, result = _request_data(api, method="POST", path="/video/start", payload=payload)
     if data is None:
         return 1
     if args.json:
         _print_json(result)
         return 0
+    if payload.get("on_demand"):
+        grace = (data.get("on_demand") or {}).get("idle_grace_s") if isinstance(data, dict) else None
+        print(f"Camera on demand: streams while an app has it open (idle stop after {grace}s).")
+        return 0
     source = data.get("source", {}) if isinstance(data, dict) else {}
     serial = source.get("serial") if isinstance(source, dict) else None
     print(f"Camera started{f' on {serial}' if serial else ''}.")
@@ -472,7 +523,15 @@ def build_parser() -> argparse.ArgumentParser:
 
     sub = parser.add_subparsers(dest="command", required=True)
 
-    sub.add_parser("status", help="Show daemon and runtime status")
+    status = sub.add_parser("status", help="Show daemon and runtime status")
+    status.add_argument(
+        "--wait",
+        action="append",
+        type=_wait_condition,
+        metavar="COND",
+        help="Block until video=STATE, audio=STATE or since_version=N holds (repeatable)",
+    )
+    status.add_argument("--wait-timeout", type=float, default=10.0, help="Seconds to wait for --wait (max 60)")
     sub.add_parser("devices", help="List detected Android devices")
 
     wifi = sub.add_parser("wifi", help="Manage ADB over Wi-Fi")
@@ -492,6 +551,18 @@ def build_parser() -> argparse.ArgumentParser:
     camera_start.add_argument("--lens", choices=["front", "back"], default="front")
     camera_start.add_argument("--rotation", choices=["0", "90", "180", "270"], default="0")
     camera_start.add_argument("--preview-window", action="store_true", help="Show scrcpy preview window")
+    camera_start.add_argument(
+        "--on-demand",
+        action="store_true",
+        help="Only stream while an app has the virtual camera open",
+    )
+    camera_start.add_argument(
+        "--idle-grace",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="With --on-demand: stop this long after the last app closed the camera",
+    )
     camera_sub.add_parser("stop", help="Stop camera")
     camera_reset = camera_sub.add_parser("reset", help="Reset virtual camera")
     camera_reset.add_argument("--force", action="store_true", help="Force reset when possible")
@@ -5,6 +5,7 @@ APP_NAME = "avream"
 DAEMON_NAME = "avreamd"
 API_VERSION = "v1"
 SOCKET_FILENAME = "daemon.sock"
+HANDOVER_FILENAME = "handover"
 DEFAULT_LOG_LEVEL = "INFO"
 
 # Network defaults
@@ -14,7 +15,16 @@ ADB_DEFAULT_PORT: int = 5555
 DEFAULT_RECONNECT_BACKOFF_MS: int = 1500
 DEFAULT_RECONNECT_MAX_ATTEMPTS: int = 3
 
+# On-demand video: stop the backend this long after the last consumer closed the device
+DEFAULT_ON_DEMAND_IDLE_GRACE_S: float = 10.0
+
+# Multi-camera: loopback nodes video_nr, video_nr + 1, ... (the helper accepts at most 8)
+MAX_VIDEO_SESSIONS: int = 4
+
 # Logging / storage limits
+SESSION_LOG_MAX_FILES: int = 50
+SESSION_LOG_MAX_BYTES: int = 64 * 1024 * 1024
+SESSION_LOG_MAX_AGE_S: float = 14 * 24 * 3600.0
 UPDATE_LOG_MAXLEN: int = 300
 INSTALL_STDOUT_TAIL: int = 1000    # tail kept in success result
 INSTALL_STDERR_TAIL: int = 3000    # tail kept in failure detail
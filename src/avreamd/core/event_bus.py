@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+
+@dataclass(frozen=True)
+class DaemonEvent:
+    seq: int
+    type: str
+    data: dict[str, Any]
+    ts: str
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"seq": self.seq, "type": self.type, "ts": self.ts, "data": self.data}
+
+    def to_sse(self) -> bytes:
+        payload = json.dumps(self.as_dict(), separators=(",", ":"), default=str)
+        return f"id: {self.seq}\nevent: {self.type}\ndata: {payload}\n\n".encode("utf-8")
+
+
+class EventSubscription:
+    def __init__(self, bus: "EventBus", queue_size: int) -> None:
+        self._bus = bus
+        self._queue: asyncio.Queue[DaemonEvent | None] = asyncio.Queue(maxsize=max(1, int(queue_size)))
+        self.closed = False
+
+    async def get(self) -> DaemonEvent | None:
+        """Next event, or None once the subscription was closed."""
+        if self.closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._bus._unsubscribe(self)
+        try:
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # Reader is behind anyway; make room for the end-of-stream marker.
+            self._queue.get_nowait()
+            self._queue.put_nowait(None)
+
+    def _offer(self, event: DaemonEvent) -> None:
+        if self.closed:
+            return
+        if self._queue.qsize() >= self._queue.maxsize - 1:
+            # Slow consumer: cut it off instead of buffering without bound. The
+            # client reconnects with Last-Event-ID and replays from history.
+            self.close()
+            return
+        self._queue.put_nowait(event)
+
+
+class EventBus:
+    """Fan-out of daemon events with a monotonic sequence and replay history."""
+
+    def __init__(self, *, history: int = 512, queue_size: int = 256) -> None:
+        self._seq = 0
+        self._history: deque[DaemonEvent] = deque(maxlen=max(1, int(history)))
+        self._queue_size = queue_size
+        self._subscribers: set[EventSubscription] = set()
+        self._closed = False
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def publish(self, event_type: str, data: dict[str, Any] | None = None) -> DaemonEvent:
+        self._seq += 1
+        event = DaemonEvent(
+            seq=self._seq,
+            type=event_type,
+            data=dict(data or {}),
+            ts=datetime.now(timezone.utc).isoformat(),
+        )
+        self._history.append(event)
+        for sub in list(self._subscribers):
+            sub._offer(event)
+        return event
+
+    def subscribe(self, *, since: int | None = None) -> EventSubscription:
+        # Room for a full history replay on top of the live backlog.
+        sub = EventSubscription(self, self._queue_size + len(self._history))
+        if since is not None:
+            oldest = self._history[0].seq if self._history else self._seq + 1
+            if since > self._seq or since < oldest - 1:
+                # Unknown position (daemon restarted or history overflowed):
+                # the client must refetch full state.
+                sub._offer(self._make_reset(since))
+            else:
+                for event in self._history:
+                    if event.seq > since:
+                        sub._offer(event)
+        self._subscribers.add(sub)
+        if self._closed:
+            sub.close()
+        return sub
+
+    def close(self) -> None:
+        self._closed = True
+        for sub in list(self._subscribers):
+            sub.close()
+
+    def _unsubscribe(self, sub: EventSubscription) -> None:
+        self._subscribers.discard(sub)
+
+    def _make_reset(self, since: int) -> DaemonEvent:
+        return DaemonEvent(
+            seq=self._seq,
+            type="stream.reset",
+            data={"requested_since": since, "last_seq": self._seq},
+            ts=datetime.now(timezone.utc).isoformat(),
+        )
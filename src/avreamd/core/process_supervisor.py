@@ -1,12 +1,230 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import contextlib
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import json
+import logging
 from pathlib import Path
 import os
 import signal
-from typing import Sequence
+import subprocess
+from typing import Any, Callable, Sequence
+
+from avreamd.core.session_logs import SessionLogRetention, SessionLogStore
+from avreamd.integrations.inotify import IN_MODIFY, InotifyWatch
+
+
+logger = logging.getLogger(__name__)
+
+# Ring of recent output lines kept per process.
+OUTPUT_TAIL_LINES = 500
+# Longer lines are dropped rather than buffered.
+OUTPUT_MAX_LINE = 64 * 1024
+# Bytes of an adopted process's log replayed into its output tail.
+ADOPT_LOG_REPLAY = 16 * 1024
+# Fallback when the session log cannot be watched with inotify.
+LOG_POLL_INTERVAL_S = 0.25
+# stop_all budget shared by every process group, SIGTERM grace plus SIGKILL.
+STOP_ALL_TIMEOUT_S = 5.0
+# Group-exit polling where pidfd_open is unavailable.
+GROUP_POLL_INTERVAL_S = 0.02
+# Reported for an adopted process that exited on its own: it is not our
+# child, so its real status went to whoever reaped it.
+UNKNOWN_EXIT_CODE = 255
+
+
+def _proc_stat(pid: int) -> tuple[str, int, int] | None:
+    """(state, pgid, starttime) from /proc/<pid>/stat; None once the pid is gone."""
+    try:
+        data = Path(f"/proc/{pid}/stat").read_bytes()
+    except OSError:
+        return None
+    fields = data[data.rfind(b")") + 2 :].split()
+    try:
+        return fields[0].decode(), int(fields[2]), int(fields[19])
+    except (IndexError, ValueError):
+        return None
+
+
+def _proc_cmdline(pid: int) -> list[str]:
+    try:
+        raw = Path(f"/proc/{pid}/cmdline").read_bytes()
+    except OSError:
+        return []
+    return [arg.decode("utf-8", errors="replace") for arg in raw.split(b"\0")[:-1]]
+
+
+def _group_members(pgid: int) -> list[int]:
+    """Live (non-zombie) processes of this user in process group pgid."""
+    uid = os.getuid()
+    members: list[int] = []
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return members
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        pid = int(entry)
+        stat = _proc_stat(pid)
+        if stat is None or stat[1] != pgid or stat[0] == "Z":
+            continue
+        try:
+            if os.stat(f"/proc/{pid}").st_uid != uid:  # pgid reused by a foreign process
+                continue
+        except OSError:
+            continue
+        members.append(pid)
+    return members
+
+
+async def _wait_pids_exit(pids: list[int], timeout: float) -> None:
+    """Returns once all pids have exited or timeout passed, woken by one pidfd per pid."""
+    loop = asyncio.get_running_loop()
+    pending: set[int] = set()
+    opened: list[int] = []
+    done = asyncio.Event()
+
+    def _on_exit(fd: int) -> None:
+        loop.remove_reader(fd)
+        pending.discard(fd)
+        if not pending:
+            done.set()
+
+    try:
+        for pid in pids:
+            try:
+                fd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                continue
+            except (AttributeError, OSError):  # no pidfd_open (Linux < 5.3): caller rescans
+                await asyncio.sleep(min(timeout, GROUP_POLL_INTERVAL_S))
+                return
+            opened.append(fd)
+            pending.add(fd)
+            loop.add_reader(fd, _on_exit, fd)
+        if pending:
+            try:
+                await asyncio.wait_for(done.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        for fd in opened:
+            if fd in pending:
+                loop.remove_reader(fd)
+            os.close(fd)
+
+
+def _cmdline_matches(cmdline: list[str], command: list[str]) -> bool:
+    """argv as launched, tolerating the interpreter the kernel prepends for a shebang script."""
+    if not cmdline or not command:
+        return False
+    if cmdline == command:
+        return True
+    tail = command[1:]
+    if len(cmdline) <= len(tail) or (tail and cmdline[-len(tail) :] != tail):
+        return False
+    program = os.path.basename(command[0])
+    return any(os.path.basename(arg) == program for arg in cmdline[: len(cmdline) - len(tail)])
+
+
+class SupervisedProcess:
+    """Exit tracking for a backend process, spawned here or adopted from a previous daemon.
+
+    Exit is noticed through a pidfd registered with the event loop (a /proc
+    poll where pidfd_open is unavailable). Our own children are reaped for
+    their status; an adopted process is somebody else's child, so it reports
+    the signal we sent it, or UNKNOWN_EXIT_CODE if it exited on its own.
+    """
+
+    POLL_INTERVAL_S = 0.25
+
+    def __init__(self, pid: int, start_time: int, *, popen: subprocess.Popen | None = None) -> None:
+        self.pid = pid
+        self.start_time = start_time
+        self.returncode: int | None = None
+        # Loop time the exit was noticed, and how: "pidfd" or "poll".
+        self.exited_at: float | None = None
+        self.watch = "pidfd"
+        self._popen = popen
+        self._signalled: int | None = None
+        self._exited = asyncio.Event()
+        self._exit_callbacks: list[Callable[[], None]] = []
+        self._pidfd = -1
+        self._poll_task: asyncio.Task | None = None
+        self._watch()
+
+    @property
+    def adopted(self) -> bool:
+        return self._popen is None
+
+    def _watch(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            self._pidfd = os.pidfd_open(self.pid)
+        except ProcessLookupError:
+            self._set_exited()
+            return
+        except (AttributeError, OSError):  # no pidfd_open (Linux < 5.3): poll instead
+            self.watch = "poll"
+            self._poll_task = loop.create_task(self._poll())
+            return
+        loop.add_reader(self._pidfd, self._on_pidfd_readable)
+
+    def _alive(self) -> bool:
+        if self._popen is not None:
+            return self._popen.poll() is None
+        stat = _proc_stat(self.pid)
+        return stat is not None and stat[0] != "Z" and stat[2] == self.start_time
+
+    async def _poll(self) -> None:
+        while self._alive():
+            await asyncio.sleep(self.POLL_INTERVAL_S)
+        self._poll_task = None
+        self._set_exited()
+
+    def _on_pidfd_readable(self) -> None:
+        self._release()
+        self._set_exited()
+
+    def _release(self) -> None:
+        if self._pidfd >= 0:
+            asyncio.get_running_loop().remove_reader(self._pidfd)
+            os.close(self._pidfd)
+            self._pidfd = -1
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+
+    def _set_exited(self) -> None:
+        if self._popen is not None:
+            rc = self._popen.poll()
+            self.returncode = UNKNOWN_EXIT_CODE if rc is None else rc
+        else:
+            self.returncode = -self._signalled if self._signalled is not None else UNKNOWN_EXIT_CODE
+        self.exited_at = asyncio.get_running_loop().time()
+        self._exited.set()
+        for callback in self._exit_callbacks:
+            callback()
+
+    def add_exit_callback(self, callback: Callable[[], None]) -> None:
+        self._exit_callbacks.append(callback)
+
+    def note_signal(self, sig: int) -> None:
+        self._signalled = int(sig)
+
+    def detach(self) -> None:
+        """Stops watching without touching the process; it keeps running on its own."""
+        self._release()
+        self._exit_callbacks.clear()
+
+    async def wait(self) -> int:
+        await self._exited.wait()
+        assert self.returncode is not None
+        return self.returncode
 
 
 @dataclass
@@ -14,14 +232,79 @@ class ManagedProcess:
     name: str
     command: list[str]
     env_overrides: dict[str, str]
-    process: asyncio.subprocess.Process
+    process: SupervisedProcess
+    log_path: Path
+    # Caller context persisted with the manifest (e.g. serial and sink of a camera session).
+    meta: dict[str, Any] = field(default_factory=dict)
+    started_at: str = ""
+    # Recent output lines (stdout+stderr); the full stream goes to the session log.
+    output: deque[str] = field(default_factory=lambda: deque(maxlen=OUTPUT_TAIL_LINES))
+    output_lines: int = 0
+    output_closed: bool = False
+    _output_changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _pump: asyncio.Task | None = field(default=None, repr=False)
+    _listeners: list[Callable[[str], None]] = field(default_factory=list, repr=False)
+
+    @property
+    def pgid(self) -> int:
+        # Started with start_new_session=True, so the leader's pid is the group id.
+        return self.process.pid
+
+    @property
+    def adopted(self) -> bool:
+        return self.process.adopted
+
+    def add_line_listener(self, listener: Callable[[str], None], *, replay: bool = True) -> None:
+        """Calls listener for every output line from now on (and, with replay, for those in the ring)."""
+        if replay:
+            for line in list(self.output):
+                listener(line)
+        self._listeners.append(listener)
+
+    def output_tail(self, count: int) -> list[str]:
+        lines = list(self.output)
+        return lines[-count:] if count > 0 else []
+
+    def _append_output(self, line: str) -> None:
+        self.output.append(line)
+        self.output_lines += 1
+        for listener in self._listeners:
+            try:
+                listener(line)
+            except Exception:  # a broken listener must not stop the pump
+                logger.exception("output listener failed for %s", self.name)
+        self._notify()
+
+    def _close_output(self) -> None:
+        self.output_closed = True
+        self._notify()
+
+    def _notify(self) -> None:
+        event, self._output_changed = self._output_changed, asyncio.Event()
+        event.set()
 
 
 class ProcessSupervisor:
-    def __init__(self, log_dir: Path) -> None:
+    """Runs backend processes in their own process groups.
+
+    With a manifest_dir, every running process is recorded there (pid, start
+    time, argv, caller meta) so a restarted daemon can adopt() what the
+    previous one left running via detach_all(). Processes write straight to
+    their session log instead of a pipe to the daemon for the same reason.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        manifest_dir: Path | None = None,
+        log_retention: SessionLogRetention | None = None,
+    ) -> None:
         self._log_dir = log_dir
+        self._manifest_dir = manifest_dir
+        self._logs = SessionLogStore(log_dir, log_retention)
         self._processes: dict[str, ManagedProcess] = {}
         self._last_exit_codes: dict[str, int] = {}
+        self._stop_stats: dict[str, dict[str, Any]] = {}
 
     def running(self, name: str) -> bool:
         proc = self._processes.get(name)
@@ -30,30 +313,47 @@ class ProcessSupervisor:
     def get(self, name: str) -> ManagedProcess | None:
         return self._processes.get(name)
 
-    async def start(self, name: str, command: Sequence[str], env: dict[str, str] | None = None) -> ManagedProcess:
+    async def start(
+        self,
+        name: str,
+        command: Sequence[str],
+        env: dict[str, str] | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> ManagedProcess:
         await self.stop(name)
 
-        ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        session_log = self._log_dir / f"{name}-{ts}.log"
-        log_path = session_log
-        log_file = open(log_path, "ab")
-        try:
-            proc_env = os.environ.copy()
-            env_overrides: dict[str, str] = {}
-            if env:
-                env_overrides = {str(k): str(v) for k, v in env.items()}
-                proc_env.update(env_overrides)
-            process = await asyncio.create_subprocess_exec(
-                *command,
+        now = datetime.now(timezone.utc)
+        session_log = self._logs.new_log(name, now)
+        proc_env = os.environ.copy()
+        env_overrides: dict[str, str] = {}
+        if env:
+            env_overrides = {str(k): str(v) for k, v in env.items()}
+            proc_env.update(env_overrides)
+        with open(session_log, "ab") as log_file:
+            popen = subprocess.Popen(
+                list(command),
+                stdin=subprocess.DEVNULL,
                 stdout=log_file,
-                stderr=asyncio.subprocess.STDOUT,
+                stderr=subprocess.STDOUT,
                 start_new_session=True,
                 env=proc_env,
             )
-        finally:
-            log_file.close()
-        managed = ManagedProcess(name=name, command=list(command), env_overrides=env_overrides, process=process)
+        stat = _proc_stat(popen.pid)
+        process = SupervisedProcess(popen.pid, stat[2] if stat is not None else 0, popen=popen)
+        managed = ManagedProcess(
+            name=name,
+            command=list(command),
+            env_overrides=env_overrides,
+            process=process,
+            log_path=session_log,
+            meta=dict(meta or {}),
+            started_at=now.isoformat(),
+        )
+        managed._pump = asyncio.create_task(self._pump_output(managed))
         self._processes[name] = managed
+        self._save_manifest(managed)
+        # The previous log of this name is now rotated: compress and prune off the loop.
+        self._logs.schedule_maintenance()
 
         # Best-effort stable pointer to latest log
         latest = self._log_dir / f"{name}.log"
@@ -66,7 +366,133 @@ class ProcessSupervisor:
 
         return managed
 
+    async def _pump_output(self, managed: ManagedProcess, offset: int = 0) -> None:
+        """Tails the session log into managed.output until the process has exited."""
+        changed = asyncio.Event()
+        managed.process.add_exit_callback(changed.set)
+        watch = InotifyWatch(managed.log_path, IN_MODIFY)
+        watcher: asyncio.Task | None = None
+        poll_s: float | None = None
+        try:
+            watch.open()
+        except OSError:
+            poll_s = LOG_POLL_INTERVAL_S
+        else:
+            watcher = asyncio.create_task(self._forward_events(watch, changed))
+        try:
+            with open(managed.log_path, "rb") as log:
+                log.seek(offset)
+                partial = b""
+                # Mid-line start (replayed tail) or an over-long line: skip to the next newline.
+                skipping = offset > 0
+                while True:
+                    changed.clear()
+                    chunk = log.read(65536)
+                    if chunk:
+                        lines = (partial + chunk).split(b"\n")
+                        partial = lines.pop()
+                        if skipping and lines:
+                            lines.pop(0)
+                            skipping = False
+                        if len(partial) > OUTPUT_MAX_LINE:
+                            partial = b""
+                            skipping = True
+                        for line in lines:
+                            managed._append_output(line.decode("utf-8", errors="replace").rstrip("\r"))
+                        continue
+                    if managed.process.returncode is not None:
+                        break
+                    try:
+                        await asyncio.wait_for(changed.wait(), timeout=poll_s)
+                    except asyncio.TimeoutError:
+                        pass
+                if partial and not skipping:
+                    managed._append_output(partial.decode("utf-8", errors="replace").rstrip("\r"))
+        except OSError as exc:
+            logger.warning("supervisor cannot read log of %s: %s", managed.name, exc)
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await watcher
+            watch.close()
+            managed._close_output()
+
+    @staticmethod
+    async def _forward_events(watch: InotifyWatch, changed: asyncio.Event) -> None:
+        async with contextlib.aclosing(watch.events()) as events:
+            async for _mask in events:
+                changed.set()
+
+    async def wait_for_line(self, name: str, predicate: Callable[[str], bool], timeout: float) -> str | None:
+        """First output line (already seen or upcoming) matching predicate; None on timeout or EOF."""
+        managed = self._processes.get(name)
+        if managed is None:
+            return None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, timeout)
+        seen = 0
+        while True:
+            lines = list(managed.output)
+            first_index = managed.output_lines - len(lines)
+            for line in lines[max(0, seen - first_index):]:
+                if predicate(line):
+                    return line
+            seen = managed.output_lines
+            if managed.output_closed:
+                return None
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(managed._output_changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return None
+
+    async def _wait_group_exit(self, pgid: int, timeout: float) -> bool:
+        """Waits until no process of the group is left (children may outlive the leader).
+
+        Members are found in /proc and waited on through pidfds; the group is
+        rescanned once they are gone in case one forked in the meantime.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            members = await asyncio.to_thread(_group_members, pgid)
+            if not members:
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            await _wait_pids_exit(members, remaining)
+
+    async def _wait_stopped(self, managed: ManagedProcess, timeout: float) -> bool:
+        """Leader and the rest of its group gone within one timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            await asyncio.wait_for(managed.process.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return await self._wait_group_exit(managed.pgid, timeout=max(0.0, deadline - loop.time()))
+
+    @staticmethod
+    def _signal_group(managed: ManagedProcess, sig: int) -> None:
+        managed.process.note_signal(sig)
+        try:
+            os.killpg(managed.pgid, sig)
+        except ProcessLookupError:
+            pass
+        except Exception:  # fallback when process group kill is unavailable
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(managed.process.pid, sig)
+
     async def stop(self, name: str, graceful_timeout: float = 3.0, kill_timeout: float = 2.0) -> None:
+        """SIGTERM to the process group, SIGKILL to whatever is left after graceful_timeout.
+
+        Returns once the whole group (which may hold the v4l2 device) is gone,
+        or after graceful_timeout + kill_timeout at the latest.
+        """
         managed = self._processes.get(name)
         if not managed:
             return
@@ -74,36 +500,165 @@ class ProcessSupervisor:
         if process.returncode is not None:
             self._last_exit_codes[name] = int(process.returncode)
             self._processes.pop(name, None)
+            self._remove_manifest(name)
             return
 
-        # Terminate the whole process group (backend tools may spawn children).
-        try:
-            os.killpg(process.pid, signal.SIGTERM)
-        except ProcessLookupError:
-            pass
-        except Exception:  # fallback when process group kill is unavailable
-            process.terminate()
+        loop = asyncio.get_running_loop()
+        signalled_at = loop.time()
+        escalated = False
+        self._signal_group(managed, signal.SIGTERM)
         try:
-            await asyncio.wait_for(process.wait(), timeout=graceful_timeout)
-        except TimeoutError:
-            try:
-                os.killpg(process.pid, signal.SIGKILL)
-            except ProcessLookupError:
-                pass
-            except Exception:  # fallback when process group kill is unavailable
-                process.kill()
-            try:
-                await asyncio.wait_for(process.wait(), timeout=kill_timeout)
-            except TimeoutError:
-                pass
+            if not await self._wait_stopped(managed, graceful_timeout):
+                escalated = True
+                self._signal_group(managed, signal.SIGKILL)
+                await self._wait_stopped(managed, kill_timeout)
         finally:
             if process.returncode is not None:
                 self._last_exit_codes[name] = int(process.returncode)
             self._processes.pop(name, None)
+            self._remove_manifest(name)
+        stopped_at = loop.time()
+        self._stop_stats[name] = {
+            "returncode": process.returncode,
+            "leader_exit_ms": (
+                round((process.exited_at - signalled_at) * 1000, 1) if process.exited_at is not None else None
+            ),
+            "group_exit_ms": round((stopped_at - signalled_at) * 1000, 1),
+            "escalated": escalated,
+            "exit_watch": process.watch,
+        }
+        if managed._pump is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(managed._pump), timeout=kill_timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+
+    async def stop_all(self, timeout: float = STOP_ALL_TIMEOUT_S) -> None:
+        """Stops every process group concurrently, all within one overall timeout."""
+        names = list(self._processes.keys())
+        graceful = timeout * 0.6
+        results = await asyncio.gather(
+            *(self.stop(name, graceful_timeout=graceful, kill_timeout=timeout - graceful) for name in names),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.warning("supervisor failed to stop %s: %s", name, result)
+
+    async def detach_all(self) -> list[str]:
+        """Lets every running process outlive this daemon; their manifests stay for adopt()."""
+        detached: list[str] = []
+        for name, managed in list(self._processes.items()):
+            self._processes.pop(name, None)
+            if managed.process.returncode is not None:
+                self._remove_manifest(name)
+                continue
+            managed.process.detach()
+            if managed._pump is not None:
+                managed._pump.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await managed._pump
+            detached.append(name)
+            logger.info("supervisor.detach %s pid=%d", name, managed.process.pid)
+        return detached
 
-    async def stop_all(self) -> None:
-        for name in list(self._processes.keys()):
-            await self.stop(name)
+    def adopt(self) -> list[ManagedProcess]:
+        """Takes over the processes a previous daemon detached, from their manifests.
+
+        A record is trusted only while its pid still has the recorded start
+        time, process group and argv; anything else is stale and removed.
+        """
+        if self._manifest_dir is None or not self._manifest_dir.is_dir():
+            return []
+        adopted: list[ManagedProcess] = []
+        for path in sorted(self._manifest_dir.glob("*.json")):
+            name = path.stem
+            if name in self._processes:
+                continue
+            try:
+                record = json.loads(path.read_text(encoding="utf-8"))
+                pid = int(record["pid"])
+                start_time = int(record["start_time"])
+                command = [str(arg) for arg in record["command"]]
+                log_path = Path(str(record["log_path"]))
+            except (OSError, ValueError, KeyError, TypeError) as exc:
+                logger.warning("supervisor.adopt dropping unreadable manifest %s: %s", path.name, exc)
+                self._remove_manifest(name)
+                continue
+            reason = self._verify_record(
+                pid=pid, pgid=int(record.get("pgid", pid)), start_time=start_time, command=command
+            )
+            if reason is not None:
+                logger.info("supervisor.adopt skipping %s pid=%d: %s", name, pid, reason)
+                self._remove_manifest(name)
+                continue
+            process = SupervisedProcess(pid, start_time)
+            if process.returncode is not None:
+                self._remove_manifest(name)
+                continue
+            managed = ManagedProcess(
+                name=name,
+                command=command,
+                env_overrides={str(k): str(v) for k, v in dict(record.get("env") or {}).items()},
+                process=process,
+                log_path=log_path,
+                meta=dict(record.get("meta") or {}),
+                started_at=str(record.get("started_at", "")),
+            )
+            try:
+                offset = max(0, log_path.stat().st_size - ADOPT_LOG_REPLAY)
+            except OSError:
+                offset = 0
+            managed._pump = asyncio.create_task(self._pump_output(managed, offset=offset))
+            self._processes[name] = managed
+            adopted.append(managed)
+            logger.info("supervisor.adopt %s pid=%d", name, pid)
+        return adopted
+
+    @staticmethod
+    def _verify_record(*, pid: int, pgid: int, start_time: int, command: list[str]) -> str | None:
+        stat = _proc_stat(pid)
+        if stat is None or stat[0] == "Z":
+            return "not running"
+        if stat[2] != start_time:
+            return "pid reused"
+        if stat[1] != pgid or pgid != pid:
+            return "process group changed"
+        if not _cmdline_matches(_proc_cmdline(pid), command):
+            return "command line differs"
+        return None
+
+    def _manifest_path(self, name: str) -> Path | None:
+        return self._manifest_dir / f"{name}.json" if self._manifest_dir is not None else None
+
+    def _save_manifest(self, managed: ManagedProcess) -> None:
+        path = self._manifest_path(managed.name)
+        if path is None:
+            return
+        record = {
+            "name": managed.name,
+            "pid": managed.process.pid,
+            "pgid": managed.pgid,
+            "start_time": managed.process.start_time,
+            "started_at": managed.started_at,
+            "command": managed.command,
+            "env": managed.env_overrides,
+            "log_path": str(managed.log_path),
+            "meta": managed.meta,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(record, indent=2), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.warning("supervisor cannot persist manifest for %s: %s", managed.name, exc)
+
+    def _remove_manifest(self, name: str) -> None:
+        path = self._manifest_path(name)
+        if path is not None:
+            with contextlib.suppress(OSError):
+                path.unlink()
 
     async def wait(self, name: str) -> int | None:
         managed = self._processes.get(name)
@@ -116,5 +671,14 @@ class ProcessSupervisor:
     def last_exit_code(self, name: str) -> int | None:
         return self._last_exit_codes.get(name)
 
+    def stop_stats(self, name: str) -> dict[str, Any] | None:
+        """Timings of the last stop(): signal to leader exit and to whole-group exit, in ms."""
+        stats = self._stop_stats.get(name)
+        return dict(stats) if stats is not None else None
+
     def latest_log_path(self, name: str) -> str:
-        return str(self._log_dir / f"{name}.log")
+        latest = self._logs.latest(name)
+        return str(latest if latest is not None else self._log_dir / f"{name}.log")
+
+    def log_summary(self) -> dict[str, Any]:
+        return self._logs.summary()
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import gzip
+import json
+import logging
+from pathlib import Path
+import os
+import re
+import shutil
+import threading
+import time
+from typing import Any
+
+from avreamd.constants import SESSION_LOG_MAX_AGE_S, SESSION_LOG_MAX_BYTES, SESSION_LOG_MAX_FILES
+
+
+logger = logging.getLogger(__name__)
+
+# "<name>-20250101T120000Z.log", optionally already compressed.
+_SESSION_LOG_RE = re.compile(r"^(?P<name>.+)-(?P<ts>\d{8}T\d{6}Z)\.log(?P<gz>\.gz)?$")
+_TS_FORMAT = "%Y%m%dT%H%M%SZ"
+
+
+@dataclass(frozen=True)
+class SessionLogRetention:
+    max_files: int = SESSION_LOG_MAX_FILES
+    max_total_bytes: int = SESSION_LOG_MAX_BYTES
+    max_age_s: float = SESSION_LOG_MAX_AGE_S
+    compress: bool = True
+
+
+def _started_ts(entry: dict[str, Any]) -> float:
+    try:
+        return datetime.fromisoformat(str(entry.get("started_at"))).timestamp()
+    except ValueError:
+        return 0.0
+
+
+class SessionLogStore:
+    """Session logs of supervised processes, tracked in an index instead of directory scans.
+
+    index.json lists every session log (oldest first) with its size and
+    compression state, plus the latest log per process name. All logs but
+    each name's latest are gzip-compressed and pruned by age, count and total
+    size in a worker thread, off the event loop. Only the first run without an
+    index lists the directory, to pick up logs written before it existed.
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, log_dir: Path, retention: SessionLogRetention | None = None) -> None:
+        self._log_dir = log_dir
+        self._retention = retention or SessionLogRetention()
+        self._index_path = log_dir / self.INDEX_NAME
+        self._lock = threading.Lock()
+        self._entries: list[dict[str, Any]] = []
+        self._latest: dict[str, str] = {}
+        self._task: asyncio.Task | None = None
+        self._rerun = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+            self._entries = [dict(e) for e in data["logs"] if isinstance(e, dict) and e.get("file")]
+            self._latest = {str(k): str(v) for k, v in dict(data["latest"]).items()}
+            return
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("session log index unreadable, rebuilding: %s", exc)
+        if not self._log_dir.is_dir():
+            return
+        self._entries, self._latest = self._scan()
+        with self._lock:
+            self._save()
+
+    def _scan(self) -> tuple[list[dict[str, Any]], dict[str, str]]:
+        entries: list[dict[str, Any]] = []
+        try:
+            paths = list(self._log_dir.iterdir())
+        except OSError:
+            return entries, {}
+        for path in paths:
+            match = _SESSION_LOG_RE.match(path.name)
+            if match is None or path.is_symlink():
+                continue
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            started = datetime.strptime(match["ts"], _TS_FORMAT).replace(tzinfo=timezone.utc)
+            entries.append(
+                {
+                    "name": match["name"],
+                    "file": path.name,
+                    "started_at": started.isoformat(),
+                    "bytes": size,
+                    "compressed": bool(match["gz"]),
+                }
+            )
+        entries.sort(key=lambda e: (e["started_at"], e["file"]))
+        latest = {e["name"]: e["file"] for e in entries if not e["compressed"]}
+        return entries, latest
+
+    def _save(self) -> None:
+        """Writes the index; caller holds the lock."""
+        data = {"version": 1, "latest": self._latest, "logs": self._entries}
+        tmp = self._index_path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+            os.replace(tmp, self._index_path)
+        except OSError as exc:
+            logger.warning("cannot write session log index: %s", exc)
+
+    def new_log(self, name: str, started: datetime) -> Path:
+        """Registers the log file for a new session of `name` and returns its path."""
+        path = self._log_dir / f"{name}-{started.strftime(_TS_FORMAT)}.log"
+        with self._lock:
+            if not any(e["file"] == path.name for e in self._entries):
+                self._entries.append(
+                    {
+                        "name": name,
+                        "file": path.name,
+                        "started_at": started.isoformat(),
+                        "bytes": 0,
+                        "compressed": False,
+                    }
+                )
+            self._latest[name] = path.name
+            self._save()
+        return path
+
+    def latest(self, name: str) -> Path | None:
+        with self._lock:
+            filename = self._latest.get(name)
+        return self._log_dir / filename if filename else None
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "log_dir": str(self._log_dir),
+                "files": len(self._entries),
+                "bytes": sum(int(e.get("bytes", 0)) for e in self._entries),
+                "compressed": sum(1 for e in self._entries if e.get("compressed")),
+            }
+
+    def schedule_maintenance(self) -> None:
+        """Compresses and prunes in the background; coalesces requests made while it runs."""
+        if self._task is not None and not self._task.done():
+            self._rerun = True
+            return
+        self._task = asyncio.create_task(self._maintain_in_thread())
+
+    async def _maintain_in_thread(self) -> None:
+        while True:
+            self._rerun = False
+            try:
+                await asyncio.to_thread(self.maintain)
+            except Exception:  # pragma: no cover - defensive; retried at the next start
+                logger.exception("session log maintenance failed")
+            if not self._rerun:
+                return
+
+    def maintain(self, now: float | None = None) -> dict[str, int]:
+        """Compresses rotated logs and applies the retention policy (blocking)."""
+        now = time.time() if now is None else now
+        with self._lock:
+            keep = set(self._latest.values())
+            pending = [e["file"] for e in self._entries if e["file"] not in keep and not e.get("compressed")]
+        compressed = 0
+        if self._retention.compress:
+            for filename in pending:
+                result = self._compress(filename)
+                if result is None:
+                    continue
+                with self._lock:
+                    for entry in self._entries:
+                        if entry["file"] == filename:
+                            entry.update(file=result[0], bytes=result[1], compressed=True)
+                compressed += 1
+        with self._lock:
+            self._refresh_sizes()
+            expired = self._expire(now)
+            self._save()
+        for entry in expired:
+            with contextlib.suppress(OSError):
+                (self._log_dir / entry["file"]).unlink()
+        return {"compressed": compressed, "removed": len(expired)}
+
+    def _compress(self, filename: str) -> tuple[str, int] | None:
+        src = self._log_dir / filename
+        dst = self._log_dir / f"{filename}.gz"
+        tmp = self._log_dir / f"{filename}.gz.tmp"
+        try:
+            with open(src, "rb") as fin, gzip.open(tmp, "wb", compresslevel=6) as fout:
+                shutil.copyfileobj(fin, fout, 1024 * 1024)
+            os.replace(tmp, dst)
+            src.unlink()
+            return dst.name, dst.stat().st_size
+        except OSError as exc:
+            if not isinstance(exc, FileNotFoundError):
+                logger.warning("cannot compress session log %s: %s", filename, exc)
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+            return None
+
+    def _refresh_sizes(self) -> None:
+        """Current sizes of uncompressed logs; forgets rotated logs deleted behind our back."""
+        keep = set(self._latest.values())
+        entries: list[dict[str, Any]] = []
+        for entry in self._entries:
+            if not entry.get("compressed"):
+                try:
+                    entry["bytes"] = (self._log_dir / entry["file"]).stat().st_size
+                except OSError:
+                    if entry["file"] not in keep:
+                        continue
+                    entry["bytes"] = 0
+            entries.append(entry)
+        self._entries = entries
+
+    def _expire(self, now: float) -> list[dict[str, Any]]:
+        """Drops entries past max age, then the oldest until count and size fit; caller holds the lock."""
+        retention = self._retention
+        keep = set(self._latest.values())
+        fresh: list[dict[str, Any]] = []
+        expired: list[dict[str, Any]] = []
+        for entry in self._entries:
+            if entry["file"] not in keep and now - _started_ts(entry) > retention.max_age_s:
+                expired.append(entry)
+            else:
+                fresh.append(entry)
+        count = len(fresh)
+        total = sum(int(e.get("bytes", 0)) for e in fresh)
+        kept: list[dict[str, Any]] = []
+        for entry in fresh:
+            if entry["file"] not in keep and (count > retention.max_files or total > retention.max_total_bytes):
+                expired.append(entry)
+                count -= 1
+                total -= int(entry.get("bytes", 0))
+            else:
+                kept.append(entry)
+        self._entries = kept
+        return expired
@@ -4,7 +4,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 import asyncio
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from avreamd.core.event_bus import EventBus
 
 
 class SubsystemState(str, Enum):
@@ -29,6 +32,8 @@ class SubsystemStatus:
     state: SubsystemState = SubsystemState.STOPPED
     operation_id: int = 0
     last_error: dict[str, Any] | None = None
+    # What the running backend reported about itself (device, encoder, sink, ...).
+    backend: dict[str, Any] | None = None
 
 
 @dataclass
@@ -36,32 +41,78 @@ class RuntimeStatus:
     started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     video: SubsystemStatus = field(default_factory=SubsystemStatus)
     audio: SubsystemStatus = field(default_factory=SubsystemStatus)
+    # Additional camera sessions, keyed by loopback device name ("video11", ...).
+    video_sessions: dict[str, SubsystemStatus] = field(default_factory=dict)
 
 
 class InvalidTransitionError(ValueError):
     pass
 
 
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain, mutable (and JSON-serializable) copy of a frozen snapshot or any part of it."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
 class DaemonStateStore:
-    def __init__(self) -> None:
+    """Runtime state with a versioned, copy-on-write snapshot.
+
+    Every change rebuilds the snapshot and bumps ``version``. The published
+    snapshot is deep-frozen (read-only mappings, tuples), so readers need no
+    lock and cannot corrupt it; snapshot() and changed() hand out plain copies.
+    """
+
+    def __init__(self, *, event_bus: EventBus | None = None) -> None:
         self._state = RuntimeStatus()
         self._lock = asyncio.Lock()
+        self._event_bus = event_bus
+        self._version = 0
+        self._snapshot = self._build_snapshot()
+        self._changed = asyncio.Event()
+        self._closed = False
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def current(self) -> Mapping[str, Any]:
+        """Latest published snapshot, read-only and shared between readers; thaw() it to serialize."""
+        return self._snapshot
 
     async def snapshot(self) -> dict[str, Any]:
-        async with self._lock:
-            return {
-                "started_at": self._state.started_at.isoformat(),
-                "video": {
-                    "state": self._state.video.state.value,
-                    "operation_id": self._state.video.operation_id,
-                    "last_error": self._state.video.last_error,
-                },
-                "audio": {
-                    "state": self._state.audio.state.value,
-                    "operation_id": self._state.audio.operation_id,
-                    "last_error": self._state.audio.last_error,
-                },
-            }
+        return thaw(self._snapshot)
+
+    async def changed(self, since_version: int, timeout_s: float | None = None) -> dict[str, Any]:
+        """Waits until the version moves past ``since_version`` (or timeout) and returns the snapshot."""
+        if self._version > since_version or self._closed:
+            return thaw(self._snapshot)
+        event = self._changed
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout_s)
+        except asyncio.TimeoutError:
+            pass
+        return thaw(self._snapshot)
+
+    def close(self) -> None:
+        """Releases pending changed() waiters on shutdown."""
+        self._closed = True
+        self._changed.set()
 
     async def transition_video(self, next_state: SubsystemState) -> int:
         async with self._lock:
@@ -73,29 +124,84 @@ class DaemonStateStore:
             self._transition(self._state.audio, next_state, subsystem_name="audio")
             return self._state.audio.operation_id
 
+    async def transition_video_session(self, session: str, next_state: SubsystemState) -> int:
+        async with self._lock:
+            target = self._state.video_sessions.setdefault(session, SubsystemStatus())
+            self._transition(target, next_state, subsystem_name="video_session", session=session)
+            return target.operation_id
+
+    def video_session(self, session: str) -> "VideoSessionStateView":
+        return VideoSessionStateView(self, session)
+
     async def set_video_error(self, code: str, message: str, details: dict[str, Any] | None = None) -> None:
         async with self._lock:
-            self._state.video.last_error = {
-                "code": code,
-                "message": message,
-                "details": details or {},
-                "ts": datetime.now(timezone.utc).isoformat(),
-            }
-            self._state.video.state = SubsystemState.ERROR
-            self._state.video.operation_id += 1
+            self._set_error(self._state.video, "video", code, message, details)
+
+    async def set_video_session_error(
+        self, session: str, code: str, message: str, details: dict[str, Any] | None = None
+    ) -> None:
+        async with self._lock:
+            target = self._state.video_sessions.setdefault(session, SubsystemStatus())
+            self._set_error(target, "video_session", code, message, details, session=session)
+
+    async def set_video_backend(self, info: dict[str, Any]) -> None:
+        async with self._lock:
+            self._set_backend(self._state.video, "video", info)
+
+    async def set_video_session_backend(self, session: str, info: dict[str, Any]) -> None:
+        async with self._lock:
+            target = self._state.video_sessions.setdefault(session, SubsystemStatus())
+            self._set_backend(target, "video_session", info, session=session)
 
     async def set_audio_error(self, code: str, message: str, details: dict[str, Any] | None = None) -> None:
         async with self._lock:
-            self._state.audio.last_error = {
-                "code": code,
-                "message": message,
-                "details": details or {},
-                "ts": datetime.now(timezone.utc).isoformat(),
-            }
-            self._state.audio.state = SubsystemState.ERROR
-            self._state.audio.operation_id += 1
-
-    def _transition(self, target: SubsystemStatus, next_state: SubsystemState, subsystem_name: str) -> None:
+            self._set_error(self._state.audio, "audio", code, message, details)
+
+    def _set_error(
+        self,
+        target: SubsystemStatus,
+        subsystem_name: str,
+        code: str,
+        message: str,
+        details: dict[str, Any] | None,
+        session: str | None = None,
+    ) -> None:
+        target.last_error = {
+            "code": code,
+            "message": message,
+            "details": details or {},
+            "ts": datetime.now(timezone.utc).isoformat(),
+        }
+        previous = target.state
+        target.state = SubsystemState.ERROR
+        target.operation_id += 1
+        self._commit()
+        self._publish(subsystem_name, target, previous, session=session)
+
+    def _set_backend(
+        self,
+        target: SubsystemStatus,
+        subsystem_name: str,
+        info: dict[str, Any],
+        session: str | None = None,
+    ) -> None:
+        if target.backend == info:
+            return
+        target.backend = dict(info)
+        self._commit()
+        if self._event_bus is not None:
+            data: dict[str, Any] = {"operation_id": target.operation_id, "backend": target.backend}
+            if session is not None:
+                data["session"] = session
+            self._event_bus.publish(f"{subsystem_name}.backend", data)
+
+    def _transition(
+        self,
+        target: SubsystemStatus,
+        next_state: SubsystemState,
+        subsystem_name: str,
+        session: str | None = None,
+    ) -> None:
         current = target.state
         if current == next_state:
             return
@@ -110,3 +216,89 @@ class DaemonStateStore:
         target.operation_id += 1
         if next_state != SubsystemState.ERROR:
             target.last_error = None
+        if next_state == SubsystemState.STARTING:
+            target.backend = None
+        self._commit()
+        self._publish(subsystem_name, target, current, session=session)
+
+    def _build_snapshot(self) -> Mapping[str, Any]:
+        # Frozen copies: nested dicts (last_error, backend) are not shared with the live state.
+        return _freeze({
+            "version": self._version,
+            "started_at": self._state.started_at.isoformat(),
+            "video": {
+                "state": self._state.video.state.value,
+                "operation_id": self._state.video.operation_id,
+                "last_error": self._state.video.last_error,
+                "backend": self._state.video.backend,
+            },
+            "audio": {
+                "state": self._state.audio.state.value,
+                "operation_id": self._state.audio.operation_id,
+                "last_error": self._state.audio.last_error,
+            },
+            "video_sessions": {
+                name: {
+                    "state": status.state.value,
+                    "operation_id": status.operation_id,
+                    "last_error": status.last_error,
+                    "backend": status.backend,
+                }
+                for name, status in self._state.video_sessions.items()
+            },
+        })
+
+    def _commit(self) -> None:
+        self._version += 1
+        self._snapshot = self._build_snapshot()
+        # Swap before waking so waiters that re-check block on the next change.
+        event, self._changed = self._changed, asyncio.Event()
+        event.set()
+
+    def _publish(
+        self,
+        subsystem_name: str,
+        target: SubsystemStatus,
+        previous: SubsystemState,
+        session: str | None = None,
+    ) -> None:
+        if self._event_bus is None:
+            return
+        data: dict[str, Any] = {
+            "state": target.state.value,
+            "previous": previous.value,
+            "operation_id": target.operation_id,
+            "last_error": target.last_error,
+        }
+        if session is not None:
+            data["session"] = session
+        self._event_bus.publish(f"{subsystem_name}.state", data)
+
+
+class VideoSessionStateView:
+    """One additional camera session seen through the store's video interface.
+
+    snapshot()["video"] and transition_video()/set_video_error() address the
+    session's entry, so the per-session video services run unchanged.
+    """
+
+    def __init__(self, store: DaemonStateStore, session: str) -> None:
+        self._store = store
+        self.session = session
+
+    async def snapshot(self) -> dict[str, Any]:
+        snap = await self._store.snapshot()
+        video = snap["video_sessions"].get(
+            self.session,
+            {"state": SubsystemState.STOPPED.value, "operation_id": 0, "last_error": None, "backend": None},
+        )
+        return {**snap, "video": video}
+
+    async def transition_video(self, next_state: SubsystemState) -> int:
+        return await self._store.transition_video_session(self.session, next_state)
+
+    async def set_video_error(self, code: str, message: str, details: dict[str, Any] | None = None) -> None:
+        await self._store.set_video_session_error(self.session, code, message, details)
+
+    async def set_video_backend(self, info: dict[str, Any]) -> None:
+        await self._store.set_video_session_backend(self.session, info)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import time
+from typing import Awaitable, TypeVar
+
+
+T = TypeVar("T")
+
+
+class PhaseTimings:
+    """Wall-clock milliseconds per named phase of a multi-step operation."""
+
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self._phases: dict[str, int] = {}
+
+    async def measure(self, name: str, awaitable: Awaitable[T]) -> T:
+        started = time.monotonic()
+        try:
+            return await awaitable
+        finally:
+            self._phases[name] = int((time.monotonic() - started) * 1000)
+
+    def as_dict(self) -> dict[str, int]:
+        out = dict(self._phases)
+        out["total"] = int((time.monotonic() - self._started) * 1000)
+        return out
+
+    def __str__(self) -> str:
+        return " ".join(f"{name}={ms}" for name, ms in self.as_dict().items())
@@ -2,6 +2,8 @@
 
 from avreamd.domain.models import (
     AdbCommandResult,
+    AndroidDeviceEntry,
+    AndroidDeviceFingerprint,
     ReconnectPolicy,
     ReconnectStatus,
     UpdateConfig,
@@ -12,6 +14,8 @@ from avreamd.domain.models import (
 
 __all__ = [
     "AdbCommandResult",
+    "AndroidDeviceEntry",
+    "AndroidDeviceFingerprint",
     "ReconnectPolicy",
     "ReconnectStatus",
     "UpdateConfig",
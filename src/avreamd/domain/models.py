@@ -127,3 +127,48 @@ class AdbCommandResult:
             "stderr": self.stderr,
             "args": list(self.args),
         }
+
+
+@dataclass
+class AndroidDeviceEntry:
+    serial: str
+    state: str
+    transport: str
+    identity: str | None = None
+    wifi_candidate_ip: str | None = None
+    model: str | None = None
+    android_version: str | None = None
+    enriched: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "serial": self.serial,
+            "state": self.state,
+            "transport": self.transport,
+            "identity": self.identity,
+            "wifi_candidate_ip": self.wifi_candidate_ip,
+            "model": self.model,
+            "android_version": self.android_version,
+        }
+
+
+@dataclass(frozen=True)
+class AndroidDeviceFingerprint:
+    serial: str
+    serialno: str | None = None
+    model: str | None = None
+    android_version: str | None = None
+    sdk: int | None = None
+    ipv4_addresses: tuple[tuple[str, str], ...] = ()
+    wifi_ip: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "serial": self.serial,
+            "serialno": self.serialno,
+            "model": self.model,
+            "android_version": self.android_version,
+            "sdk": self.sdk,
+            "ipv4_addresses": [{"iface": iface, "ip": ip} for iface, ip in self.ipv4_addresses],
+            "wifi_ip": self.wifi_ip,
+        }
@@ -5,41 +5,69 @@ import ipaddress
 import os
 import re
 import shutil
+from typing import AsyncIterator, Awaitable, Callable
 
 from avreamd.constants import ADB_DEFAULT_PORT
-from avreamd.domain.models import AdbCommandResult
+from avreamd.domain.models import AdbCommandResult, AndroidDeviceFingerprint
+from avreamd.integrations.adb_protocol import AdbProtocolError, AdbServerClient, AdbServerUnavailable
 from avreamd.integrations.command_runner import CommandRunner
 
 
+WIFI_IFACES = ("wlan0", "swlan0", "wlan1", "wlan2", "wifi0")
+
+
+class AdbTransportError(RuntimeError):
+    """adb could not reach the device (offline, unauthorized, gone); no shell command ran."""
+
+_PROBE_MARKER = "avream:"
+_PROBE_PROPS = (
+    "ro.serialno",
+    "ro.boot.serialno",
+    "ro.product.model",
+    "ro.build.version.release",
+    "ro.build.version.sdk",
+)
+# One device-side shell script: properties as `avream:<prop>=<value>` lines,
+# then every IPv4 address as `ip -o` lines, then an end marker.
+_PROBE_SCRIPT = (
+    f"for p in {' '.join(_PROBE_PROPS)}; do echo \"{_PROBE_MARKER}$p=$(getprop $p)\"; done; "
+    f"ip -4 -o addr show 2>/dev/null; echo {_PROBE_MARKER}end"
+)
+
+
 class AdbAdapter:
-    def __init__(self, adb_bin: str | None = None) -> None:
+    def __init__(self, adb_bin: str | None = None, server: AdbServerClient | None = None) -> None:
         env_bin = os.getenv("AVREAM_ADB_BIN")
         self.adb_bin = adb_bin or env_bin or shutil.which("adb")
         self._runner = CommandRunner()
-        self._adb_lock = asyncio.Lock()
+        self._locks: dict[str, asyncio.Lock] = {}
+        # Talk to the adb server directly when possible; the adb binary stays as fallback.
+        native_enabled = os.getenv("AVREAM_ADB_NATIVE", "1").strip().lower() not in {"0", "false", "no", "off"}
+        self._server = server if server is not None else (AdbServerClient() if native_enabled else None)
 
     @property
     def available(self) -> bool:
         return bool(self.adb_bin)
 
+    @property
+    def can_track(self) -> bool:
+        return self._server is not None
+
+    async def track_devices(self) -> AsyncIterator[list[dict[str, str]]]:
+        # Raises AdbServerUnavailable/AdbProtocolError; callers own the retry policy.
+        if self._server is None:
+            raise AdbServerUnavailable("native adb client is disabled")
+        async for payload in self._server.track_devices():
+            yield self.parse_devices(payload)
+
     async def list_devices(self) -> list[dict[str, str]]:
         if not self.adb_bin:
             return []
 
-        result = await self._run(["devices"])
+        result = await self._run(["devices", "-l"])
         if self._as_int(result.get("returncode"), 1) != 0:
             return []
-
-        devices: list[dict[str, str]] = []
-        stdout = str(result.get("stdout", ""))
-        for line in stdout.splitlines():
-            line = line.strip()
-            if not line or line.startswith("List of devices"):
-                continue
-            parts = line.split()
-            if len(parts) >= 2:
-                devices.append({"serial": parts[0], "state": parts[1]})
-        return devices
+        return self.parse_devices(str(result.get("stdout", "")))
 
     async def tcpip(self, *, serial: str, port: int = ADB_DEFAULT_PORT) -> dict[str, object]:
         return await self._run(["-s", serial, "tcpip", str(int(port))])
@@ -73,8 +101,39 @@ class AdbAdapter:
         last["attempts"] = attempts
         return last
 
+    async def probe_device(self, *, serial: str) -> AndroidDeviceFingerprint | None:
+        """Collects identity, model, Android version and IPv4 addresses in one shell call.
+
+        None means the device shell could not run the script (per-property calls
+        may still work); AdbTransportError means the device was not reachable.
+        """
+        res = await self._run(["-s", serial, "shell", _PROBE_SCRIPT])
+        if self._as_int(res.get("returncode"), 1) != 0:
+            if self._is_transport_failure(res):
+                raise AdbTransportError(str(res.get("stderr", "")).strip() or "adb shell failed")
+            return None
+        return self.parse_probe(serial, str(res.get("stdout", "")))
+
+    @staticmethod
+    def _is_transport_failure(res: dict[str, object]) -> bool:
+        # adb itself reports "error: device offline", "adb: device unauthorized", ...
+        # while a shell that rejects the script answers from the device.
+        if str(res.get("stdout", "")).strip():
+            return False
+        return str(res.get("stderr", "")).strip().lower().startswith(("error", "adb"))
+
     async def detect_device_ip(self, *, serial: str) -> str | None:
-        for iface in ("wlan0", "swlan0", "wlan1", "wlan2", "wifi0"):
+        try:
+            fingerprint = await self.probe_device(serial=serial)
+        except AdbTransportError:
+            return None
+        if fingerprint is not None:
+            return fingerprint.wifi_ip
+        return await self.legacy_ip(serial=serial)
+
+    async def legacy_ip(self, *, serial: str) -> str | None:
+        """Wi-Fi IPv4 via one `ip addr` call per interface, for shells that cannot run the batched probe."""
+        for iface in WIFI_IFACES:
             res = await self._run(["-s", serial, "shell", "ip", "-4", "-o", "addr", "show", iface])
             if self._as_int(res.get("returncode"), 1) != 0:
                 continue
@@ -109,7 +168,13 @@ class AdbAdapter:
 
         return private_candidate or first_candidate
 
-    async def wifi_setup(self, *, serial: str | None = None, port: int = ADB_DEFAULT_PORT) -> dict[str, object]:
+    async def wifi_setup(
+        self,
+        *,
+        serial: str | None = None,
+        port: int = ADB_DEFAULT_PORT,
+        wait_ready: Callable[[str], Awaitable[bool]] | None = None,
+    ) -> dict[str, object]:
         if not self.adb_bin:
             return {"returncode": 127, "stdout": "", "stderr": "adb not found"}
 
@@ -166,16 +231,7 @@ class AdbAdapter:
         endpoint = f"{ip}:{int(port)}"
         conn = await self.connect_with_retry(endpoint=endpoint, retries=3, backoff_base_s=0.5)
 
-        wifi_ready = False
-        for _ in range(12):
-            devices_after = await self.list_devices()
-            for d in devices_after:
-                if d.get("serial") == endpoint and d.get("state") == "device":
-                    wifi_ready = True
-                    break
-            if wifi_ready:
-                break
-            await asyncio.sleep(0.5)
+        wifi_ready = await (wait_ready or self._poll_device_ready)(endpoint)
 
         return {
             "returncode": 0 if wifi_ready else 1,
@@ -190,6 +246,14 @@ class AdbAdapter:
             "devices": devices,
         }
 
+    async def _poll_device_ready(self, serial: str) -> bool:
+        for _ in range(12):
+            devices = await self.list_devices()
+            if any(d.get("serial") == serial and d.get("state") == "device" for d in devices):
+                return True
+            await asyncio.sleep(0.5)
+        return False
+
     async def get_device_property(self, *, serial: str, prop: str) -> str | None:
         res = await self._run(["-s", serial, "shell", "getprop", prop])
         if self._as_int(res.get("returncode"), 1) != 0:
@@ -203,6 +267,16 @@ class AdbAdapter:
 
     async def device_identity(self, *, serial: str) -> str | None:
         # Stable physical-device key for deduping USB+Wi-Fi adb entries.
+        try:
+            fingerprint = await self.probe_device(serial=serial)
+        except AdbTransportError:
+            return None
+        if fingerprint is not None:
+            return fingerprint.serialno
+        return await self.legacy_identity(serial=serial)
+
+    async def legacy_identity(self, *, serial: str) -> str | None:
+        """Identity via per-property getprop calls, for shells that cannot run the batched probe."""
         for prop in ("ro.serialno", "ro.boot.serialno"):
             value = await self.get_device_property(serial=serial, prop=prop)
             if value:
@@ -213,7 +287,10 @@ class AdbAdapter:
         if not self.adb_bin:
             return {"returncode": 127, "stdout": "", "stderr": "adb not found"}
 
-        async with self._adb_lock:
+        async with self._lock_for(args):
+            native = await self._run_native(args)
+            if native is not None:
+                return native
             result = await self._runner.run_async([self.adb_bin, *args])
         result = AdbCommandResult(
             returncode=int(result.returncode),
@@ -223,6 +300,124 @@ class AdbAdapter:
         )
         return result.as_dict()
 
+    def _lock_for(self, args: list[str]) -> asyncio.Lock:
+        # Commands aimed at one device (or one endpoint) are serialized; other
+        # devices and host-level queries proceed concurrently.
+        if len(args) >= 2 and args[0] in {"-s", "connect", "disconnect"}:
+            key = args[1]
+        else:
+            key = ""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        return lock
+
+    async def _run_native(self, args: list[str]) -> dict[str, object] | None:
+        # Returns None when the request is not handled natively or the adb
+        # server cannot be reached, so the caller falls back to the binary.
+        if self._server is None:
+            return None
+        try:
+            if args and args[0] == "devices" and set(args[1:]) <= {"-l"}:
+                payload = await self._server.devices(long="-l" in args)
+                result = AdbCommandResult(
+                    returncode=0,
+                    stdout=f"List of devices attached\n{payload}\n",
+                    stderr="",
+                    args=[],
+                )
+            elif len(args) >= 4 and args[0] == "-s" and args[2] == "shell":
+                # adb joins shell arguments with spaces without quoting; keep that.
+                result = await self._server.shell(args[1], " ".join(args[3:]))
+            else:
+                return None
+        except (AdbServerUnavailable, AdbProtocolError, asyncio.TimeoutError, OSError):
+            return None
+        return AdbCommandResult(
+            returncode=result.returncode,
+            stdout=result.stdout,
+            stderr=result.stderr,
+            args=[self.adb_bin or "adb", *args],
+        ).as_dict()
+
+    @staticmethod
+    def parse_devices(stdout: str) -> list[dict[str, str]]:
+        devices: list[dict[str, str]] = []
+        for line in stdout.splitlines():
+            line = line.strip()
+            if not line or line.startswith("List of devices") or line.startswith("*"):
+                continue
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+            entry = {"serial": parts[0], "state": parts[1]}
+            # `devices -l` appends key:value attributes (usb, product, model, device, transport_id).
+            for token in parts[2:]:
+                key, sep, value = token.partition(":")
+                if sep and key in {"product", "model", "device", "transport_id"} and value:
+                    entry[key] = value
+            devices.append(entry)
+        return devices
+
+    @classmethod
+    def parse_probe(cls, serial: str, stdout: str) -> AndroidDeviceFingerprint | None:
+        props: dict[str, str] = {}
+        addresses: list[tuple[str, str]] = []
+        complete = False
+        for raw in stdout.splitlines():
+            line = raw.strip()
+            if not line:
+                continue
+            if line.startswith(_PROBE_MARKER):
+                key, _, value = line[len(_PROBE_MARKER):].partition("=")
+                if key == "end":
+                    complete = True
+                elif value.strip() and value.strip().lower() != "unknown":
+                    props[key] = value.strip()
+                continue
+            parts = line.split()
+            if len(parts) < 2 or parts[1] == "lo":
+                continue
+            ip = cls._extract_ipv4_from_text(line)
+            if ip:
+                addresses.append((parts[1].rstrip(":"), ip))
+        if not complete:
+            # Output from an adb that did not run the script (or a truncated one).
+            return None
+
+        sdk: int | None = None
+        if "ro.build.version.sdk" in props:
+            sdk = cls._as_int(props["ro.build.version.sdk"], 0) or None
+        return AndroidDeviceFingerprint(
+            serial=serial,
+            serialno=props.get("ro.serialno") or props.get("ro.boot.serialno"),
+            model=props.get("ro.product.model"),
+            android_version=props.get("ro.build.version.release"),
+            sdk=sdk,
+            ipv4_addresses=tuple(addresses),
+            wifi_ip=cls._pick_wifi_ip(addresses),
+        )
+
+    @staticmethod
+    def _pick_wifi_ip(addresses: list[tuple[str, str]]) -> str | None:
+        # Same preference as the per-interface probe: known Wi-Fi interfaces
+        # first, then the first private address, then anything non-loopback.
+        by_iface = {iface: ip for iface, ip in addresses}
+        for iface in WIFI_IFACES:
+            if iface in by_iface:
+                return by_iface[iface]
+        first: str | None = None
+        for _iface, ip in addresses:
+            if first is None:
+                first = ip
+            try:
+                if ipaddress.ip_address(ip).is_private:
+                    return ip
+            except ValueError:
+                continue
+        return first
+
     @staticmethod
     def transport_of(serial: str) -> str:
         return "wifi" if ":" in serial else "usb"
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import struct
+from typing import AsyncIterator
+
+from avreamd.domain.models import AdbCommandResult
+
+
+ADB_SERVER_DEFAULT_HOST = "127.0.0.1"
+ADB_SERVER_DEFAULT_PORT = 5037
+
+# shell v2 packet ids (see adb/shell_protocol.h)
+_SHELL_ID_STDOUT = 1
+_SHELL_ID_STDERR = 2
+_SHELL_ID_EXIT = 3
+
+_LEGACY_RC_MARKER = "__AVREAM_RC__:"
+
+
+class AdbServerUnavailable(OSError):
+    """The adb server is not listening (not started yet or wrong address)."""
+
+
+class AdbProtocolError(RuntimeError):
+    """The adb server answered a request with FAIL."""
+
+
+class AdbServerClient:
+    """Asyncio client for the adb server smart-socket protocol.
+
+    The adb server closes a socket after answering a host query and a transport
+    socket is consumed by the service it is switched to, so sockets cannot be
+    reused. The pool therefore caps how many sockets are open at once instead
+    of keeping idle ones around.
+    """
+
+    def __init__(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        *,
+        max_connections: int = 8,
+        connect_timeout_s: float = 1.0,
+        io_timeout_s: float = 15.0,
+    ) -> None:
+        self.host = host or os.getenv("ANDROID_ADB_SERVER_ADDRESS") or ADB_SERVER_DEFAULT_HOST
+        self.port = int(port or os.getenv("ANDROID_ADB_SERVER_PORT") or ADB_SERVER_DEFAULT_PORT)
+        self.connect_timeout_s = connect_timeout_s
+        self.io_timeout_s = io_timeout_s
+        self._slots = asyncio.Semaphore(max(1, int(max_connections)))
+        self._shell_v2: dict[str, bool] = {}
+
+    async def version(self) -> int:
+        payload = await self.host_query("host:version")
+        return int(payload, 16)
+
+    async def devices(self, *, long: bool = False) -> str:
+        return await self.host_query("host:devices-l" if long else "host:devices")
+
+    async def host_query(self, request: str) -> str:
+        async with self._connection() as (reader, writer):
+            await self._request(reader, writer, request)
+            return await asyncio.wait_for(self._read_string(reader), timeout=self.io_timeout_s)
+
+    async def shell(self, serial: str, command: str) -> AdbCommandResult:
+        args = ["shell", command]
+        if self._shell_v2.get(serial, True):
+            try:
+                result = await self._shell_v2_exec(serial, command, args)
+                self._shell_v2[serial] = True
+                return result
+            except AdbProtocolError as exc:
+                if self._is_transport_error(exc):
+                    return AdbCommandResult(returncode=1, stdout="", stderr=f"error: {exc}", args=args)
+                self._shell_v2[serial] = False
+        return await self._shell_legacy_exec(serial, command, args)
+
+    async def track_devices(self, *, long: bool = False) -> AsyncIterator[str]:
+        """Yields the full device list every time the adb server reports a change."""
+        async with self._connection(io_bound=False) as (reader, writer):
+            await self._request(reader, writer, "host:track-devices-l" if long else "host:track-devices")
+            while True:
+                try:
+                    payload = await self._read_string(reader)
+                except asyncio.IncompleteReadError:
+                    return
+                yield payload
+
+    async def _shell_v2_exec(self, serial: str, command: str, args: list[str]) -> AdbCommandResult:
+        async with self._connection() as (reader, writer):
+            await self._request(reader, writer, f"host:transport:{serial}")
+            await self._request(reader, writer, f"shell,v2,raw:{command}")
+            stdout = bytearray()
+            stderr = bytearray()
+            returncode = 1
+            while True:
+                try:
+                    header = await asyncio.wait_for(reader.readexactly(5), timeout=self.io_timeout_s)
+                except asyncio.IncompleteReadError:
+                    break
+                packet_id, length = struct.unpack("<BI", header)
+                data = await asyncio.wait_for(reader.readexactly(length), timeout=self.io_timeout_s)
+                if packet_id == _SHELL_ID_STDOUT:
+                    stdout += data
+                elif packet_id == _SHELL_ID_STDERR:
+                    stderr += data
+                elif packet_id == _SHELL_ID_EXIT:
+                    returncode = data[0] if data else 1
+                    break
+        return AdbCommandResult(
+            returncode=int(returncode),
+            stdout=stdout.decode("utf-8", errors="replace"),
+            stderr=stderr.decode("utf-8", errors="replace"),
+            args=args,
+        )
+
+    async def _shell_legacy_exec(self, serial: str, command: str, args: list[str]) -> AdbCommandResult:
+        # The legacy shell service merges stderr into stdout and has no exit
+        # status, so the status is echoed on a marker line instead.
+        try:
+            async with self._connection() as (reader, writer):
+                await self._request(reader, writer, f"host:transport:{serial}")
+                await self._request(reader, writer, f"shell:{command}; echo {_LEGACY_RC_MARKER}$?")
+                raw = await asyncio.wait_for(reader.read(), timeout=self.io_timeout_s)
+        except AdbProtocolError as exc:
+            return AdbCommandResult(returncode=1, stdout="", stderr=f"error: {exc}", args=args)
+        text = raw.decode("utf-8", errors="replace").replace("\r\n", "\n")
+        returncode = 0
+        head, sep, tail = text.rpartition(_LEGACY_RC_MARKER)
+        if sep:
+            text = head
+            try:
+                returncode = int(tail.strip() or "0")
+            except ValueError:
+                returncode = 1
+        return AdbCommandResult(returncode=returncode, stdout=text, stderr="", args=args)
+
+    @contextlib.asynccontextmanager
+    async def _connection(self, *, io_bound: bool = True):
+        async with self._slots if io_bound else contextlib.nullcontext():
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port),
+                    timeout=self.connect_timeout_s,
+                )
+            except (OSError, TimeoutError) as exc:
+                raise AdbServerUnavailable(f"adb server unreachable at {self.host}:{self.port}: {exc}") from exc
+            try:
+                yield reader, writer
+            finally:
+                writer.close()
+                with contextlib.suppress(Exception):
+                    await writer.wait_closed()
+
+    async def _request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: str) -> None:
+        data = request.encode("utf-8")
+        writer.write(b"%04x" % len(data) + data)
+        await writer.drain()
+        try:
+            status = await asyncio.wait_for(reader.readexactly(4), timeout=self.io_timeout_s)
+        except asyncio.IncompleteReadError as exc:
+            raise AdbProtocolError(f"connection closed while waiting for reply to {request!r}") from exc
+        if status == b"OKAY":
+            return
+        if status == b"FAIL":
+            try:
+                message = await asyncio.wait_for(self._read_string(reader), timeout=self.io_timeout_s)
+            except asyncio.IncompleteReadError:
+                message = "unknown failure"
+            raise AdbProtocolError(message)
+        raise AdbProtocolError(f"unexpected adb server reply {status!r} to {request!r}")
+
+    @staticmethod
+    async def _read_string(reader: asyncio.StreamReader) -> str:
+        length = int((await reader.readexactly(4)).decode("ascii"), 16)
+        data = await reader.readexactly(length) if length else b""
+        return data.decode("utf-8", errors="replace")
+
+    @staticmethod
+    def _is_transport_error(exc: AdbProtocolError) -> bool:
+        text = str(exc).lower()
+        return "not found" in text or "offline" in text or "unauthorized" in text or "no devices" in text
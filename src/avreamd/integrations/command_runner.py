@@ -38,7 +38,14 @@ class CommandRunner:
             stderr=asyncio.subprocess.PIPE,
             env=self._env(),
         )
-        stdout, stderr = await proc.communicate()
+        try:
+            stdout, stderr = await proc.communicate()
+        except BaseException:
+            # Cancelled (e.g. by a caller-side timeout): do not leak the child.
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
         return CommandResult(
             returncode=int(proc.returncode or 0),
             stdout=stdout.decode("utf-8", errors="replace"),
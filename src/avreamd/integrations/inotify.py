@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import functools
+import os
+from pathlib import Path
+import struct
+from typing import AsyncIterator
+
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_CLOSE_NOWRITE = 0x00000010
+IN_OPEN = 0x00000020
+IN_IGNORED = 0x00008000
+
+# struct inotify_event: wd, mask, cookie, len (+ name[len])
+_EVENT = struct.Struct("iIII")
+
+
+@functools.lru_cache(maxsize=1)
+def _libc() -> ctypes.CDLL | None:
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _ = libc.inotify_init1, libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+class InotifyWatch:
+    """Minimal inotify(7) watch on a single path, read through the event loop."""
+
+    def __init__(self, path: Path, mask: int) -> None:
+        self.path = path
+        self.mask = mask
+        self._fd = -1
+
+    @staticmethod
+    def available() -> bool:
+        return _libc() is not None
+
+    def open(self) -> None:
+        libc = _libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        if libc.inotify_add_watch(fd, os.fsencode(str(self.path)), self.mask) < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, os.strerror(err), str(self.path))
+        self._fd = fd
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    async def events(self) -> AsyncIterator[int]:
+        """Yields event masks until the kernel drops the watch (IN_IGNORED, e.g. the node was removed)."""
+        if self._fd < 0:
+            raise RuntimeError("watch is not open")
+        loop = asyncio.get_running_loop()
+        readable = asyncio.Event()
+        loop.add_reader(self._fd, readable.set)
+        try:
+            while True:
+                await readable.wait()
+                readable.clear()
+                try:
+                    data = os.read(self._fd, 4096)
+                except BlockingIOError:
+                    continue
+                offset = 0
+                while offset + _EVENT.size <= len(data):
+                    _wd, mask, _cookie, name_len = _EVENT.unpack_from(data, offset)
+                    offset += _EVENT.size + name_len
+                    yield mask
+                    if mask & IN_IGNORED:
+                        return
+        finally:
+            loop.remove_reader(self._fd)
@@ -1,37 +1,115 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import re
 import shutil
+from typing import Any
 
-from avreamd.integrations.command_runner import CommandRunner
+from avreamd.integrations.command_runner import CommandResult, CommandRunner
+
+
+_SUBSCRIBE_RE = re.compile(r"^Event '([\w-]+)' on ([\w-]+) #(\d+)")
+# What pactl prints for `-f json` when it has no JSON output (getopt, or pactl's own format check).
+_NO_JSON_RE = re.compile(r"invalid option|unrecognized option|invalid format|unknown format", re.IGNORECASE)
+
+
+class PactlSubscription:
+    """A running `pactl subscribe`; iterating yields (event, facility, index).
+
+    The process is already spawned when this is handed out, so events that
+    happen before the first read are buffered rather than missed.
+    """
+
+    def __init__(self, proc: asyncio.subprocess.Process) -> None:
+        self._proc = proc
+
+    def __aiter__(self) -> PactlSubscription:
+        return self
+
+    async def __anext__(self) -> tuple[str, str, int]:
+        assert self._proc.stdout is not None
+        while True:
+            line = await self._proc.stdout.readline()
+            if not line:
+                raise StopAsyncIteration
+            match = _SUBSCRIBE_RE.match(line.decode("utf-8", errors="replace").strip())
+            if match:
+                return match.group(1), match.group(2), int(match.group(3))
+
+    async def aclose(self) -> None:
+        if self._proc.returncode is None:
+            self._proc.kill()
+            await self._proc.wait()
 
 
 class PactlIntegration:
     def __init__(self) -> None:
         self.pactl = shutil.which("pactl")
         self._runner = CommandRunner(env_overrides={"LC_ALL": "C", "LANG": "C"})
+        # None until probed; pactl < 16 has no `-f json`.
+        self._json_supported: bool | None = None
 
     @property
     def available(self) -> bool:
         return bool(self.pactl)
 
-    def load_module(self, name: str, args: list[str]) -> int:
+    async def _run(self, *args: str) -> CommandResult:
         if not self.pactl:
             raise FileNotFoundError("pactl not found")
-        result = self._runner.run_sync([self.pactl, "load-module", name, *args])
+        return await self._runner.run_async([self.pactl, *args])
+
+    async def _list_json(self, *args: str) -> list[dict[str, Any]] | None:
+        """`pactl -f json list ...`, or None when this pactl cannot produce JSON."""
+        if self._json_supported is False:
+            return None
+        result = await self._run("-f", "json", "list", *args)
+        if result.returncode == 0:
+            try:
+                data = json.loads(result.stdout or "[]")
+            except json.JSONDecodeError:
+                data = None
+            if isinstance(data, list):
+                self._json_supported = True
+                return [item for item in data if isinstance(item, dict)]
+        if self._json_supported is None:
+            # Only a definite "no such option/format" settles it; a sound server
+            # that is still starting must not pin the daemon to text parsing.
+            if result.returncode == 0 or _NO_JSON_RE.search(f"{result.stderr}\n{result.stdout}"):
+                self._json_supported = False
+            return None
+        raise RuntimeError((result.stderr or result.stdout or "").strip() or f"pactl list {' '.join(args)} failed")
+
+    async def load_module(self, name: str, args: list[str]) -> int:
+        result = await self._run("load-module", name, *args)
         if result.returncode != 0:
             raise RuntimeError((result.stderr or result.stdout or "").strip() or "pactl load-module failed")
         out = (result.stdout or "").strip()
         return int(out)
 
-    def unload_module(self, module_id: int) -> None:
-        if not self.pactl:
-            raise FileNotFoundError("pactl not found")
-        _ = self._runner.run_sync([self.pactl, "unload-module", str(module_id)])
+    async def unload_module(self, module_id: int) -> None:
+        _ = await self._run("unload-module", str(module_id))
 
-    def list_modules(self) -> list[dict[str, str]]:
-        if not self.pactl:
-            raise FileNotFoundError("pactl not found")
-        result = self._runner.run_sync([self.pactl, "list", "short", "modules"])
+    async def unload_modules(self, module_ids: list[int]) -> list[int]:
+        """Unloads modules concurrently; returns the ids whose unload succeeded."""
+        ids = list(dict.fromkeys(int(mid) for mid in module_ids))
+        results = await asyncio.gather(*(self._run("unload-module", str(mid)) for mid in ids), return_exceptions=True)
+        return [mid for mid, res in zip(ids, results) if isinstance(res, CommandResult) and res.returncode == 0]
+
+    async def list_modules(self) -> list[dict[str, str]]:
+        items = await self._list_json("short", "modules")
+        if items is not None:
+            return [
+                {
+                    "id": str(item.get("index", "")),
+                    "name": str(item.get("name", "")),
+                    "args": str(item.get("argument") or ""),
+                }
+                for item in items
+            ]
+
+        result = await self._run("list", "short", "modules")
         if result.returncode != 0:
             raise RuntimeError((result.stderr or result.stdout or "").strip() or "pactl list modules failed")
 
@@ -49,10 +127,8 @@ class PactlIntegration:
             modules.append({"id": module_id, "name": name, "args": args})
         return modules
 
-    def info(self) -> dict[str, str]:
-        if not self.pactl:
-            raise FileNotFoundError("pactl not found")
-        result = self._runner.run_sync([self.pactl, "info"])
+    async def info(self) -> dict[str, str]:
+        result = await self._run("info")
         if result.returncode != 0:
             raise RuntimeError((result.stderr or result.stdout or "").strip() or "pactl info failed")
 
@@ -64,9 +140,9 @@ class PactlIntegration:
             out[key.strip()] = value.strip()
         return out
 
-    def default_source(self) -> str | None:
+    async def default_source(self) -> str | None:
         try:
-            info = self.info()
+            info = await self.info()
         except (RuntimeError, FileNotFoundError, OSError):  # pactl may not be running
             return None
         source = info.get("Default Source")
@@ -74,14 +150,16 @@ class PactlIntegration:
             return None
         return source
 
-    def list_sources(self) -> list[str]:
-        if not self.pactl:
-            raise FileNotFoundError("pactl not found")
-        result = self._runner.run_sync([self.pactl, "list", "short", "sources"])
+    async def _list_short_names(self, kind: str) -> list[dict[str, str]]:
+        items = await self._list_json("short", kind)
+        if items is not None:
+            return [{"id": str(item.get("index", "")), "name": str(item.get("name", ""))} for item in items]
+
+        result = await self._run("list", "short", kind)
         if result.returncode != 0:
-            raise RuntimeError((result.stderr or result.stdout or "").strip() or "pactl list sources failed")
+            raise RuntimeError((result.stderr or result.stdout or "").strip() or f"pactl list {kind} failed")
 
-        names: list[str] = []
+        out: list[dict[str, str]] = []
         for line in (result.stdout or "").splitlines():
             line = line.strip()
             if not line:
@@ -91,20 +169,41 @@ class PactlIntegration:
                 continue
             name = parts[1].strip()
             if name:
-                names.append(name)
-        return names
+                out.append({"id": parts[0].strip(), "name": name})
+        return out
 
-    def list_sink_inputs_detailed(self) -> list[dict[str, object]]:
-        if not self.pactl:
-            raise FileNotFoundError("pactl not found")
-        result = self._runner.run_sync([self.pactl, "list", "sink-inputs"])
+    async def list_sources(self) -> list[str]:
+        return [entry["name"] for entry in await self._list_short_names("sources")]
+
+    async def list_sinks(self) -> list[dict[str, str]]:
+        return await self._list_short_names("sinks")
+
+    async def list_sink_inputs_detailed(self) -> list[dict[str, object]]:
+        items = await self._list_json("sink-inputs")
+        if items is not None:
+            inputs: list[dict[str, object]] = []
+            for item in items:
+                props = item.get("properties")
+                inputs.append(
+                    {
+                        "id": str(item.get("index", "")),
+                        "sink": str(item.get("sink", "")),
+                        "properties": {str(k): str(v) for k, v in props.items()} if isinstance(props, dict) else {},
+                    }
+                )
+            return inputs
+
+        result = await self._run("list", "sink-inputs")
         if result.returncode != 0:
             raise RuntimeError((result.stderr or result.stdout or "").strip() or "pactl list sink-inputs failed")
+        return self.parse_sink_inputs(result.stdout or "")
 
+    @staticmethod
+    def parse_sink_inputs(text: str) -> list[dict[str, object]]:
         inputs: list[dict[str, object]] = []
         current: dict[str, object] | None = None
         in_props = False
-        for raw in (result.stdout or "").splitlines():
+        for raw in text.splitlines():
             line = raw.rstrip("\n")
             stripped = line.strip()
             if not stripped:
@@ -143,9 +242,22 @@ class PactlIntegration:
             inputs.append(current)
         return inputs
 
-    def move_sink_input(self, sink_input_id: int, sink_name: str) -> None:
+    async def subscribe(self) -> PactlSubscription:
+        """Starts one long-lived `pactl subscribe`; close it with aclose()."""
         if not self.pactl:
             raise FileNotFoundError("pactl not found")
-        result = self._runner.run_sync([self.pactl, "move-sink-input", str(int(sink_input_id)), sink_name])
+        env = os.environ.copy()
+        env.update({"LC_ALL": "C", "LANG": "C"})
+        proc = await asyncio.create_subprocess_exec(
+            self.pactl,
+            "subscribe",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=env,
+        )
+        return PactlSubscription(proc)
+
+    async def move_sink_input(self, sink_input_id: int, sink_name: str) -> None:
+        result = await self._run("move-sink-input", str(int(sink_input_id)), sink_name)
         if result.returncode != 0:
             raise RuntimeError((result.stderr or result.stdout or "").strip() or "pactl move-sink-input failed")
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import shutil
-import subprocess
+
+from avreamd.integrations.command_runner import CommandRunner
 
 
 class PipeWireIntegration:
@@ -9,27 +10,28 @@ class PipeWireIntegration:
         self.pw_cli = shutil.which("pw-cli")
         self.pactl = shutil.which("pactl")
         self.pw_loopback = shutil.which("pw-loopback")
+        self._runner = CommandRunner(env_overrides={"LC_ALL": "C", "LANG": "C"})
 
     def available(self) -> bool:
         return bool(self.pw_cli or self.pactl or self.pw_loopback)
 
-    def running(self) -> bool:
+    async def running(self) -> bool:
         if self.pw_cli:
-            proc = subprocess.run([self.pw_cli, "info", "0"], check=False, capture_output=True)
-            if proc.returncode == 0:
+            result = await self._runner.run_async([self.pw_cli, "info", "0"])
+            if result.returncode == 0:
                 return True
         if self.pactl:
-            proc = subprocess.run([self.pactl, "info"], check=False, capture_output=True)
-            return proc.returncode == 0
+            result = await self._runner.run_async([self.pactl, "info"])
+            return result.returncode == 0
         return False
 
-    def supports_native_virtual_mic(self) -> bool:
-        return bool(self.pw_loopback and self.running())
+    async def supports_native_virtual_mic(self) -> bool:
+        return bool(self.pw_loopback) and await self.running()
 
-    def node_exists(self, node_name: str) -> bool:
+    async def node_exists(self, node_name: str) -> bool:
         if not self.pw_cli:
             return False
-        proc = subprocess.run([self.pw_cli, "ls", "Node"], check=False, capture_output=True, text=True)
-        if proc.returncode != 0:
+        result = await self._runner.run_async([self.pw_cli, "ls", "Node"])
+        if result.returncode != 0:
             return False
-        return f'node.name = "{node_name}"' in proc.stdout
+        return f'node.name = "{node_name}"' in result.stdout
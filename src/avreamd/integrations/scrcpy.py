@@ -1,8 +1,77 @@
 from __future__ import annotations
 
+import re
 import shutil
-from dataclasses import dataclass
-from typing import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+
+# Logged by scrcpy once the decoder has the stream's codec parameters and the
+# v4l2 device is opened; the first frame is pushed right after it.
+V4L2_SINK_READY_MARKER = "v4l2 sink started"
+
+
+def is_v4l2_sink_ready(line: str) -> bool:
+    return V4L2_SINK_READY_MARKER in line
+
+
+@dataclass(frozen=True)
+class ScrcpyEvent:
+    """A known scrcpy output line, parsed.
+
+    kind is one of: version, device, encoder, camera, sink, fps, warning, error.
+    """
+
+    kind: str
+    line: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"kind": self.kind, "line": self.line, **self.data}
+
+
+# "[server] INFO: ..." lines come from the on-device server, the rest from the client.
+_LEVEL_RE = re.compile(r"^(?:\[(?P<origin>server)\]\s+)?(?P<level>VERBOSE|DEBUG|INFO|WARN|ERROR):\s*(?P<msg>.*)$")
+_VERSION_RE = re.compile(r"^scrcpy (?P<version>\d+(?:\.\d+)+)\b")
+_DEVICE_RE = re.compile(r"^Device: \[(?P<manufacturer>[^\]]*)\] (?P<model>.+?)(?: \(Android (?P<android>[^)]+)\))?$")
+_ENCODER_RE = re.compile(r"^Using (?:(?P<stream>video|audio) )?encoder:? '(?P<encoder>[^']+)'")
+_CAMERA_RE = re.compile(r"^Using camera '(?P<camera>[^']+)'")
+_SINK_RE = re.compile(rf"^{V4L2_SINK_READY_MARKER} to device: (?P<device>\S+)")
+_FPS_RE = re.compile(r"^(?P<fps>\d+) fps(?: \(\+(?P<skipped>\d+) frames skipped\))?$")
+
+
+def parse_output_line(line: str) -> ScrcpyEvent | None:
+    """Typed event for a line scrcpy is known to print; None for anything else."""
+    line = line.strip()
+    version = _VERSION_RE.match(line)
+    if version is not None:
+        return ScrcpyEvent("version", line, {"version": version["version"]})
+    level = _LEVEL_RE.match(line)
+    if level is None:
+        return None
+    msg = level["msg"]
+    origin = level["origin"] or "client"
+    if level["level"] == "ERROR":
+        return ScrcpyEvent("error", line, {"message": msg, "origin": origin})
+    if level["level"] == "WARN":
+        return ScrcpyEvent("warning", line, {"message": msg, "origin": origin})
+    if level["level"] != "INFO":
+        return None
+    if (match := _DEVICE_RE.match(msg)) is not None:
+        return ScrcpyEvent(
+            "device",
+            line,
+            {"manufacturer": match["manufacturer"], "model": match["model"], "android": match["android"]},
+        )
+    if (match := _ENCODER_RE.match(msg)) is not None:
+        return ScrcpyEvent("encoder", line, {"stream": match["stream"] or "video", "encoder": match["encoder"]})
+    if (match := _CAMERA_RE.match(msg)) is not None:
+        return ScrcpyEvent("camera", line, {"camera": match["camera"]})
+    if (match := _SINK_RE.match(msg)) is not None:
+        return ScrcpyEvent("sink", line, {"device": match["device"]})
+    if (match := _FPS_RE.match(msg)) is not None:
+        return ScrcpyEvent("fps", line, {"fps": int(match["fps"]), "skipped": int(match["skipped"] or 0)})
+    return None
 
 
 @dataclass(frozen=True)
@@ -56,6 +125,8 @@ class ScrcpyAdapter:
                 "--window-width=640",
                 "--window-height=360",
                 "--no-control",
+                # scrcpy counts frames in its window; without one there is no fps report.
+                "--print-fps",
             ])
         else:
             cmd.append("--no-window")
@@ -1,20 +1,91 @@
 from __future__ import annotations
 
+import fcntl
+import os
 from pathlib import Path
-import subprocess
+import struct
+from typing import Any, NamedTuple
+
+
+# struct v4l2_capability: driver[16] card[32] bus_info[32] version capabilities device_caps reserved[3]
+_V4L2_CAPABILITY = struct.Struct("16s32s32sIII12x")
+# _IOR('V', 0, struct v4l2_capability)
+VIDIOC_QUERYCAP = (2 << 30) | (_V4L2_CAPABILITY.size << 16) | (ord("V") << 8) | 0
+
+# struct v4l2_format: type, pad (the fmt union is 8-byte aligned), fmt.pix, rest of the 200-byte union
+_V4L2_FORMAT_SIZE = 208
+_V4L2_PIX_FORMAT = struct.Struct("I4xIIIIII")  # type, width, height, pixelformat, field, bytesperline, sizeimage
+# _IOWR('V', 4 / 5, struct v4l2_format)
+VIDIOC_G_FMT = (3 << 30) | (_V4L2_FORMAT_SIZE << 16) | (ord("V") << 8) | 4
+VIDIOC_S_FMT = (3 << 30) | (_V4L2_FORMAT_SIZE << 16) | (ord("V") << 8) | 5
+V4L2_BUF_TYPE_VIDEO_OUTPUT = 2
+V4L2_PIX_FMT_YUV420 = int.from_bytes(b"YU12", "little")
+
+
+class PixFormat(NamedTuple):
+    width: int
+    height: int
+    pixelformat: int
+    field: int
+    bytesperline: int
+    sizeimage: int
+
+
+def get_output_format(fd: int) -> PixFormat:
+    """Format the loopback currently carries (kept by the driver while readers stay attached)."""
+    buf = bytearray(_V4L2_FORMAT_SIZE)
+    _V4L2_PIX_FORMAT.pack_into(buf, 0, V4L2_BUF_TYPE_VIDEO_OUTPUT, 0, 0, 0, 0, 0, 0)
+    fcntl.ioctl(fd, VIDIOC_G_FMT, buf)
+    return PixFormat(*_V4L2_PIX_FORMAT.unpack_from(buf, 0)[1:])
+
+
+def set_output_format(fd: int, fmt: PixFormat) -> None:
+    buf = bytearray(_V4L2_FORMAT_SIZE)
+    _V4L2_PIX_FORMAT.pack_into(buf, 0, V4L2_BUF_TYPE_VIDEO_OUTPUT, *fmt)
+    fcntl.ioctl(fd, VIDIOC_S_FMT, buf)
+
+
+_TRUE_TOKENS = {"1", "y", "yes", "true", "on"}
+_FALSE_TOKENS = {"0", "n", "no", "false", "off"}
+
+
+def _split_param_csv(raw: str) -> list[str]:
+    tokens = (token.strip().strip("\"'").strip() for token in raw.strip().split(","))
+    return [token for token in tokens if token]
+
+
+def _parse_bool_token(raw: str) -> bool | None:
+    value = raw.strip().lower()
+    if value in _TRUE_TOKENS:
+        return True
+    if value in _FALSE_TOKENS:
+        return False
+    return None
 
 
 class V4L2LoopbackIntegration:
-    def __init__(self, video_nr: int = 10) -> None:
+    def __init__(
+        self,
+        video_nr: int = 10,
+        *,
+        dev_dir: Path = Path("/dev"),
+        sys_dir: Path = Path("/sys"),
+        proc_modules: Path = Path("/proc/modules"),
+        proc_dir: Path = Path("/proc"),
+    ) -> None:
         self.video_nr = video_nr
+        self._dev_dir = dev_dir
+        self._sys_dir = sys_dir
+        self._proc_modules = proc_modules
+        self._proc_dir = proc_dir
 
     @property
     def device_path(self) -> Path:
-        return Path(f"/dev/video{self.video_nr}")
+        return self._dev_dir / f"video{self.video_nr}"
 
     def module_loaded(self) -> bool:
         try:
-            with open("/proc/modules", "r", encoding="utf-8") as handle:
+            with open(self._proc_modules, "r", encoding="utf-8") as handle:
                 for line in handle:
                     if line.startswith("v4l2loopback "):
                         return True
@@ -25,27 +96,123 @@ class V4L2LoopbackIntegration:
     def device_exists(self) -> bool:
         return self.device_path.exists()
 
-    def device_busy(self) -> bool:
-        cmd = ["fuser", str(self.device_path)]
-        try:
-            proc = subprocess.run(cmd, check=False, capture_output=True, text=True)
-        except FileNotFoundError:
-            return False
-        return proc.returncode == 0 and bool(proc.stdout.strip() or proc.stderr.strip())
+    def device_openers(self) -> list[int]:
+        """PIDs holding the device open, from a /proc/*/fd scan.
 
-    def device_blockers(self) -> list[int]:
-        cmd = ["fuser", str(self.device_path)]
+        Only processes the daemon may inspect (same user) are visible; that
+        covers the desktop apps consuming the camera.
+        """
+        target = str(self.device_path)
+        pids: list[int] = []
         try:
-            proc = subprocess.run(cmd, check=False, capture_output=True, text=True)
-        except FileNotFoundError:
-            return []
-        if proc.returncode != 0:
+            entries = list(os.scandir(self._proc_dir))
+        except OSError:
             return []
-        raw = (proc.stdout or proc.stderr or "").strip()
-        pids: list[int] = []
-        for token in raw.replace(":", " ").split():
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
             try:
-                pids.append(int(token))
-            except ValueError:
+                fds = os.scandir(os.path.join(entry.path, "fd"))
+            except OSError:  # exited or not ours
                 continue
-        return sorted(set(pids))
+            with fds:
+                for fd in fds:
+                    try:
+                        if os.readlink(fd.path) == target:
+                            pids.append(int(entry.name))
+                            break
+                    except OSError:
+                        continue
+        return sorted(pids)
+
+    def device_busy(self) -> bool:
+        return bool(self.device_openers())
+
+    def device_blockers(self) -> list[int]:
+        return self.device_openers()
+
+    def _read_param(self, name: str) -> str | None:
+        try:
+            return (self._sys_dir / "module" / "v4l2loopback" / "parameters" / name).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def query_card(self) -> str | None:
+        """Card label of the device via VIDIOC_QUERYCAP; falls back to the sysfs name."""
+        try:
+            fd = os.open(self.device_path, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError:
+            fd = -1
+        if fd >= 0:
+            try:
+                buf = fcntl.ioctl(fd, VIDIOC_QUERYCAP, bytes(_V4L2_CAPABILITY.size))
+                card = _V4L2_CAPABILITY.unpack(buf)[1]
+                return card.split(b"\0", 1)[0].decode("utf-8", errors="replace").strip()
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+        try:
+            name_path = self._sys_dir / "class" / "video4linux" / f"video{self.video_nr}" / "name"
+            return name_path.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+
+    def inspect(self, *, label: str, exclusive_caps: bool) -> dict[str, Any]:
+        """Unprivileged equivalent of the helper's `v4l2.status`.
+
+        `conclusive` is False when some state could not be read; callers should
+        then ask the helper instead of trusting `requires_reload`.
+        """
+        module_loaded = self.module_loaded()
+        device_exists = self.device_exists()
+        reasons: list[str] = []
+        slot_index: int | None = None
+        config_matches = False
+        conclusive = True
+
+        if not module_loaded:
+            reasons.append("module_not_loaded")
+        else:
+            nr_raw = self._read_param("video_nr")
+            if nr_raw is None:
+                conclusive = False
+            nr_values = _split_param_csv(nr_raw or "")
+            target_nr = str(self.video_nr)
+            slot_index = nr_values.index(target_nr) if target_nr in nr_values else None
+            if nr_raw is not None and slot_index is None:
+                reasons.append("video_nr_not_configured")
+            elif slot_index is not None:
+                label_ok = True
+                excl_ok = True
+                # card_label is not exposed in sysfs; the driver reports it as the card name.
+                card = self.query_card() if device_exists else None
+                if card is None:
+                    conclusive = False
+                elif card != label[:31]:
+                    label_ok = False
+                    reasons.append("label_mismatch")
+
+                excl_values = _split_param_csv(self._read_param("exclusive_caps") or "")
+                if slot_index < len(excl_values):
+                    if _parse_bool_token(excl_values[slot_index]) is not exclusive_caps:
+                        excl_ok = False
+                        reasons.append("exclusive_caps_mismatch")
+                else:
+                    conclusive = False
+                config_matches = label_ok and excl_ok
+
+        if not device_exists:
+            reasons.append("device_missing")
+
+        return {
+            "module_loaded": module_loaded,
+            "device": str(self.device_path),
+            "device_exists": device_exists,
+            "config_matches": config_matches,
+            "requires_reload": not module_loaded or not device_exists or not config_matches,
+            "slot_index": slot_index,
+            "reasons": reasons,
+            # Any definite mismatch settles the answer even if other state was unreadable.
+            "conclusive": conclusive or bool(reasons),
+        }
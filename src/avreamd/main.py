@@ -43,6 +43,15 @@ def configure_logging(paths, log_level: str) -> None:
     root.addHandler(file_handler)
 
 
+def handle_signal(daemon: AvreamDaemon, sig: signal.Signals) -> None:
+    # Camera sessions outlive the daemon only across an explicit restart
+    # (self-update), which leaves a handover marker. Any other SIGTERM
+    # (systemctl stop, logout) and Ctrl-C stop them: with KillMode=process
+    # nothing else would.
+    keep_sessions = sig == signal.SIGTERM and daemon.consume_handover()
+    daemon.request_shutdown(keep_sessions=keep_sessions)
+
+
 async def _run(args: argparse.Namespace) -> int:
     paths = resolve_paths(socket_override=args.socket_path)
     ensure_directories(paths)
@@ -51,14 +60,14 @@ async def _run(args: argparse.Namespace) -> int:
 
     loop = asyncio.get_running_loop()
 
-    def _on_signal() -> None:
-        daemon.request_shutdown()
+    def _on_signal(sig: signal.Signals) -> None:
+        handle_signal(daemon, sig)
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         try:
-            loop.add_signal_handler(sig, _on_signal)
+            loop.add_signal_handler(sig, _on_signal, sig)
         except NotImplementedError:
-            signal.signal(sig, lambda *_: _on_signal())
+            signal.signal(sig, lambda signum, _frame: _on_signal(signal.Signals(signum)))
 
     await daemon.start()
     await daemon.wait_until_shutdown()
@@ -40,42 +40,76 @@ class PipeWireAudioBackend:
         )
         return any(token in args for token in tokens)
 
-    def cleanup_stale_pactl_modules(self) -> list[int]:
+    async def cleanup_stale_pactl_modules(self, extra_ids: list[int] | None = None) -> list[int]:
+        """Unloads leftover AVream modules (plus extra_ids) in one concurrent batch."""
         if not self._pactl.available:
             return []
-        removed: list[int] = []
         try:
-            modules = self._pactl.list_modules()
+            modules = await self._pactl.list_modules()
         except Exception:  # pactl may not be available; return empty list
             return []
 
+        stale: list[int] = []
         for mod in modules:
             if not self._is_avream_pulse_module(mod):
                 continue
             module_id_str = str(mod.get("id", "")).strip()
-            if not module_id_str.isdigit():
-                continue
-            module_id = int(module_id_str)
-            try:
-                self._pactl.unload_module(module_id)
-                removed.append(module_id)
-            except Exception:  # best-effort cleanup; ignore if already unloaded
-                continue
-        return removed
+            if module_id_str.isdigit():
+                stale.append(int(module_id_str))
+        targets = sorted(set(stale) | {int(mid) for mid in (extra_ids or [])})
+        if not targets:
+            return []
+        try:
+            return await self._pactl.unload_modules(targets)
+        except Exception:  # best-effort cleanup; ignore if already unloaded
+            return []
+
+    async def adopt(self, *, state: dict[str, Any], is_active) -> bool:
+        """Takes over the modules a previous daemon loaded, if all of them are still there."""
+        modules = state.get("modules", [])
+        known = {int(mid) for mid in modules if str(mid).strip().isdigit()} if isinstance(modules, list) else set()
+        if not known or not self._pactl.available:
+            return False
+        try:
+            loaded = {
+                int(str(mod.get("id", "")).strip())
+                for mod in await self._pactl.list_modules()
+                if self._is_avream_pulse_module(mod) and str(mod.get("id", "")).strip().isdigit()
+            }
+        except Exception:  # pactl may not be available; nothing to adopt
+            return False
+        if not known <= loaded:
+            return False
+        self._router.start_background(is_active=is_active)
+        return True
+
+    async def set_source_pid(self, pid: int | None) -> dict[str, Any] | None:
+        """Points routing at a (re)started scrcpy and moves its existing stream."""
+        self._router.set_source_pid(pid)
+        if not self._router.active:
+            return None
+        return await self._router.move_once()
+
+    def stream_env(self) -> dict[str, str]:
+        """Environment that makes a client play straight into the AVream sink."""
+        return {
+            "PULSE_SINK": self._sink_name,
+            "PIPEWIRE_PROPS": f"{{ target.object={self._sink_name} node.target={self._sink_name} }}",
+        }
 
     async def start(self, *, is_active) -> dict[str, Any]:
         if self._pactl.available:
             sink_id: int | None = None
             source_id: int | None = None
             try:
-                sink_id = self._pactl.load_module(
+                sink_id = await self._pactl.load_module(
                     "module-null-sink",
                     [
                         f"sink_name={self._sink_name}",
                         "sink_properties=device.description=Hidden_AVream_Bridge device.hidden=1",
                     ],
                 )
-                source_id = self._pactl.load_module(
+                source_id = await self._pactl.load_module(
                     "module-remap-source",
                     [
                         f"master={self._sink_name}.monitor",
@@ -84,14 +118,10 @@ class PipeWireAudioBackend:
                     ],
                 )
             except Exception as exc:
-                if source_id is not None:
-                    try:
-                        self._pactl.unload_module(int(source_id))
-                    except Exception:  # best-effort cleanup; ignore if already unloaded
-                        pass
-                if sink_id is not None:
+                loaded = [int(mid) for mid in (source_id, sink_id) if mid is not None]
+                if loaded:
                     try:
-                        self._pactl.unload_module(int(sink_id))
+                        await self._pactl.unload_modules(loaded)
                     except Exception:  # best-effort cleanup; ignore if already unloaded
                         pass
                 raise dependency_error(
@@ -103,7 +133,7 @@ class PipeWireAudioBackend:
             self._router.start_background(is_active=is_active)
             return {"backend": "pipewire", "modules": [sink_id, source_id], "move_result": move_result}
 
-        if self._pipewire.supports_native_virtual_mic():
+        if await self._pipewire.supports_native_virtual_mic():
             assert self._pipewire.pw_loopback is not None
             cmd = [
                 self._pipewire.pw_loopback,
@@ -141,13 +171,11 @@ class PipeWireAudioBackend:
 
     async def stop(self, *, state: dict[str, Any]) -> None:
         modules = state.get("modules", [])
+        known: list[int] = []
         if isinstance(modules, list):
-            for mid in modules:
-                try:
-                    self._pactl.unload_module(int(mid))
-                except Exception:  # best-effort cleanup; ignore if already unloaded
-                    pass
-        self.cleanup_stale_pactl_modules()
+            known = [int(mid) for mid in modules if str(mid).strip().isdigit()]
+        # One module listing and one concurrent unload batch for known + stale modules.
+        await self.cleanup_stale_pactl_modules(extra_ids=known)
         if self._native_loopback_process is not None:
             try:
                 self._native_loopback_process.terminate()
@@ -1,86 +1,114 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from typing import Any
 
 from avreamd.integrations.pactl import PactlIntegration
 
 
 class ScrcpyAudioRouter:
+    """Moves the supervised scrcpy's sink-input onto the AVream sink.
+
+    Driven by a single `pactl subscribe` stream: only `new` sink-input events
+    trigger a lookup, and streams are matched by `application.process.id`
+    against the scrcpy PID rather than by name.
+    """
+
+    RESUBSCRIBE_BACKOFF_S = 1.0
+
     def __init__(self, *, pactl: PactlIntegration, sink_name: str) -> None:
         self._pactl = pactl
         self._sink_name = sink_name
         self._task: asyncio.Task | None = None
+        self._source_pid: int | None = None
+        self._sink_index: str | None = None
+
+    @property
+    def source_pid(self) -> int | None:
+        return self._source_pid
+
+    @property
+    def active(self) -> bool:
+        return self._task is not None and not self._task.done()
 
-    async def move_once(self) -> dict[str, Any]:
+    def set_source_pid(self, pid: int | None) -> None:
+        self._source_pid = int(pid) if pid else None
+
+    def _matches(self, entry: dict[str, object]) -> bool:
+        props = entry.get("properties")
+        if not isinstance(props, dict):
+            return False
+        if self._source_pid is not None:
+            return str(props.get("application.process.id", "")).strip() == str(self._source_pid)
+        # No supervised scrcpy known (audio started on its own): exact binary only.
+        return str(props.get("application.process.binary", "")).strip() == "scrcpy"
+
+    async def _on_target_sink(self, entry: dict[str, object]) -> bool:
+        # pactl reports a sink-input's sink by index; resolve ours once per start.
+        sink = str(entry.get("sink", ""))
+        if sink == self._sink_name:
+            return True
+        if self._sink_index is None:
+            try:
+                sinks = await self._pactl.list_sinks()
+            except Exception:
+                return False
+            self._sink_index = next((s["id"] for s in sinks if s.get("name") == self._sink_name), None)
+        return self._sink_index is not None and sink == self._sink_index
+
+    async def move_once(self, *, only_id: int | None = None) -> dict[str, Any]:
         if not self._pactl.available:
             return {"moved": 0, "attempts": 0, "reason": "pactl_unavailable"}
 
+        try:
+            sink_inputs = await self._pactl.list_sink_inputs_detailed()
+        except Exception as exc:
+            return {"moved": 0, "attempts": 1, "matched": 0, "error": str(exc)}
+
         moved = 0
-        attempts = 0
+        matched = 0
         last_error: str | None = None
-        for _ in range(12):
-            attempts += 1
+        for entry in sink_inputs:
+            sid_raw = entry.get("id")
+            sid = int(sid_raw) if isinstance(sid_raw, str) and sid_raw.isdigit() else None
+            if sid is None or (only_id is not None and sid != only_id):
+                continue
+            if not self._matches(entry):
+                continue
+            matched += 1
+            if await self._on_target_sink(entry):
+                continue
             try:
-                sink_inputs = self._pactl.list_sink_inputs_detailed()
+                await self._pactl.move_sink_input(sid, self._sink_name)
+                moved += 1
             except Exception as exc:
                 last_error = str(exc)
-                await asyncio.sleep(0.2)
-                continue
-
-            scrcpy_ids: list[int] = []
-            for entry in sink_inputs:
-                sid_raw = entry.get("id")
-                sid = int(sid_raw) if isinstance(sid_raw, str) and sid_raw.isdigit() else None
-                if sid is None:
-                    continue
-                props = entry.get("properties")
-                app_blob = ""
-                if isinstance(props, dict):
-                    app_blob = " ".join(
-                        [
-                            str(props.get("application.name", "")),
-                            str(props.get("application.process.binary", "")),
-                            str(props.get("media.name", "")),
-                        ]
-                    ).lower()
-                if "scrcpy" in app_blob:
-                    scrcpy_ids.append(sid)
-
-            if not scrcpy_ids:
-                await asyncio.sleep(0.2)
-                continue
-
-            for sid in scrcpy_ids:
-                try:
-                    self._pactl.move_sink_input(sid, self._sink_name)
-                    moved += 1
-                except Exception as exc:
-                    last_error = str(exc)
-
-            return {
-                "moved": moved,
-                "attempts": attempts,
-                "matched": len(scrcpy_ids),
-                "error": last_error,
-            }
 
-        return {"moved": moved, "attempts": attempts, "matched": 0, "error": last_error}
+        return {"moved": moved, "attempts": 1, "matched": matched, "error": last_error}
 
     def start_background(self, *, is_active) -> None:
         self.stop_background()
+        self._sink_index = None
 
         async def runner() -> None:
-            while True:
+            while bool(is_active()):
                 try:
-                    if not bool(is_active()):
-                        return
-                    await self.move_once()
-                    await asyncio.sleep(0.8)
+                    # Subscribe first: a stream created during the initial sweep
+                    # then still arrives as an event.
+                    async with contextlib.aclosing(await self._pactl.subscribe()) as events:
+                        await self.move_once()
+                        async for event, facility, index in events:
+                            if not bool(is_active()):
+                                return
+                            if event == "new" and facility == "sink-input":
+                                await self.move_once(only_id=index)
                 except asyncio.CancelledError:
                     return
-                except Exception:
-                    await asyncio.sleep(1.0)
+                except Exception:  # pactl missing/restarting; resubscribe below
+                    pass
+                # The subscription ended (e.g. the sound server restarted).
+                await asyncio.sleep(self.RESUBSCRIBE_BACKOFF_S)
 
         self._task = asyncio.create_task(runner())
 
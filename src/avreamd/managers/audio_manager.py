@@ -44,6 +44,18 @@ class AudioManager:
     def virtual_source_name(self) -> str:
         return self.VIRTUAL_SOURCE_NAME
 
+    def stream_env(self) -> dict[str, str]:
+        """Env for a process whose audio should feed the virtual mic; empty when no sink is up."""
+        if self._active_backend != "pipewire":
+            return {}
+        return self._pipewire_backend.stream_env()
+
+    async def route_source_pid(self, pid: int | None) -> dict[str, object] | None:
+        """Tells the routing fallback which process feeds the virtual mic."""
+        if self._active_backend != "pipewire":
+            return None
+        return await self._pipewire_backend.set_source_pid(pid)
+
     async def start(self, backend: str = "pipewire") -> dict[str, object]:
         async with self._lock:
             snapshot = await self._state_store.snapshot()
@@ -54,13 +66,13 @@ class AudioManager:
             await self._state_store.transition_audio(SubsystemState.STARTING)
             selected = backend
             if backend == "pipewire":
-                if self._pipewire.available() and self._pipewire.running():
+                if self._pipewire.available() and await self._pipewire.running():
                     selected = "pipewire"
                 else:
                     selected = "snd_aloop"
 
             if selected == "pipewire":
-                removed = self._pipewire_backend.cleanup_stale_pactl_modules()
+                removed = await self._pipewire_backend.cleanup_stale_pactl_modules()
                 if removed:
                     self._state_repo.save({"backend": "pipewire_cleanup", "removed_modules": removed})
                 payload = await self._pipewire_backend.start(is_active=lambda: self._active_backend == "pipewire")
@@ -77,6 +89,23 @@ class AudioManager:
             await self._state_store.transition_audio(SubsystemState.RUNNING)
             return {"state": "RUNNING", "already_running": False, "backend": selected}
 
+    async def adopt(self) -> bool:
+        """Resumes a virtual mic left loaded by a previous daemon for a stream that is still running."""
+        async with self._lock:
+            if self._active_backend != "none":
+                return True
+            state_data = self._state_repo.load()
+            if state_data.get("backend") != "pipewire":
+                return False
+            if not await self._pipewire_backend.adopt(
+                state=state_data, is_active=lambda: self._active_backend == "pipewire"
+            ):
+                return False
+            self._active_backend = "pipewire"
+            await self._state_store.transition_audio(SubsystemState.STARTING)
+            await self._state_store.transition_audio(SubsystemState.RUNNING)
+            return True
+
     async def stop(self) -> dict[str, object]:
         async with self._lock:
             snapshot = await self._state_store.snapshot()
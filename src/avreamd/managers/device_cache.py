@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from avreamd.domain.models import AndroidDeviceFingerprint
+
+
+class DeviceInfoCache:
+    """Identity/model/Wi-Fi IP per adb serial.
+
+    Identity never expires. Wi-Fi IPs are trusted for `ip_ttl_s` and dropped as
+    soon as the transport goes away. Only records marked persistent (USB
+    serials, whose serial is tied to the hardware) are written to disk; a
+    Wi-Fi endpoint may belong to another phone after a DHCP change.
+
+    Inside the event loop, changes are written `flush_delay_s` later from a
+    worker thread, so hotplug churn costs one write and no blocking I/O.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_file: Path | None = None,
+        ip_ttl_s: float = 30.0,
+        clock: Callable[[], float] = time.time,
+        flush_delay_s: float = 1.0,
+    ) -> None:
+        self._cache_file = cache_file
+        self._flush_delay_s = flush_delay_s
+        self._saved: str | None = None
+        self._pending: str | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._write_lock = asyncio.Lock()
+        self._ip_ttl_s = float(ip_ttl_s)
+        self._clock = clock
+        self._records: dict[str, dict[str, Any]] = {}
+        self._persistent: set[str] = set()
+        self._load()
+
+    def get(self, serial: str) -> AndroidDeviceFingerprint | None:
+        record = self._records.get(serial)
+        if record is None or not record.get("identity"):
+            return None
+        return AndroidDeviceFingerprint(
+            serial=serial,
+            serialno=record.get("identity"),
+            model=record.get("model"),
+            android_version=record.get("android_version"),
+            wifi_ip=record.get("wifi_ip") if self.ip_fresh(serial) else None,
+        )
+
+    def ip_fresh(self, serial: str) -> bool:
+        record = self._records.get(serial)
+        if record is None:
+            return False
+        seen_at = record.get("ip_seen_at")
+        if not isinstance(seen_at, (int, float)):
+            return False
+        return 0 <= self._clock() - float(seen_at) < self._ip_ttl_s
+
+    def put(self, fingerprint: AndroidDeviceFingerprint, *, persist: bool, with_ip: bool = True) -> None:
+        record = self._records.setdefault(fingerprint.serial, {})
+        record["identity"] = fingerprint.serialno or record.get("identity")
+        record["model"] = fingerprint.model or record.get("model")
+        record["android_version"] = fingerprint.android_version or record.get("android_version")
+        if with_ip:
+            # A missing IP is cached too, so a phone with Wi-Fi off is not re-probed on every scan.
+            record["wifi_ip"] = fingerprint.wifi_ip
+            record["ip_seen_at"] = self._clock()
+        if persist:
+            self._persistent.add(fingerprint.serial)
+            self._save()
+
+    def invalidate_ip(self, serial: str) -> None:
+        record = self._records.get(serial)
+        if record is None or record.get("ip_seen_at") is None:
+            return
+        record["wifi_ip"] = None
+        record["ip_seen_at"] = None
+        if serial in self._persistent:
+            self._save()
+
+    def forget(self, serial: str) -> None:
+        if self._records.pop(serial, None) is None:
+            return
+        if serial in self._persistent:
+            self._persistent.discard(serial)
+            self._save()
+
+    async def flush(self) -> None:
+        """Writes a pending change now instead of after the delay."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+        await self._write_pending()
+
+    def _load(self) -> None:
+        if self._cache_file is None:
+            return
+        try:
+            data = json.loads(self._cache_file.read_text(encoding="utf-8"))
+        except Exception:  # cache file may be absent or corrupt; it is rebuilt on demand
+            return
+        devices = data.get("devices") if isinstance(data, dict) else None
+        if not isinstance(devices, dict):
+            return
+        for serial, record in devices.items():
+            if isinstance(serial, str) and isinstance(record, dict):
+                self._records[serial] = dict(record)
+                self._persistent.add(serial)
+
+    def _save(self) -> None:
+        if self._cache_file is None:
+            return
+        payload = {"devices": {s: self._records[s] for s in sorted(self._persistent) if s in self._records}}
+        text = json.dumps(payload, indent=2)
+        if text == (self._pending or self._saved):
+            return
+        self._pending = text
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._pending = None
+            self._write(text)
+            return
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_delay_s)
+        # Not cancellable by flush() from here on: the write itself is serialized by the lock.
+        self._flush_task = None
+        await self._write_pending()
+
+    async def _write_pending(self) -> None:
+        async with self._write_lock:
+            text, self._pending = self._pending, None
+            if text is not None:
+                await asyncio.to_thread(self._write, text)
+
+    def _write(self, text: str) -> None:
+        assert self._cache_file is not None
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._cache_file.with_suffix(".tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, self._cache_file)
+        except OSError:  # cache is an optimisation; never fail a scan over it
+            return
+        self._saved = text
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from avreamd.core.event_bus import EventBus
+from avreamd.domain.models import AndroidDeviceEntry, AndroidDeviceFingerprint
+from avreamd.integrations.adb import AdbAdapter
+from avreamd.integrations.adb_protocol import AdbProtocolError, AdbServerUnavailable
+from avreamd.managers.device_cache import DeviceInfoCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class AndroidDeviceRegistry:
+    """In-memory serial -> device table kept current by `host:track-devices`.
+
+    When the adb server cannot be tracked (native client disabled or server
+    down) callers transparently fall back to on-demand scans.
+    """
+
+    def __init__(
+        self,
+        *,
+        adb: AdbAdapter,
+        cache: DeviceInfoCache | None = None,
+        event_bus: EventBus | None = None,
+        retry_backoff_s: float = 0.5,
+        retry_backoff_max_s: float = 5.0,
+        poll_interval_s: float = 0.5,
+        max_concurrent_probes: int = 4,
+        probe_timeout_s: float = 4.0,
+        probe_retry_s: float = 30.0,
+        probe_retry_max_s: float = 300.0,
+    ) -> None:
+        self._adb = adb
+        self._cache = cache if cache is not None else DeviceInfoCache()
+        self._event_bus = event_bus
+        self._retry_backoff_s = retry_backoff_s
+        self._retry_backoff_max_s = retry_backoff_max_s
+        self._poll_interval_s = poll_interval_s
+        self._probe_timeout_s = probe_timeout_s
+        self._probe_retry_s = probe_retry_s
+        self._probe_retry_max_s = probe_retry_max_s
+        self._probe_slots = asyncio.Semaphore(max(1, int(max_concurrent_probes)))
+        self._entries: dict[str, AndroidDeviceEntry] = {}
+        self._enrich_tasks: dict[str, asyncio.Task] = {}
+        # serial -> (consecutive failed probes, loop time of the next attempt)
+        self._probe_failures: dict[str, tuple[int, float]] = {}
+        self._version = 0
+        self._changed = asyncio.Event()
+        self._tracking = False
+        self._track_task: asyncio.Task | None = None
+        self._scan_lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def tracking(self) -> bool:
+        return self._tracking
+
+    async def start_background(self) -> None:
+        if self._track_task is not None or not self._adb.available or not self._adb.can_track:
+            return
+        self._track_task = asyncio.create_task(self._track_loop())
+
+    async def stop_background(self) -> None:
+        task, self._track_task = self._track_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except BaseException:
+                pass
+        for enrich in list(self._enrich_tasks.values()):
+            enrich.cancel()
+        self._enrich_tasks.clear()
+        self._probe_failures.clear()
+        self._tracking = False
+        await self._cache.flush()
+
+    async def devices(
+        self, *, probe: bool = True, settle_timeout_s: float = 5.0, rescan: bool = True
+    ) -> list[dict[str, Any]]:
+        # probe=False answers from adb state (and whatever was probed before)
+        # without waiting for, or starting, any per-device shell call.
+        # rescan=False trusts a scan the caller has just made.
+        if not self._tracking and rescan:
+            await self.scan(probe=probe, settle_timeout_s=settle_timeout_s)
+        elif probe:
+            # Retry devices whose earlier probe failed or timed out, once their backoff has expired.
+            self._schedule_enrichment()
+            await self._settle(settle_timeout_s)
+        return self.snapshot()
+
+    def probe_pending(self) -> bool:
+        """True when devices(probe=True) would still probe (or wait for) some connected device."""
+        return bool(self._settling_tasks()) or any(
+            entry.state == "device" and serial not in self._probe_failures and self._needs_probe(entry)
+            for serial, entry in self._entries.items()
+        )
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        return [self._entries[serial].as_dict() for serial in sorted(self._entries)]
+
+    def get(self, serial: str) -> AndroidDeviceEntry | None:
+        return self._entries.get(serial)
+
+    def endpoint_status(self, endpoint: str) -> dict[str, Any]:
+        entry = self._entries.get(endpoint)
+        if entry is not None:
+            return {"endpoint": endpoint, "state": entry.state, "serial": entry.serial, "match": "serial"}
+        # Not connected over Wi-Fi yet: report the USB device it was probed on, if any.
+        host = endpoint.rsplit(":", 1)[0]
+        for serial in sorted(self._entries):
+            candidate = self._entries[serial]
+            if candidate.transport == "usb" and candidate.wifi_candidate_ip == host:
+                return {"endpoint": endpoint, "state": candidate.state, "serial": candidate.serial, "match": "candidate"}
+        return {"endpoint": endpoint, "state": None, "serial": None, "match": None}
+
+    async def scan(self, *, probe: bool = True, settle_timeout_s: float = 5.0) -> None:
+        async with self._scan_lock:
+            self._reconcile(await self._adb.list_devices(), probe=probe)
+            if probe:
+                await self._settle(settle_timeout_s)
+
+    async def wait_for_state(self, serial: str, *, state: str = "device", timeout_s: float = 6.0) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, float(timeout_s))
+        while True:
+            changed = self._changed
+            if not self._tracking:
+                await self.scan(probe=False)
+            entry = self._entries.get(serial)
+            if entry is not None and entry.state == state:
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            if self._tracking:
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(min(self._poll_interval_s, remaining))
+
+    async def _track_loop(self) -> None:
+        backoff = self._retry_backoff_s
+        scanned_since_failure = False
+        while True:
+            try:
+                async for devices in self._adb.track_devices():
+                    self._tracking = True
+                    backoff = self._retry_backoff_s
+                    scanned_since_failure = False
+                    self._reconcile(devices)
+            except asyncio.CancelledError:
+                raise
+            except (AdbServerUnavailable, AdbProtocolError, asyncio.TimeoutError, OSError) as exc:
+                logger.debug("adb track-devices unavailable: %s", exc)
+            self._tracking = False
+            if not scanned_since_failure:
+                # The adb binary starts the server as a side effect, so the next
+                # tracking attempt usually succeeds.
+                scanned_since_failure = True
+                try:
+                    await self.scan()
+                except Exception as exc:
+                    logger.debug("adb device scan failed: %s", exc)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self._retry_backoff_max_s)
+
+    def _reconcile(self, devices: list[dict[str, str]], *, probe: bool = True) -> None:
+        changed = False
+        seen: set[str] = set()
+        for dev in devices:
+            serial = str(dev.get("serial", "")).strip()
+            state = str(dev.get("state", "")).strip()
+            if not serial:
+                continue
+            seen.add(serial)
+            entry = self._entries.get(serial)
+            if entry is None:
+                entry = AndroidDeviceEntry(serial=serial, state=state, transport=self._adb.transport_of(serial))
+                self._entries[serial] = entry
+                changed = True
+            elif entry.state != state:
+                entry.state = state
+                changed = True
+            model = dev.get("model")
+            if model and entry.model != model:
+                entry.model = str(model)
+                changed = True
+
+            if state != "device":
+                self._cancel_enrichment(serial)
+                # Reconnected devices get a fresh probe rather than the old backoff.
+                self._probe_failures.pop(serial, None)
+                self._forget_transport(entry)
+                if entry.enriched:
+                    entry.enriched = False
+                    entry.wifi_candidate_ip = None
+                    changed = True
+
+        for serial in [s for s in self._entries if s not in seen]:
+            self._cancel_enrichment(serial)
+            self._probe_failures.pop(serial, None)
+            self._forget_transport(self._entries.pop(serial))
+            changed = True
+
+        if probe:
+            self._schedule_enrichment()
+        if changed:
+            self._bump()
+
+    def _forget_transport(self, entry: AndroidDeviceEntry) -> None:
+        # Addresses may change while the device is away; identity of a USB
+        # serial does not, but a Wi-Fi endpoint may come back as another phone.
+        if entry.transport == "usb":
+            self._cache.invalidate_ip(entry.serial)
+        else:
+            self._cache.forget(entry.serial)
+            entry.identity = None
+
+    def _needs_probe(self, entry: AndroidDeviceEntry) -> bool:
+        failure = self._probe_failures.get(entry.serial)
+        if failure is not None and asyncio.get_running_loop().time() < failure[1]:
+            return False
+        if not entry.enriched:
+            return True
+        return entry.transport == "usb" and not self._cache.ip_fresh(entry.serial)
+
+    def _schedule_enrichment(self) -> None:
+        for serial, entry in self._entries.items():
+            if entry.state == "device" and serial not in self._enrich_tasks and self._needs_probe(entry):
+                self._enrich_tasks[serial] = asyncio.create_task(self._enrich(serial))
+
+    async def _probe(self, entry: AndroidDeviceEntry) -> AndroidDeviceFingerprint:
+        usb = entry.transport == "usb"
+        cached = self._cache.get(entry.serial)
+        if cached is not None and (not usb or self._cache.ip_fresh(entry.serial)):
+            return cached
+        fingerprint = await self._probe_uncached(entry)
+        self._cache.put(fingerprint, persist=usb, with_ip=usb)
+        return fingerprint
+
+    async def _probe_uncached(self, entry: AndroidDeviceEntry) -> AndroidDeviceFingerprint:
+        fingerprint = await self._adb.probe_device(serial=entry.serial)
+        if fingerprint is not None:
+            return fingerprint
+        # The shell answered but could not run the batched probe: fall back to
+        # per-property calls. An unreachable device raises AdbTransportError
+        # instead, which would fail every one of them as well.
+        identity = entry.identity or await self._adb.legacy_identity(serial=entry.serial)
+        ip = await self._adb.legacy_ip(serial=entry.serial) if entry.transport == "usb" else None
+        return AndroidDeviceFingerprint(serial=entry.serial, serialno=identity, wifi_ip=ip)
+
+    async def _enrich(self, serial: str) -> None:
+        try:
+            entry = self._entries.get(serial)
+            if entry is None:
+                return
+            async with self._probe_slots:
+                fingerprint = await asyncio.wait_for(self._probe(entry), timeout=self._probe_timeout_s)
+            current = self._entries.get(serial)
+            if current is None or current.state != "device":
+                return
+            before = current.as_dict()
+            current.identity = current.identity or fingerprint.serialno
+            current.wifi_candidate_ip = fingerprint.wifi_ip if current.transport == "usb" else None
+            current.model = fingerprint.model or current.model
+            current.android_version = fingerprint.android_version or current.android_version
+            current.enriched = True
+            self._probe_failures.pop(serial, None)
+            if current.as_dict() != before:
+                self._bump()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.debug("failed to probe adb device %s: %s", serial, exc)
+            self._record_probe_failure(serial)
+        finally:
+            if self._enrich_tasks.get(serial) is asyncio.current_task():
+                self._enrich_tasks.pop(serial, None)
+
+    def _record_probe_failure(self, serial: str) -> None:
+        failures = self._probe_failures.get(serial, (0, 0.0))[0] + 1
+        delay = min(self._probe_retry_s * 2 ** (failures - 1), self._probe_retry_max_s)
+        self._probe_failures[serial] = (failures, asyncio.get_running_loop().time() + delay)
+
+    def _settling_tasks(self) -> list[asyncio.Task]:
+        # Retries of devices that already failed run in the background: callers
+        # must not stall on a phone that keeps timing out.
+        return [task for serial, task in self._enrich_tasks.items() if serial not in self._probe_failures]
+
+    async def _settle(self, timeout_s: float) -> None:
+        pending = self._settling_tasks()
+        if pending:
+            await asyncio.wait(pending, timeout=max(0.0, float(timeout_s)))
+
+    def _cancel_enrichment(self, serial: str) -> None:
+        task = self._enrich_tasks.pop(serial, None)
+        if task is not None:
+            task.cancel()
+
+    def _bump(self) -> None:
+        self._version += 1
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+        if self._event_bus is not None:
+            self._event_bus.publish("devices.changed", {"version": self._version, "devices": self.snapshot()})
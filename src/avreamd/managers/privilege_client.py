@@ -2,14 +2,39 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+from dataclasses import dataclass
 import json
 import os
 from pathlib import Path
 import shutil
 import stat
+from typing import Any, Sequence
 from uuid import uuid4
 
-from avreamd.api.errors import backend_error, busy_device_error, permission_error, timeout_error, unsupported_error
+from avreamd.api.errors import (
+    ApiError,
+    backend_error,
+    busy_device_error,
+    permission_error,
+    timeout_error,
+    unsupported_error,
+)
+
+
+@dataclass(frozen=True)
+class PrivilegedResult:
+    action: str
+    data: dict[str, object] | None = None
+    error: ApiError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> dict[str, object]:
+        if self.error is not None:
+            raise self.error
+        return self.data or {}
 
 
 class PrivilegeClient:
@@ -33,22 +58,112 @@ class PrivilegeClient:
         # - direct: run helper directly (dev only)
         self.mode = os.getenv("AVREAM_HELPER_MODE", "pkexec")
         self.timeout_s = float(os.getenv("AVREAM_HELPER_TIMEOUT", "15"))
+        # None until the helper has answered a batch request (older helpers lack it).
+        self._batch_supported: bool | None = None
 
     async def call(self, action: str, params: dict[str, object]) -> dict[str, object]:
+        self._validate_action(action, params)
+        request = {
+            "request_id": str(uuid4()),
+            "action": action,
+            "params": params,
+        }
+        response = await self._invoke(request, action=action)
+        if not response.get("ok", False):
+            raise self._map_helper_error(action, response.get("error") or {})
+
+        data = response.get("data", {})
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    async def call_batch(
+        self,
+        requests: Sequence[tuple[str, dict[str, object]]],
+        *,
+        stop_on_error: bool = True,
+    ) -> list[PrivilegedResult]:
+        """Runs an ordered list of actions under a single elevation.
+
+        Per-action helper errors are mapped exactly like `call` and returned in
+        the result instead of raised. With stop_on_error, actions after the
+        first failure are skipped. Falls back to one `call` per action when the
+        installed helper predates the `batch` action.
+        """
+        for action, params in requests:
+            self._validate_action(action, params)
+        if not requests:
+            return []
+        if len(requests) == 1 or self._batch_supported is False:
+            return await self._call_sequential(requests, stop_on_error=stop_on_error)
+
+        request = {
+            "request_id": str(uuid4()),
+            "action": "batch",
+            "params": {
+                "requests": [{"action": action, "params": params} for action, params in requests],
+                "stop_on_error": stop_on_error,
+            },
+        }
+        response = await self._invoke(request, action="batch")
+        if not response.get("ok", False):
+            err = response.get("error") or {}
+            if err.get("code") == "E_ACTION" and self._batch_supported is None:
+                self._batch_supported = False
+                return await self._call_sequential(requests, stop_on_error=stop_on_error)
+            raise self._map_helper_error("batch", err)
+        self._batch_supported = True
+
+        data = response.get("data")
+        entries = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(entries, list) or len(entries) != len(requests):
+            raise backend_error("invalid batch response from helper", {"action": "batch"})
+
+        results: list[PrivilegedResult] = []
+        for (action, _params), entry in zip(requests, entries):
+            entry = entry if isinstance(entry, dict) else {}
+            if entry.get("ok", False):
+                payload = entry.get("data", {})
+                results.append(PrivilegedResult(action=action, data=payload if isinstance(payload, dict) else {}))
+            else:
+                error = self._map_helper_error(action, entry.get("error") or {})
+                results.append(PrivilegedResult(action=action, error=error))
+        return results
+
+    async def _call_sequential(
+        self,
+        requests: Sequence[tuple[str, dict[str, object]]],
+        *,
+        stop_on_error: bool,
+    ) -> list[PrivilegedResult]:
+        results: list[PrivilegedResult] = []
+        failed = False
+        for action, params in requests:
+            if failed and stop_on_error:
+                error = self._map_helper_error(
+                    action, {"code": "E_SKIPPED", "message": "skipped after an earlier action failed"}
+                )
+                results.append(PrivilegedResult(action=action, error=error))
+                continue
+            try:
+                results.append(PrivilegedResult(action=action, data=await self.call(action, params)))
+            except ApiError as exc:
+                failed = True
+                results.append(PrivilegedResult(action=action, error=exc))
+        return results
+
+    def _validate_action(self, action: str, params: object) -> None:
         if action not in self.ALLOWED_ACTIONS:
             raise unsupported_error("unsupported privileged action", {"action": action})
         if not isinstance(params, dict):
             raise unsupported_error("privileged action params must be an object", {"action": action})
 
+    async def _invoke(self, request: dict[str, object], *, action: str) -> dict[str, Any]:
+        """Runs the helper once with `request` and returns its decoded JSON response."""
         helper_path = Path(self.helper_bin)
         if not helper_path.is_absolute():
             raise permission_error("helper path must be absolute", {"binary": self.helper_bin})
 
-        request = {
-            "request_id": str(uuid4()),
-            "action": action,
-            "params": params,
-        }
         payload = json.dumps(request).encode("utf-8")
 
         cmd = self._helper_command()
@@ -102,25 +217,24 @@ class PrivilegeClient:
         except json.JSONDecodeError as exc:
             raise backend_error("invalid response from helper", {"action": action}) from exc
 
-        if not response.get("ok", False):
-            err = response.get("error") or {}
-            code = err.get("code", "E_HELPER_FAILED")
-            message = err.get("message", "helper action failed")
-            if code == "E_BUSY_DEVICE":
-                raise busy_device_error(
-                    message,
-                    {"action": action, "helper_code": code, "error": err},
-                )
-            if code in {"E_ACTION", "E_INVALID_PARAM"}:
-                raise unsupported_error(message, {"action": action, "helper_code": code, "error": err})
-            if code == "E_TIMEOUT":
-                raise timeout_error(message, {"action": action, "helper_code": code, "error": err})
-            raise backend_error(message, {"action": action, "helper_code": code, "error": err}, retryable=False)
+        if not isinstance(response, dict):
+            raise backend_error("invalid response from helper", {"action": action})
+        return response
 
-        data = response.get("data", {})
-        if not isinstance(data, dict):
-            return {}
-        return data
+    @staticmethod
+    def _map_helper_error(action: str, err: dict[str, Any]) -> ApiError:
+        code = err.get("code", "E_HELPER_FAILED")
+        message = err.get("message", "helper action failed")
+        if code == "E_BUSY_DEVICE":
+            return busy_device_error(
+                message,
+                {"action": action, "helper_code": code, "error": err},
+            )
+        if code in {"E_ACTION", "E_INVALID_PARAM"}:
+            return unsupported_error(message, {"action": action, "helper_code": code, "error": err})
+        if code == "E_TIMEOUT":
+            return timeout_error(message, {"action": action, "helper_code": code, "error": err})
+        return backend_error(message, {"action": action, "helper_code": code, "error": err}, retryable=False)
 
     async def _exec_helper(
         self,
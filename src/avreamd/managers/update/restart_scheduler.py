@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import os
+from pathlib import Path
 import subprocess
 
 
 class RestartScheduler:
+    def __init__(self, handover_path: Path | None = None) -> None:
+        self._handover_path = handover_path
+
     def schedule_daemon_restart(self) -> None:
+        # The marker names this daemon, so only the SIGTERM of this restart
+        # leaves the camera sessions running for the next daemon.
+        if self._handover_path is not None:
+            self._handover_path.parent.mkdir(parents=True, exist_ok=True)
+            self._handover_path.write_text(str(os.getpid()), encoding="utf-8")
         cmd = [
             "bash",
             "-lc",
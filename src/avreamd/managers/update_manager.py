@@ -12,7 +12,7 @@ from typing import Any
 
 from avreamd import __version__
 from avreamd.api.errors import backend_error, conflict_error, validation_error
-from avreamd.constants import UPDATE_LOG_MAXLEN
+from avreamd.constants import HANDOVER_FILENAME, UPDATE_LOG_MAXLEN
 from avreamd.managers.update import AssetDownloader, ChecksumVerifier, PackageInstaller, ReleaseClient, RestartScheduler
 
 logger = logging.getLogger(__name__)
@@ -26,8 +26,10 @@ class UpdateManager:
         state_store,
         video_manager,
         audio_manager,
+        event_bus=None,
     ) -> None:
         self._paths = paths
+        self._event_bus = event_bus
         self._state_store = state_store
         self._video_manager = video_manager
         self._audio_manager = audio_manager
@@ -44,7 +46,7 @@ class UpdateManager:
         self._downloader = AssetDownloader()
         self._verifier = ChecksumVerifier()
         self._installer = PackageInstaller(install_tool=self._install_tool)
-        self._restart_scheduler = RestartScheduler()
+        self._restart_scheduler = RestartScheduler(handover_path=self._paths.runtime_dir / HANDOVER_FILENAME)
 
         self._cfg_path = self._paths.config_dir / "update.json"
         self._state_path = self._paths.state_dir / "update-state.json"
@@ -315,9 +317,23 @@ class UpdateManager:
     def _save_state(self) -> None:
         self._state_path.parent.mkdir(parents=True, exist_ok=True)
         self._state_path.write_text(json.dumps(self._runtime, indent=2) + "\n", encoding="utf-8")
+        if self._event_bus is not None:
+            self._event_bus.publish(
+                "update.state",
+                {
+                    "install_state": self._runtime.get("install_state"),
+                    "progress": self._runtime.get("progress"),
+                    "update_available": self._runtime.get("update_available"),
+                    "latest_version": self._runtime.get("latest_version"),
+                    "last_error": self._runtime.get("last_error"),
+                },
+            )
 
     def _append_log(self, event: str, data: dict[str, Any] | None = None) -> None:
-        self._logs.append({"ts": self._now_iso(), "event": event, "data": data or {}})
+        entry = {"ts": self._now_iso(), "event": event, "data": data or {}}
+        self._logs.append(entry)
+        if self._event_bus is not None:
+            self._event_bus.publish("update.log", entry)
 
     async def _auto_loop(self) -> None:
         while not self._stop_event.is_set():
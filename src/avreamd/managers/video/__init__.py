@@ -1,11 +1,17 @@
 """Video manager support services."""
 
 from avreamd.managers.video.device_reset import VideoDeviceResetService
+from avreamd.managers.video.loopback_pool import LoopbackDevicePool
+from avreamd.managers.video.on_demand import VideoOnDemandController
+from avreamd.managers.video.placeholder import PlaceholderFrameWriter
 from avreamd.managers.video.reconnect import VideoReconnectController
 from avreamd.managers.video.session import VideoSessionService
 
 __all__ = [
+    "LoopbackDevicePool",
+    "PlaceholderFrameWriter",
     "VideoDeviceResetService",
+    "VideoOnDemandController",
     "VideoReconnectController",
     "VideoSessionService",
 ]
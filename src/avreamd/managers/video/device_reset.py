@@ -1,71 +1,130 @@
 from __future__ import annotations
 
+import asyncio
+import signal
+import time
 from typing import Any
 
 from avreamd.api.errors import ApiError, busy_device_error
 from avreamd.integrations.v4l2loopback import V4L2LoopbackIntegration
 from avreamd.managers.privilege_client import PrivilegeClient
+from avreamd.managers.video.loopback_pool import LoopbackDevicePool
 
 
 class VideoDeviceResetService:
+    """Owns the loopback device lifecycle.
+
+    The device is reloaded only when it is known to be dirty: the helper reported
+    a config mismatch that was not fixed, or the last writer did not exit cleanly.
+    A reload always covers the whole device pool, since all nodes share the module,
+    so dirty reasons live on the pool and a reload waits until no node is open.
+    """
+
+    # scrcpy exits 0 on SIGTERM; a bare signal death is reported as -signum.
+    CLEAN_EXIT_CODES = frozenset({0, -signal.SIGTERM, -signal.SIGINT})
+
     def __init__(
         self,
         *,
         privilege_client: PrivilegeClient,
         v4l2: V4L2LoopbackIntegration,
+        pool: LoopbackDevicePool | None = None,
     ) -> None:
         self._privilege_client = privilege_client
         self._v4l2 = v4l2
+        # Without a pool the device is a module load of its own.
+        self._pool = pool or LoopbackDevicePool(base_nr=v4l2.video_nr, max_devices=1, device_factory=lambda _nr: v4l2)
+
+    @property
+    def dirty_reasons(self) -> list[str]:
+        return list(self._pool.dirty_reasons)
+
+    def mark_dirty(self, reason: str) -> None:
+        if reason not in self._pool.dirty_reasons:
+            self._pool.dirty_reasons.append(reason)
+
+    def note_writer_exit(self, returncode: int | None) -> None:
+        """Records how the v4l2 writer ended; anything but a clean exit dirties the device."""
+        if returncode is not None and returncode not in self.CLEAN_EXIT_CODES:
+            self.mark_dirty(f"writer_exit_{returncode}")
 
     async def ensure_ready(self) -> None:
-        status = await self._privilege_client.call(
-            "v4l2.status",
-            {
-                "video_nr": self._v4l2.video_nr,
-                "label": "AVream Camera",
-                "exclusive_caps": True,
-            },
+        # Another session may be reloading the module; its result decides ours.
+        async with self._pool.reload_lock:
+            await self._ensure_ready_unlocked()
+
+    async def _ensure_ready_unlocked(self) -> None:
+        # sysfs + VIDIOC_QUERYCAP are readable unprivileged; the helper (pkexec/
+        # systemd-run) is only needed to change the module or when state is unreadable.
+        params = self._pool.helper_params()
+        reload_params = {**params, "force": False, "always_reload": False}
+        # Checks every pool node, so a later session never needs to reload a module in use.
+        status: Any = self._pool.inspect()
+        if status.get("conclusive", False):
+            if not status.get("requires_reload", False):
+                return
+            self.mark_dirty("config_mismatch")
+            self._note_reload(await self._privilege_client.call("v4l2.reload", reload_params))
+            return
+
+        # One elevation: the helper's reload is a no-op when its status says ready.
+        status_result, reload_result = await self._privilege_client.call_batch(
+            [("v4l2.status", params), ("v4l2.reload", reload_params)]
         )
-        if isinstance(status, dict) and bool(status.get("requires_reload", False)):
-            await self._privilege_client.call(
-                "v4l2.reload",
-                {
-                    "video_nr": self._v4l2.video_nr,
-                    "label": "AVream Camera",
-                    "exclusive_caps": True,
-                    "force": False,
-                    "always_reload": False,
-                },
-            )
+        status = status_result.unwrap()
+        if bool(status.get("requires_reload", False)):
+            # Stays dirty if the reload failed, so the next stop retries it.
+            self.mark_dirty("config_mismatch")
+        self._note_reload(reload_result.unwrap())
+
+    def _note_reload(self, data: dict[str, Any]) -> None:
+        # A fresh module load clears every dirty reason; a skipped reload clears nothing.
+        if bool(data.get("reloaded", True)):
+            self._pool.dirty_reasons.clear()
 
     async def best_effort_reload_after_stop(self) -> dict[str, Any]:
+        started = time.monotonic()
+        reasons = self.dirty_reasons
+        if not reasons:
+            return {"ok": True, "action": "skipped", "reasons": [], "duration_ms": 0}
         try:
-            data = await self._privilege_client.call(
-                "v4l2.reload",
-                {
-                    "video_nr": self._v4l2.video_nr,
-                    "label": "AVream Camera",
-                    "exclusive_caps": True,
-                    "force": False,
-                    "always_reload": True,
-                },
-            )
-            return {"ok": True, "result": data}
+            async with self._pool.reload_lock:
+                busy = await asyncio.to_thread(self._pool.busy_slots)
+                if busy:
+                    # The helper refuses to unload the module while any node is open
+                    # (another session streaming); the stop that frees the last one reloads.
+                    return {
+                        "ok": True,
+                        "action": "deferred",
+                        "reasons": reasons,
+                        "busy_slots": busy,
+                        "duration_ms": int((time.monotonic() - started) * 1000),
+                    }
+                data = await self._privilege_client.call(
+                    "v4l2.reload", self._pool.helper_params(force=False, always_reload=True)
+                )
         except Exception as exc:
-            return {"ok": False, "error": str(exc)}
+            return {
+                "ok": False,
+                "action": "reload",
+                "reasons": reasons,
+                "error": str(exc),
+                "duration_ms": int((time.monotonic() - started) * 1000),
+            }
+        self._pool.dirty_reasons.clear()
+        return {
+            "ok": True,
+            "action": "reload",
+            "reasons": reasons,
+            "result": data,
+            "duration_ms": int((time.monotonic() - started) * 1000),
+        }
 
     async def reset(self, *, force: bool) -> dict[str, Any]:
         result: dict[str, Any] | None = None
         try:
-            result = await self._privilege_client.call(
-                "v4l2.reload",
-                {
-                    "video_nr": self._v4l2.video_nr,
-                    "label": "AVream Camera",
-                    "exclusive_caps": True,
-                    "force": bool(force),
-                },
-            )
+            async with self._pool.reload_lock:
+                result = await self._privilege_client.call("v4l2.reload", self._pool.helper_params(force=bool(force)))
         except ApiError as exc:
             if exc.code == "E_BUSY_DEVICE":
                 blockers = self._v4l2.device_blockers()
@@ -79,6 +138,7 @@ class VideoDeviceResetService:
                 raise busy_device_error("cannot reset while target v4l2 device is in use", details)
             raise
 
+        self._pool.dirty_reasons.clear()
         helper_status = None
         if isinstance(result, dict):
             helper_status = result.get("status_after") or result.get("status_before")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable
+
+from avreamd.constants import MAX_VIDEO_SESSIONS
+from avreamd.integrations.v4l2loopback import V4L2LoopbackIntegration
+
+
+class LoopbackDevicePool:
+    """The v4l2loopback nodes owned by AVream, one per camera session.
+
+    Slot 0 is /dev/video<base_nr> labelled "AVream Camera"; slot N is
+    /dev/video<base_nr + N> labelled "AVream Camera <N + 1>". All nodes belong
+    to one module load, so helper params always describe the whole pool and
+    reloads run under `reload_lock`. The module is loaded with all
+    `max_devices` nodes up front: unloading it to add a node would fail while
+    another session streams, so a later session must find its node present.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_nr: int = 10,
+        label: str = "AVream Camera",
+        max_devices: int = MAX_VIDEO_SESSIONS,
+        device_factory: Callable[[int], V4L2LoopbackIntegration] = V4L2LoopbackIntegration,
+    ) -> None:
+        self.base_nr = base_nr
+        self.label = label
+        self.max_devices = max_devices
+        self.reload_lock = asyncio.Lock()
+        # Why the module needs a fresh load. Shared by all sessions: one reload covers every node.
+        self.dirty_reasons: list[str] = []
+        self._device_factory = device_factory
+        self._devices: dict[int, V4L2LoopbackIntegration] = {}
+
+    def device(self, slot: int) -> V4L2LoopbackIntegration:
+        if not 0 <= slot < self.max_devices:
+            raise ValueError(f"slot {slot} outside pool of {self.max_devices}")
+        if slot not in self._devices:
+            self._devices[slot] = self._device_factory(self.base_nr + slot)
+        return self._devices[slot]
+
+    def slot_of(self, v4l2: V4L2LoopbackIntegration) -> int:
+        return v4l2.video_nr - self.base_nr
+
+    def label_for(self, slot: int) -> str:
+        return self.label if slot == 0 else f"{self.label} {slot + 1}"
+
+    def inspect(self) -> dict[str, Any]:
+        """Native status of every node; the pool needs a reload when any node does."""
+        statuses = [
+            self.device(slot).inspect(label=self.label_for(slot), exclusive_caps=True)
+            for slot in range(self.max_devices)
+        ]
+        # A definite mismatch on any node settles it; "ready" needs every node to be readable.
+        if any(s.get("conclusive", False) and s.get("requires_reload", False) for s in statuses):
+            conclusive, requires_reload = True, True
+        else:
+            conclusive, requires_reload = all(s.get("conclusive", False) for s in statuses), False
+        return {
+            "conclusive": conclusive,
+            "requires_reload": requires_reload,
+            "reasons": [
+                reason if slot == 0 else f"video{self.base_nr + slot}:{reason}"
+                for slot, status in enumerate(statuses)
+                for reason in status.get("reasons", [])
+            ],
+        }
+
+    def busy_slots(self) -> list[int]:
+        """Slots whose node some process holds open (writer or consumer); scans /proc, so it blocks."""
+        return [slot for slot in range(self.max_devices) if self.device(slot).device_busy()]
+
+    def helper_params(self, **extra: Any) -> dict[str, Any]:
+        params: dict[str, Any] = {"video_nr": self.base_nr, "label": self.label, "exclusive_caps": True}
+        if self.max_devices > 1:
+            params["devices"] = self.max_devices
+        params.update(extra)
+        return params
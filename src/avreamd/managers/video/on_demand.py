@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+from typing import Awaitable, Callable
+
+from avreamd.constants import DEFAULT_ON_DEMAND_IDLE_GRACE_S
+from avreamd.core.event_bus import EventBus
+from avreamd.integrations.inotify import IN_CLOSE_NOWRITE, IN_CLOSE_WRITE, IN_OPEN, InotifyWatch
+from avreamd.integrations.v4l2loopback import V4L2LoopbackIntegration
+
+
+logger = logging.getLogger(__name__)
+
+
+class VideoOnDemandController:
+    """Runs the video backend only while some app has the loopback device open.
+
+    Opens/closes of the device node are watched with inotify and attributed by
+    scanning /proc/*/fd (off the event loop, once per burst of events), ignoring
+    the daemon and the backend's own process group. An open alone is not demand:
+    the daemon opens the node itself to inspect it, so only a process found
+    holding it counts.
+    """
+
+    POLL_INTERVAL_S = 1.0
+    DEBOUNCE_S = 0.1
+    WATCH_MASK = IN_OPEN | IN_CLOSE_WRITE | IN_CLOSE_NOWRITE
+
+    def __init__(
+        self,
+        *,
+        v4l2: V4L2LoopbackIntegration,
+        event_bus: EventBus | None = None,
+        watch_factory: Callable[..., InotifyWatch] = InotifyWatch,
+        session: str | None = None,
+    ) -> None:
+        self._session = session
+        self._v4l2 = v4l2
+        self._event_bus = event_bus
+        self._watch_factory = watch_factory
+        self._task: asyncio.Task | None = None
+        self._idle_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self._on_demand: Callable[[], Awaitable[object]] | None = None
+        self._on_idle: Callable[[], Awaitable[object]] | None = None
+        self._writer_pgid: Callable[[], int | None] = lambda: None
+        self.idle_grace_s = DEFAULT_ON_DEMAND_IDLE_GRACE_S
+        self._state = "off"
+        self._consumers: list[int] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def runtime_status(self) -> dict[str, object]:
+        return {
+            "enabled": self.enabled,
+            "state": self._state,
+            "consumers": list(self._consumers),
+            "idle_grace_s": self.idle_grace_s,
+        }
+
+    def arm(
+        self,
+        *,
+        on_demand: Callable[[], Awaitable[object]],
+        on_idle: Callable[[], Awaitable[object]],
+        writer_pgid: Callable[[], int | None],
+        streaming: bool = False,
+        idle_grace_s: float | None = None,
+    ) -> None:
+        self.disarm()
+        if idle_grace_s is not None:
+            self.idle_grace_s = max(0.0, min(float(idle_grace_s), 3600.0))
+        self._on_demand = on_demand
+        self._on_idle = on_idle
+        self._writer_pgid = writer_pgid
+        self._state = "streaming" if streaming else "waiting"
+        self._task = asyncio.create_task(self._run())
+        self._publish()
+
+    def disarm(self) -> None:
+        for task in (self._task, self._idle_task):
+            if task is not None:
+                task.cancel()
+        self._task = None
+        self._idle_task = None
+        self._consumers = []
+        if self._state != "off":
+            self._state = "off"
+            self._publish()
+
+    async def _scan_consumers(self) -> list[int]:
+        own_pid = os.getpid()
+        writer_pgid = self._writer_pgid()
+        consumers: list[int] = []
+        for pid in await asyncio.to_thread(self._v4l2.device_openers):
+            if pid == own_pid:
+                continue
+            try:
+                if writer_pgid is not None and os.getpgid(pid) == writer_pgid:
+                    continue
+            except ProcessLookupError:
+                continue
+            consumers.append(pid)
+        return consumers
+
+    async def _run(self) -> None:
+        while True:
+            watch = self._watch_factory(self._v4l2.device_path, self.WATCH_MASK)
+            try:
+                watch.open()
+            except OSError:
+                # Node missing (module reload in progress) or no inotify: fall back to polling.
+                await self._evaluate()
+                await asyncio.sleep(self.POLL_INTERVAL_S)
+                continue
+            changed = asyncio.Event()
+            forwarder = asyncio.create_task(self._forward_events(watch, changed))
+            try:
+                await self._evaluate()
+                while True:
+                    await changed.wait()
+                    if forwarder.done():
+                        break
+                    # Apps probing a camera open and close it several times in a row; scan once per burst.
+                    await asyncio.sleep(self.DEBOUNCE_S)
+                    changed.clear()
+                    await self._evaluate()
+            finally:
+                forwarder.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await forwarder
+                watch.close()
+            # The watch was dropped because the node went away; re-watch the new one.
+            await asyncio.sleep(self.POLL_INTERVAL_S)
+
+    @staticmethod
+    async def _forward_events(watch: InotifyWatch, changed: asyncio.Event) -> None:
+        try:
+            async with contextlib.aclosing(watch.events()) as events:
+                async for _mask in events:
+                    changed.set()
+        finally:
+            changed.set()
+
+    async def _evaluate(self) -> None:
+        async with self._lock:
+            self._consumers = await self._scan_consumers()
+            if self._state == "waiting" and self._consumers:
+                await self._start_backend()
+            if self._state in {"streaming", "idle"}:
+                if self._consumers:
+                    if self._idle_task is not None:
+                        self._idle_task.cancel()
+                        self._idle_task = None
+                    self._state = "streaming"
+                elif self._idle_task is None:
+                    self._state = "idle"
+                    self._idle_task = asyncio.create_task(self._stop_after_grace())
+            self._publish()
+
+    async def _start_backend(self) -> None:
+        assert self._on_demand is not None
+        self._state = "starting"
+        self._publish()
+        try:
+            await self._on_demand()
+        except Exception as exc:
+            logger.warning("video.on_demand start failed: %s", exc)
+            self._state = "waiting"
+            return
+        self._state = "streaming"
+        self._consumers = await self._scan_consumers()
+
+    async def _stop_after_grace(self) -> None:
+        await asyncio.sleep(self.idle_grace_s)
+        self._idle_task = None
+        if await self._scan_consumers():
+            self._state = "streaming"
+            self._publish()
+            return
+        assert self._on_idle is not None
+        self._state = "stopping"
+        self._publish()
+        try:
+            await self._on_idle()
+        except Exception as exc:
+            logger.warning("video.on_demand idle stop failed: %s", exc)
+        self._state = "waiting"
+        # A consumer may have opened the device while the backend was stopping.
+        await self._evaluate()
+
+    def _publish(self) -> None:
+        if self._event_bus is not None:
+            data = self.runtime_status()
+            if self._session is not None:
+                data["session"] = self._session
+            self._event_bus.publish("video.on_demand", data)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+
+from avreamd.integrations.v4l2loopback import (
+    V4L2_PIX_FMT_YUV420,
+    PixFormat,
+    get_output_format,
+    set_output_format,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def reconnecting_frame_i420(width: int, height: int, size: int | None = None) -> bytes:
+    """Dark I420 frame with a grey band across the middle ("signal lost, reconnecting")."""
+    chroma_w = (width + 1) // 2
+    chroma_h = (height + 1) // 2
+    band_top = height * 9 // 20
+    band_bottom = height * 11 // 20
+    dark_row = bytes([0x20]) * width
+    band_row = bytes([0x80]) * width
+    luma = b"".join(band_row if band_top <= y < band_bottom else dark_row for y in range(height))
+    chroma = bytes([0x80]) * (chroma_w * chroma_h)
+    frame = luma + chroma + chroma
+    if size is not None and size != len(frame):
+        frame = frame[:size].ljust(size, b"\0")
+    return frame
+
+
+class PlaceholderFrameWriter:
+    """Feeds a static frame into the loopback while the real backend is gone.
+
+    Consumers (Zoom, Meet, ...) keep the device only while frames arrive, so a
+    few fps of a precomputed frame bridges reconnect backoffs. The frame reuses
+    the format the backend left behind; the device is released synchronously by
+    stop() so the restarted backend can claim it.
+    """
+
+    FPS = 5
+
+    def __init__(self, device_path: Path) -> None:
+        self._device_path = device_path
+        self._fd = -1
+        self._task: asyncio.Task | None = None
+        self._frame: bytes = b""
+        self._frame_format: PixFormat | None = None
+
+    @property
+    def active(self) -> bool:
+        return self._fd >= 0
+
+    def start(self) -> bool:
+        """Starts writing; returns False if the device has no usable I420 output format."""
+        if self.active:
+            return True
+        try:
+            fd = os.open(self._device_path, os.O_WRONLY | os.O_NONBLOCK | os.O_CLOEXEC)
+        except OSError as exc:
+            logger.debug("video.placeholder cannot open %s: %s", self._device_path, exc)
+            return False
+        try:
+            fmt = get_output_format(fd)
+            if fmt.pixelformat != V4L2_PIX_FMT_YUV420 or fmt.width <= 0 or fmt.height <= 0:
+                raise OSError(f"unsupported output format {fmt}")
+            set_output_format(fd, fmt)
+        except OSError as exc:
+            os.close(fd)
+            logger.debug("video.placeholder not started: %s", exc)
+            return False
+        if fmt != self._frame_format:
+            # Built once per resolution; every tick writes the same buffer.
+            self._frame = reconnecting_frame_i420(fmt.width, fmt.height, fmt.sizeimage or None)
+            self._frame_format = fmt
+        self._fd = fd
+        self._task = asyncio.create_task(self._run(fd))
+        logger.info("video.placeholder started %dx%d", fmt.width, fmt.height)
+        return True
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            logger.info("video.placeholder stopped")
+
+    async def _run(self, fd: int) -> None:
+        frame = memoryview(self._frame)
+        interval = 1.0 / self.FPS
+        while self._fd == fd:
+            try:
+                os.write(fd, frame)
+            except BlockingIOError:
+                pass
+            except OSError as exc:
+                logger.debug("video.placeholder write failed: %s", exc)
+                return
+            await asyncio.sleep(interval)
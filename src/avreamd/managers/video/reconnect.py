@@ -4,14 +4,28 @@ import asyncio
 import time
 from typing import Awaitable, Callable
 
+from avreamd.core.event_bus import EventBus
 from avreamd.core.process_supervisor import ProcessSupervisor
-from avreamd.core.state_store import DaemonStateStore, SubsystemState
+from avreamd.core.state_store import DaemonStateStore, SubsystemState, VideoSessionStateView
 from avreamd.domain.models import ReconnectPolicy, ReconnectStatus
+from avreamd.managers.video.placeholder import PlaceholderFrameWriter
 
 
 class VideoReconnectController:
-    def __init__(self, *, state_store: DaemonStateStore, supervisor: ProcessSupervisor, proc_name: str) -> None:
+    def __init__(
+        self,
+        *,
+        state_store: DaemonStateStore | VideoSessionStateView,
+        supervisor: ProcessSupervisor,
+        proc_name: str,
+        event_bus: EventBus | None = None,
+        placeholder: PlaceholderFrameWriter | None = None,
+        session: str | None = None,
+    ) -> None:
+        self._session = session
         self._state_store = state_store
+        self._placeholder = placeholder
+        self._event_bus = event_bus
         self._supervisor = supervisor
         self._proc_name = proc_name
         self._task: asyncio.Task | None = None
@@ -29,9 +43,11 @@ class VideoReconnectController:
         if self._task is not None:
             self._task.cancel()
             self._task = None
+        self._hold_device(False)
         self._status.state = state
         self._status.attempt = 0
         self._status.next_retry_in_ms = None
+        self._publish()
 
     def start_watch(
         self,
@@ -65,22 +81,29 @@ class VideoReconnectController:
             self._status.state = "exited"
             self._status.attempt = 0
             self._status.next_retry_in_ms = None
+            self._publish()
 
             snap = await self._state_store.snapshot()
             if snap["video"]["state"] != SubsystemState.RUNNING.value:
                 return
 
-            for attempt in range(1, self._policy.max_attempts + 1):
-                result = await self._attempt_restart(attempt, on_restart)
-                if result == "success":
-                    break
-                if result == "abort":
+            self._hold_device(True)
+            try:
+                for attempt in range(1, self._policy.max_attempts + 1):
+                    result = await self._attempt_restart(attempt, on_restart)
+                    if result == "success":
+                        break
+                    if result == "abort":
+                        return
+                else:
+                    self._status.state = "exhausted"
+                    self._status.next_retry_in_ms = None
+                    self._publish()
+                    self._hold_device(False)
+                    await on_exhausted(rc, self._policy.max_attempts)
                     return
-            else:
-                self._status.state = "exhausted"
-                self._status.next_retry_in_ms = None
-                await on_exhausted(rc, self._policy.max_attempts)
-                return
+            finally:
+                self._hold_device(False)
 
     async def _attempt_restart(
         self,
@@ -91,6 +114,7 @@ class VideoReconnectController:
         self._status.attempt = attempt
         self._status.state = "waiting"
         self._status.next_retry_in_ms = int(self._policy.backoff_ms)
+        self._publish()
         next_at = time.monotonic() + (self._policy.backoff_ms / 1000.0)
         await asyncio.sleep(self._policy.backoff_ms / 1000.0)
         if time.monotonic() >= next_at:
@@ -101,21 +125,43 @@ class VideoReconnectController:
             return "abort"
 
         self._status.state = "restarting"
+        self._publish()
         try:
             await self._state_store.transition_video(SubsystemState.STARTING)
         except Exception:
             pass
 
+        # Hand the device back before the backend opens it.
+        self._hold_device(False)
         try:
             await on_restart()
             self._status.state = "running"
             self._status.attempt = 0
             self._status.next_retry_in_ms = None
+            self._publish()
             return "success"
         except Exception:
             try:
                 await self._state_store.transition_video(SubsystemState.RUNNING)
             except Exception:
                 pass
+            self._hold_device(True)
             self._status.state = "failed"
+            self._publish()
             return "failed"
+
+    def _hold_device(self, hold: bool) -> None:
+        """Keeps consumers attached with placeholder frames while no backend writes."""
+        if self._placeholder is None:
+            return
+        if hold:
+            self._placeholder.start()
+        else:
+            self._placeholder.stop()
+
+    def _publish(self) -> None:
+        if self._event_bus is not None:
+            data = self._status.as_dict()
+            if self._session is not None:
+                data["session"] = self._session
+            self._event_bus.publish("video.reconnect", data)
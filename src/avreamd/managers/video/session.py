@@ -1,28 +1,41 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+from collections import deque
+from datetime import datetime, timezone
+import logging
+from typing import Any, Awaitable, Callable
 
-from avreamd.api.errors import conflict_error
+from avreamd.api.errors import conflict_error, timeout_error
 from avreamd.backends.android_video import AndroidVideoBackend
 from avreamd.core.process_supervisor import ProcessSupervisor
-from avreamd.core.state_store import DaemonStateStore, InvalidTransitionError, SubsystemState
+from avreamd.core.state_store import DaemonStateStore, InvalidTransitionError, SubsystemState, VideoSessionStateView
+from avreamd.core.timing import PhaseTimings
 from avreamd.domain.models import VideoSource, VideoStartOptions
+from avreamd.integrations.scrcpy import ScrcpyEvent, is_v4l2_sink_ready, parse_output_line
 from avreamd.integrations.v4l2loopback import V4L2LoopbackIntegration
 
 
+logger = logging.getLogger(__name__)
+
+
 class VideoSessionService:
     PROC_NAME = "video-android"
+    READY_TIMEOUT_S = 10.0
+    OUTPUT_TAIL_ON_ERROR = 10
+    EVENT_HISTORY = 100
 
     def __init__(
         self,
         *,
-        state_store: DaemonStateStore,
+        state_store: DaemonStateStore | VideoSessionStateView,
         backend: AndroidVideoBackend,
         supervisor: ProcessSupervisor,
         v4l2: V4L2LoopbackIntegration,
         audio_manager: Any | None = None,
+        proc_name: str = PROC_NAME,
     ) -> None:
+        self._proc_name = proc_name
         self._state_store = state_store
         self._backend = backend
         self._supervisor = supervisor
@@ -30,6 +43,11 @@ class VideoSessionService:
         self._audio_manager = audio_manager
         self._active_source: VideoSource | None = None
         self._active_proc_name: str | None = None
+        # Output of the current (or last) backend; kept after a stop for /video/log.
+        self._output_managed: Any | None = None
+        self._events: deque[dict[str, Any]] = deque(maxlen=self.EVENT_HISTORY)
+        self._backend_info: dict[str, Any] = {}
+        self._backend_push: asyncio.Task | None = None
 
     @property
     def active_source(self) -> dict[str, Any] | None:
@@ -45,13 +63,90 @@ class VideoSessionService:
         self._active_source = None
         self._active_proc_name = None
 
+    @property
+    def backend_info(self) -> dict[str, Any]:
+        return dict(self._backend_info)
+
+    def output_log(self, tail: int) -> dict[str, Any]:
+        """Last `tail` output lines and parsed events of the current or last backend."""
+        managed = self._output_managed
+        lines = managed.output_tail(tail) if managed is not None else []
+        events = list(self._events)[-tail:] if tail > 0 else []
+        return {"lines": lines, "events": events, "backend": self.backend_info}
+
+    def _watch_output(self, managed: Any) -> None:
+        self._output_managed = managed
+        self._events.clear()
+        self._backend_info = {}
+        # Replays the ring, so lines printed before this point are parsed too.
+        managed.add_line_listener(self._on_output_line)
+
+    def _on_output_line(self, line: str) -> None:
+        event = parse_output_line(line)
+        if event is None:
+            return
+        self._events.append({"ts": datetime.now(timezone.utc).isoformat(), **event.as_dict()})
+        if self._update_backend_info(event):
+            self._schedule_backend_push()
+
+    def _update_backend_info(self, event: ScrcpyEvent) -> bool:
+        """Folds an event into the backend summary; True when the state store should hear about it."""
+        info = self._backend_info
+        data = event.data
+        if event.kind == "version":
+            info["version"] = data["version"]
+        elif event.kind == "device":
+            info["device"] = {k: data[k] for k in ("manufacturer", "model", "android")}
+        elif event.kind == "encoder":
+            # Replaced, not updated: the state store keeps a reference to the previous dict.
+            info["encoders"] = {**info.get("encoders", {}), data["stream"]: data["encoder"]}
+        elif event.kind == "camera":
+            info["camera"] = data["camera"]
+        elif event.kind == "sink":
+            info["sink"] = data["device"]
+        elif event.kind == "error":
+            info["last_error"] = data["message"]
+        elif event.kind == "fps":
+            # Reported every second: kept for /video/log but not pushed, so the
+            # state version only moves when something meaningful changes.
+            info["fps"] = data["fps"]
+            info["frames_skipped"] = data["skipped"]
+            return False
+        else:
+            return False
+        return True
+
+    def _schedule_backend_push(self) -> None:
+        if self._backend_push is None or self._backend_push.done():
+            self._backend_push = asyncio.create_task(self._push_backend_info())
+
+    async def _push_backend_info(self) -> None:
+        # Lines parsed while a push is in flight are picked up by the next round.
+        pushed: dict[str, Any] | None = None
+        while True:
+            info = {k: v for k, v in self._backend_info.items() if k not in {"fps", "frames_skipped"}}
+            if info == pushed:
+                return
+            try:
+                await self._state_store.set_video_backend(info)
+            except Exception:  # pragma: no cover - defensive
+                logger.exception("video.backend state update failed")
+                return
+            pushed = info
+
     async def list_sources(self) -> list[dict[str, str]]:
         return await self._backend.list_sources()
 
-    async def start(self, *, options: VideoStartOptions) -> dict[str, Any]:
+    async def start(
+        self,
+        *,
+        options: VideoStartOptions,
+        prepare: Callable[[], Awaitable[None]] | None = None,
+    ) -> dict[str, Any]:
+        """Starts scrcpy; `prepare` (v4l2 readiness) runs alongside source selection and mic setup."""
         snapshot = await self._state_store.snapshot()
         current = snapshot["video"]["state"]
-        running = self._supervisor.running(self.PROC_NAME)
+        running = self._supervisor.running(self._proc_name)
 
         if current in {SubsystemState.RUNNING.value, SubsystemState.STARTING.value} and running:
             return {"state": "RUNNING", "already_running": True, "source": self.active_source}
@@ -66,7 +161,26 @@ class VideoSessionService:
         except InvalidTransitionError as exc:
             raise conflict_error("video start is not allowed in current state", {"state": current}) from exc
 
-        source_obj = await self._backend.select_default_source(preferred_serial=options.serial)
+        timings = PhaseTimings()
+        # Independent phases run concurrently. The virtual mic comes up before
+        # scrcpy so it can be pointed at the sink via env and no audio lands on
+        # the default sink before being moved.
+        ready_result, source_result, audio_result = await asyncio.gather(
+            timings.measure("v4l2_ready", prepare() if prepare is not None else asyncio.sleep(0)),
+            timings.measure("select_source", self._backend.select_default_source(preferred_serial=options.serial)),
+            timings.measure("audio_start", self._start_audio()),
+            return_exceptions=True,
+        )
+        failure = next((r for r in (ready_result, source_result) if isinstance(r, BaseException)), None)
+        if failure is not None:
+            if isinstance(audio_result, dict) and audio_result.get("already_running") is False:
+                await self._stop_audio()
+            await self._abort_start()
+            raise failure
+        if isinstance(audio_result, BaseException):  # pragma: no cover - _start_audio catches
+            audio_result = None
+        source_obj = source_result
+
         command = self._backend.build_start_command(
             serial=source_obj.serial,
             sink_path=str(self._v4l2.device_path),
@@ -76,7 +190,27 @@ class VideoSessionService:
             preview_window=options.preview_window,
             enable_audio=options.enable_audio,
         )
-        await self._launch_backend(command=command)
+        stream_env: dict[str, str] = {}
+        if self._audio_manager is not None and options.enable_audio and audio_result is not None:
+            stream_env = self._audio_manager.stream_env()
+
+        # Persisted with the process manifest so a restarted daemon can adopt the stream.
+        meta = {
+            "serial": source_obj.serial,
+            "sink": str(self._v4l2.device_path),
+            "camera_facing": options.camera_facing,
+            "camera_rotation": options.camera_rotation,
+            "preview_window": options.preview_window,
+            "enable_audio": bool(stream_env),
+        }
+        try:
+            managed = await timings.measure(
+                "launch", self._launch_backend(command=command, env=stream_env or None, meta=meta)
+            )
+        except Exception:
+            if audio_result is not None and audio_result.get("already_running") is False:
+                await self._stop_audio()
+            raise
 
         await self._state_store.transition_video(SubsystemState.RUNNING)
         self._active_source = VideoSource(
@@ -85,20 +219,83 @@ class VideoSessionService:
             camera_rotation=options.camera_rotation,
             preview_window=options.preview_window,
         )
-        self._active_proc_name = self.PROC_NAME
+        self._active_proc_name = self._proc_name
 
-        audio_result: dict[str, Any] | None = None
-        if self._audio_manager is not None:
+        if self._audio_manager is not None and audio_result is not None and audio_result.get("state") == "RUNNING":
             try:
-                audio_result = await self._audio_manager.start(backend="pipewire")
+                # Routing fallback: only moves the stream if env routing did not apply.
+                await timings.measure("audio_route", self._audio_manager.route_source_pid(managed.process.pid))
             except Exception as exc:  # pragma: no cover - defensive
-                audio_result = {"state": "ERROR", "already_running": False, "backend": "pipewire", "error": str(exc)}
+                logger.warning("video.start audio routing for pid %d failed: %s", managed.process.pid, exc)
 
-        result: dict[str, Any] = {"state": "RUNNING", "already_running": False, "source": self.active_source}
+        logger.info("video.start serial=%s timings_ms %s", source_obj.serial, timings)
+        result: dict[str, Any] = {
+            "state": "RUNNING",
+            "already_running": False,
+            "source": self.active_source,
+            "timings_ms": timings.as_dict(),
+        }
         if audio_result is not None:
             result["audio"] = audio_result
         return result
 
+    async def adopt(self) -> VideoStartOptions | None:
+        """Marks a backend adopted from a previous daemon as RUNNING; returns the options it was started with."""
+        managed = self._supervisor.get(self._proc_name)
+        if managed is None or not self._supervisor.running(self._proc_name):
+            return None
+        meta = managed.meta
+        serial = meta.get("serial")
+        if not isinstance(serial, str) or not serial or meta.get("sink") != str(self._v4l2.device_path):
+            logger.warning("video.adopt %s does not match this session; stopping it", self._proc_name)
+            await self._supervisor.stop(self._proc_name)
+            return None
+        try:
+            await self._state_store.transition_video(SubsystemState.STARTING)
+            await self._state_store.transition_video(SubsystemState.RUNNING)
+        except InvalidTransitionError:
+            return None
+        options = VideoStartOptions(
+            serial=serial,
+            camera_facing=str(meta.get("camera_facing") or "front"),
+            camera_rotation=int(meta.get("camera_rotation") or 0),
+            preview_window=bool(meta.get("preview_window")),
+            enable_audio=bool(meta.get("enable_audio")),
+        )
+        self._active_source = VideoSource(
+            serial=serial,
+            camera_facing=options.camera_facing,
+            camera_rotation=options.camera_rotation,
+            preview_window=options.preview_window,
+        )
+        self._active_proc_name = self._proc_name
+        self._watch_output(managed)
+        if options.enable_audio and self._audio_manager is not None:
+            # The stream still plays into the virtual mic the previous daemon set up.
+            if await self._audio_manager.adopt():
+                try:
+                    await self._audio_manager.route_source_pid(managed.process.pid)
+                except Exception as exc:  # pragma: no cover - defensive
+                    logger.warning("video.adopt audio routing for pid %d failed: %s", managed.process.pid, exc)
+        logger.info("video.adopt serial=%s pid=%d", serial, managed.process.pid)
+        return options
+
+    async def _start_audio(self) -> dict[str, Any] | None:
+        if self._audio_manager is None:
+            return None
+        try:
+            return await self._audio_manager.start(backend="pipewire")
+        except Exception as exc:  # pragma: no cover - defensive
+            return {"state": "ERROR", "already_running": False, "backend": "pipewire", "error": str(exc)}
+
+    async def _abort_start(self) -> None:
+        """Returns STARTING to STOPPED when a pre-launch phase failed."""
+        try:
+            await self._state_store.transition_video(SubsystemState.STOPPING)
+            await self._state_store.transition_video(SubsystemState.STOPPED)
+        except InvalidTransitionError:
+            pass
+
     async def _reconcile_stale_state(self, *, current: str, running: bool) -> None:
         """Cleans up state-store when the process has exited without a clean stop."""
         if not running and current in {SubsystemState.RUNNING.value, SubsystemState.STARTING.value}:
@@ -106,23 +303,58 @@ class VideoSessionService:
             await self._state_store.transition_video(SubsystemState.STOPPED)
             self.clear_active()
 
-    async def _launch_backend(self, *, command: list[str]) -> Any:
-        """Starts the backend subprocess and checks for an immediate exit."""
-        managed = await self._supervisor.start(self.PROC_NAME, command)
-        await asyncio.sleep(0.2)
+    async def _launch_backend(
+        self,
+        *,
+        command: list[str],
+        env: dict[str, str] | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> Any:
+        """Starts the backend subprocess and waits until scrcpy reports the v4l2 sink as started.
+
+        A backend that stays alive without reporting readiness within
+        READY_TIMEOUT_S is stopped and the start fails with E_BACKEND_TIMEOUT;
+        it is never assumed to be streaming.
+        """
+        managed = await self._supervisor.start(self._proc_name, command, env=env, meta=meta)
+        self._watch_output(managed)
+        ready_line = await self._supervisor.wait_for_line(self._proc_name, is_v4l2_sink_ready, self.READY_TIMEOUT_S)
+        if ready_line is None:
+            # Output ended or timed out: let an exiting process settle its returncode.
+            try:
+                await asyncio.wait_for(managed.process.wait(), timeout=0.2)
+            except asyncio.TimeoutError:
+                pass
         if managed.process.returncode is not None:
+            output = list(managed.output)[-self.OUTPUT_TAIL_ON_ERROR :]
             await self._state_store.set_video_error(
                 "E_BACKEND_FAILED",
-                "android backend exited immediately",
-                {"returncode": managed.process.returncode, "command": command},
+                "android backend exited before the v4l2 sink was ready",
+                {"returncode": managed.process.returncode, "command": command, "output": output},
+            )
+            raise conflict_error(
+                "failed to start android backend",
+                {"returncode": managed.process.returncode, "output": output},
+            )
+        if ready_line is None:
+            output = list(managed.output)[-self.OUTPUT_TAIL_ON_ERROR :]
+            logger.warning("video.start no v4l2 readiness from backend within %.1fs; stopping it", self.READY_TIMEOUT_S)
+            await self._supervisor.stop(self._proc_name)
+            await self._state_store.set_video_error(
+                "E_BACKEND_TIMEOUT",
+                "android backend did not report the v4l2 sink as ready",
+                {"timeout_s": self.READY_TIMEOUT_S, "command": command, "output": output},
+            )
+            raise timeout_error(
+                "android backend did not become ready",
+                {"timeout_s": self.READY_TIMEOUT_S, "output": output},
             )
-            raise conflict_error("failed to start android backend", {"returncode": managed.process.returncode})
         return managed
 
     async def stop(self) -> dict[str, Any]:
         snapshot = await self._state_store.snapshot()
         current = snapshot["video"]["state"]
-        running = self._supervisor.running(self.PROC_NAME)
+        running = self._supervisor.running(self._proc_name)
 
         if current == SubsystemState.STOPPED.value and not running:
             return {"state": "STOPPED", "already_stopped": True}
@@ -130,22 +362,25 @@ class VideoSessionService:
         if current != SubsystemState.STOPPING.value:
             await self._state_store.transition_video(SubsystemState.STOPPING)
 
-        await self._supervisor.stop(self.PROC_NAME)
+        await self._supervisor.stop(self._proc_name)
         await self._state_store.transition_video(SubsystemState.STOPPED)
         self.clear_active()
 
-        audio_result: dict[str, Any] | None = None
-        if self._audio_manager is not None:
-            try:
-                audio_result = await self._audio_manager.stop()
-            except Exception as exc:  # pragma: no cover - defensive
-                audio_result = {
-                    "state": "ERROR",
-                    "already_stopped": False,
-                    "error": str(exc),
-                }
+        audio_result = await self._stop_audio()
 
         result = {"state": "STOPPED", "already_stopped": False}
         if audio_result is not None:
             result["audio"] = audio_result
         return result
+
+    async def _stop_audio(self) -> dict[str, Any] | None:
+        if self._audio_manager is None:
+            return None
+        try:
+            return await self._audio_manager.stop()
+        except Exception as exc:  # pragma: no cover - defensive
+            return {
+                "state": "ERROR",
+                "already_stopped": False,
+                "error": str(exc),
+            }
@@ -5,12 +5,20 @@ from typing import Any
 
 from avreamd.backends.android_video import AndroidVideoBackend
 from avreamd.constants import DEFAULT_RECONNECT_BACKOFF_MS, DEFAULT_RECONNECT_MAX_ATTEMPTS
+from avreamd.core.event_bus import EventBus
 from avreamd.core.process_supervisor import ProcessSupervisor
-from avreamd.core.state_store import DaemonStateStore, InvalidTransitionError, SubsystemState
+from avreamd.core.state_store import DaemonStateStore, InvalidTransitionError, SubsystemState, VideoSessionStateView
 from avreamd.domain.models import ReconnectPolicy, VideoStartOptions
 from avreamd.integrations.v4l2loopback import V4L2LoopbackIntegration
 from avreamd.managers.privilege_client import PrivilegeClient
-from avreamd.managers.video import VideoDeviceResetService, VideoReconnectController, VideoSessionService
+from avreamd.managers.video import (
+    LoopbackDevicePool,
+    PlaceholderFrameWriter,
+    VideoDeviceResetService,
+    VideoOnDemandController,
+    VideoReconnectController,
+    VideoSessionService,
+)
 
 
 class VideoManager:
@@ -19,15 +27,23 @@ class VideoManager:
     def __init__(
         self,
         *,
-        state_store: DaemonStateStore,
+        state_store: DaemonStateStore | VideoSessionStateView,
         backend: AndroidVideoBackend,
         supervisor: ProcessSupervisor,
         privilege_client: PrivilegeClient,
         v4l2: V4L2LoopbackIntegration,
         audio_manager=None,
+        event_bus: EventBus | None = None,
+        pool: LoopbackDevicePool | None = None,
+        proc_name: str = PROC_NAME,
+        enable_audio: bool = True,
+        session: str | None = None,
     ) -> None:
         self._state_store = state_store
         self._supervisor = supervisor
+        self._proc_name = proc_name
+        self._enable_audio = enable_audio
+        self._v4l2 = v4l2
         self._lock = asyncio.Lock()
         self._session = VideoSessionService(
             state_store=state_store,
@@ -35,13 +51,19 @@ class VideoManager:
             supervisor=supervisor,
             v4l2=v4l2,
             audio_manager=audio_manager,
+            proc_name=proc_name,
         )
-        self._device_reset = VideoDeviceResetService(privilege_client=privilege_client, v4l2=v4l2)
+        self._device_reset = VideoDeviceResetService(privilege_client=privilege_client, v4l2=v4l2, pool=pool)
         self._reconnect = VideoReconnectController(
             state_store=state_store,
             supervisor=supervisor,
-            proc_name=self.PROC_NAME,
+            proc_name=proc_name,
+            event_bus=event_bus,
+            placeholder=PlaceholderFrameWriter(v4l2.device_path),
+            session=session,
         )
+        self._on_demand = VideoOnDemandController(v4l2=v4l2, event_bus=event_bus, session=session)
+        self._on_demand_serial: str | None = None
         self._camera_facing = "front"
         self._camera_rotation = 0
         self._preview_window = False
@@ -51,18 +73,69 @@ class VideoManager:
             "backoff_ms": DEFAULT_RECONNECT_BACKOFF_MS,
         }
 
+    @property
+    def device_path(self) -> str:
+        return str(self._v4l2.device_path)
+
+    @property
+    def active_serial(self) -> str | None:
+        active = self._session.active_source
+        serial = active.get("serial") if isinstance(active, dict) else None
+        return serial if isinstance(serial, str) and serial else None
+
+    async def video_state(self) -> dict[str, Any]:
+        return (await self._state_store.snapshot())["video"]
+
+    async def in_use(self) -> bool:
+        """True while streaming, armed for on-demand, or in an error state not yet cleared by stop."""
+        if self._on_demand.enabled or self._supervisor.running(self._proc_name):
+            return True
+        return (await self.video_state())["state"] != SubsystemState.STOPPED.value
+
+    def last_exit_code(self) -> int | None:
+        return self._supervisor.last_exit_code(self._proc_name)
+
     async def runtime_status(self) -> dict[str, Any]:
-        last_exit = self._supervisor.last_exit_code(self.PROC_NAME)
+        last_exit = self.last_exit_code()
         return {
             "active_source": self._session.active_source,
             "active_process": self._session.active_process,
             "last_exit_code": last_exit,
+            "last_stop": self._supervisor.stop_stats(self._proc_name),
+            "backend": self._session.backend_info,
             "reconnect": self._reconnect.runtime_status(),
+            "on_demand": self._on_demand.runtime_status(),
             "log_pointers": {
-                "video_android": self._supervisor.latest_log_path(self.PROC_NAME),
+                "video_android": self._supervisor.latest_log_path(self._proc_name),
             },
+            "session_logs": self._supervisor.log_summary(),
         }
 
+    def output_log(self, tail: int) -> dict[str, Any]:
+        """Recent backend output and parsed scrcpy events, served from memory."""
+        return {
+            "running": self._supervisor.running(self._proc_name),
+            "log_path": self._supervisor.latest_log_path(self._proc_name),
+            **self._session.output_log(tail),
+        }
+
+    async def stop_background(self) -> None:
+        self._on_demand.disarm()
+        self._reconnect.cancel(state="idle")
+
+    async def adopt(self) -> bool:
+        """Resumes managing a backend the previous daemon left streaming (ProcessSupervisor.adopt)."""
+        async with self._lock:
+            options = await self._session.adopt()
+            if options is None:
+                return False
+            self._camera_facing = options.camera_facing
+            self._camera_rotation = options.camera_rotation
+            self._preview_window = options.preview_window
+            self._reconnect.configure(self._policy_from_cfg())
+            self._reconnect.start_watch(on_restart=self._restart_from_watch, on_exhausted=self._on_exhausted_retries)
+            return True
+
     async def stop_reconnect(self) -> dict[str, Any]:
         async with self._lock:
             self._reconnect.cancel(state="stopped")
@@ -85,6 +158,35 @@ class VideoManager:
         camera_facing: str | None = None,
         camera_rotation: int | None = None,
         preview_window: bool | None = None,
+        on_demand: bool = False,
+        idle_grace_s: float | None = None,
+    ) -> dict[str, Any]:
+        if on_demand:
+            return await self._arm_on_demand(
+                serial=serial,
+                camera_facing=camera_facing,
+                camera_rotation=camera_rotation,
+                preview_window=preview_window,
+                idle_grace_s=idle_grace_s,
+            )
+        if not reconnect:
+            # An explicit start/stop takes over from the on-demand watcher.
+            self._on_demand.disarm()
+        return await self._start(
+            reconnect=reconnect,
+            serial=serial,
+            camera_facing=camera_facing,
+            camera_rotation=camera_rotation,
+            preview_window=preview_window,
+        )
+
+    async def _start(
+        self,
+        reconnect: bool = False,
+        serial: str | None = None,
+        camera_facing: str | None = None,
+        camera_rotation: int | None = None,
+        preview_window: bool | None = None,
     ) -> dict[str, Any]:
         async with self._lock:
             facing = camera_facing if camera_facing in {"front", "back"} else self._camera_facing
@@ -92,15 +194,15 @@ class VideoManager:
             window = bool(preview_window) if preview_window is not None else self._preview_window
 
             self._reconnect.configure(self._policy_from_cfg())
-            await self._device_reset.ensure_ready()
 
             result = await self._session.start(
+                prepare=self._device_reset.ensure_ready,
                 options=VideoStartOptions(
                     serial=serial,
                     camera_facing=facing,
                     camera_rotation=rotation,
                     preview_window=window,
-                    enable_audio=True,
+                    enable_audio=self._enable_audio,
                     preset="balanced",
                 )
             )
@@ -114,22 +216,63 @@ class VideoManager:
 
             return result
 
+    async def _arm_on_demand(
+        self,
+        *,
+        serial: str | None,
+        camera_facing: str | None,
+        camera_rotation: int | None,
+        preview_window: bool | None,
+        idle_grace_s: float | None,
+    ) -> dict[str, Any]:
+        """Remembers the start options and lets the device watcher start/stop the backend."""
+        async with self._lock:
+            if camera_facing in {"front", "back"}:
+                self._camera_facing = camera_facing
+            if camera_rotation in {0, 90, 180, 270}:
+                self._camera_rotation = camera_rotation
+            if preview_window is not None:
+                self._preview_window = bool(preview_window)
+            self._on_demand_serial = serial
+            self._on_demand.arm(
+                on_demand=self._start_from_demand,
+                on_idle=self._stop_from_demand,
+                writer_pgid=self._writer_pgid,
+                streaming=self._supervisor.running(self._proc_name),
+                idle_grace_s=idle_grace_s,
+            )
+            snap = await self._state_store.snapshot()
+            return {
+                "state": snap["video"]["state"],
+                "already_running": self._supervisor.running(self._proc_name),
+                "on_demand": self._on_demand.runtime_status(),
+            }
+
+    def _writer_pgid(self) -> int | None:
+        managed = self._supervisor.get(self._proc_name)
+        # The supervisor starts the backend in its own session: pgid == pid.
+        return managed.process.pid if managed is not None else None
+
+    async def _start_from_demand(self) -> None:
+        await self._start(serial=self._on_demand_serial)
+
+    async def _stop_from_demand(self) -> None:
+        async with self._lock:
+            await self._stop_unlocked()
+
     async def _restart_from_watch(self) -> None:
-        serial = None
-        active = self._session.active_source
-        if isinstance(active, dict):
-            source_serial = active.get("serial")
-            if isinstance(source_serial, str) and source_serial:
-                serial = source_serial
-        await self.start(
+        # The writer died on its own; the device gets reloaded at the next stop.
+        self._device_reset.note_writer_exit(self.last_exit_code())
+        await self._start(
             reconnect=True,
-            serial=serial,
+            serial=self.active_serial,
             camera_facing=self._camera_facing,
             camera_rotation=self._camera_rotation,
             preview_window=self._preview_window,
         )
 
     async def _on_exhausted_retries(self, rc: int | None, max_attempts: int) -> None:
+        self._device_reset.note_writer_exit(rc)
         await self._state_store.set_video_error(
             "E_BACKEND_FAILED",
             "video backend exited and reconnect attempts exhausted",
@@ -137,19 +280,26 @@ class VideoManager:
         )
 
     async def stop(self) -> dict[str, Any]:
+        self._on_demand.disarm()
         async with self._lock:
-            self._reconnect.cancel(state="idle")
-            result = await self._session.stop()
-            await asyncio.sleep(2.0)
-            result["post_stop_reset"] = await self._device_reset.best_effort_reload_after_stop()
-            return result
+            return await self._stop_unlocked()
+
+    async def _stop_unlocked(self) -> dict[str, Any]:
+        self._reconnect.cancel(state="idle")
+        # supervisor.stop returns once the whole process group is gone, so
+        # the v4l2 device is already released here.
+        result = await self._session.stop()
+        if not result.get("already_stopped"):
+            self._device_reset.note_writer_exit(self.last_exit_code())
+        result["post_stop_reset"] = await self._device_reset.best_effort_reload_after_stop()
+        return result
 
     async def reset(self, force: bool = False) -> dict[str, Any]:
         async with self._lock:
             return await self._reset_unlocked(force=force)
 
     async def _reset_unlocked(self, force: bool = False) -> dict[str, Any]:
-        running = self._supervisor.running(self.PROC_NAME)
+        running = self._supervisor.running(self._proc_name)
         if running:
             self._reconnect.cancel(state="idle")
 
@@ -161,7 +311,7 @@ class VideoManager:
                 except InvalidTransitionError:
                     pass
 
-            await self._supervisor.stop(self.PROC_NAME)
+            await self._supervisor.stop(self._proc_name)
 
             snap_after = await self._state_store.snapshot()
             if snap_after["video"]["state"] != SubsystemState.STOPPED.value:
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from avreamd.api.errors import conflict_error, validation_error
+from avreamd.backends.android_video import AndroidVideoBackend
+from avreamd.core.event_bus import EventBus
+from avreamd.core.process_supervisor import ProcessSupervisor
+from avreamd.core.state_store import DaemonStateStore
+from avreamd.managers.device_registry import AndroidDeviceRegistry
+from avreamd.managers.privilege_client import PrivilegeClient
+from avreamd.managers.video import LoopbackDevicePool
+from avreamd.managers.video_manager import VideoManager
+
+
+@dataclass
+class _SessionSlot:
+    slot: int
+    serial: str
+    # Claimed but the manager has not left STOPPED yet; never pruned.
+    starting: bool = False
+
+
+class VideoSessionRegistry:
+    """Concurrent camera sessions, one loopback node per phone.
+
+    Sessions are keyed by device identity (ro.serialno when the device registry
+    has probed it, else the adb serial), so one phone seen over USB and Wi-Fi
+    cannot hold two slots. Slot 0 is the primary VideoManager behind /video/*,
+    which owns the virtual mic. Further slots get their own VideoManager with
+    its own process, reconnect watcher and ``video_sessions`` state, and no
+    audio. Each manager serializes only its own operations; the registry lock
+    guards slot bookkeeping and is never held across a start or stop.
+    """
+
+    def __init__(
+        self,
+        *,
+        primary: VideoManager,
+        pool: LoopbackDevicePool,
+        state_store: DaemonStateStore,
+        backend: AndroidVideoBackend,
+        supervisor: ProcessSupervisor,
+        privilege_client: PrivilegeClient,
+        device_registry: AndroidDeviceRegistry | None = None,
+        event_bus: EventBus | None = None,
+    ) -> None:
+        self._pool = pool
+        self._state_store = state_store
+        self._backend = backend
+        self._supervisor = supervisor
+        self._privilege_client = privilege_client
+        self._device_registry = device_registry
+        self._event_bus = event_bus
+        self._managers: dict[int, VideoManager] = {0: primary}
+        self._sessions: dict[str, _SessionSlot] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def max_sessions(self) -> int:
+        return self._pool.max_devices
+
+    def _identity(self, serial: str) -> str:
+        entry = self._device_registry.get(serial) if self._device_registry is not None else None
+        if entry is not None and entry.identity:
+            return entry.identity
+        return serial
+
+    def _proc_name(self, slot: int) -> str:
+        if slot == 0:
+            return VideoManager.PROC_NAME
+        return f"{VideoManager.PROC_NAME}-{self._pool.device(slot).video_nr}"
+
+    def _manager(self, slot: int) -> VideoManager:
+        manager = self._managers.get(slot)
+        if manager is None:
+            v4l2 = self._pool.device(slot)
+            name = v4l2.device_path.name
+            manager = VideoManager(
+                state_store=self._state_store.video_session(name),
+                backend=self._backend,
+                supervisor=self._supervisor,
+                privilege_client=self._privilege_client,
+                v4l2=v4l2,
+                event_bus=self._event_bus,
+                pool=self._pool,
+                proc_name=self._proc_name(slot),
+                enable_audio=False,
+                session=name,
+            )
+            self._managers[slot] = manager
+        return manager
+
+    def _describe(self, identity: str | None, session: _SessionSlot) -> dict[str, Any]:
+        manager = self._managers[session.slot]
+        return {
+            "identity": identity,
+            "serial": session.serial,
+            "slot": session.slot,
+            "device": manager.device_path,
+            "label": self._pool.label_for(session.slot),
+            "primary": session.slot == 0,
+        }
+
+    async def _prune(self) -> None:
+        """Forgets sessions whose manager was stopped elsewhere (e.g. /video/stop on the primary)."""
+        for identity, session in list(self._sessions.items()):
+            if not session.starting and not await self._managers[session.slot].in_use():
+                del self._sessions[identity]
+
+    async def _adopt_primary(self) -> None:
+        # A phone started through /video/start counts as a session too.
+        primary = self._managers[0]
+        serial = primary.active_serial
+        if serial is None or any(s.slot == 0 for s in self._sessions.values()) or not await primary.in_use():
+            return
+        self._sessions.setdefault(self._identity(serial), _SessionSlot(slot=0, serial=serial))
+
+    async def _claim(self, identity: str, serial: str) -> _SessionSlot:
+        async with self._lock:
+            await self._prune()
+            await self._adopt_primary()
+            existing = self._sessions.get(identity)
+            if existing is None:
+                # Sessions adopted at boot may be keyed by serial before the identity was probed.
+                existing = next((s for s in self._sessions.values() if s.serial == serial), None)
+            if existing is not None:
+                return existing
+            claimed = {s.slot for s in self._sessions.values()}
+            for slot in range(self._pool.max_devices):
+                if slot in claimed or await self._manager(slot).in_use():
+                    continue
+                session = _SessionSlot(slot=slot, serial=serial, starting=True)
+                self._sessions[identity] = session
+                return session
+        raise conflict_error(
+            "all camera slots are in use",
+            {"max_sessions": self._pool.max_devices, "sessions": sorted(self._sessions)},
+        )
+
+    async def list_sessions(self) -> list[dict[str, Any]]:
+        async with self._lock:
+            await self._prune()
+            await self._adopt_primary()
+            sessions = sorted(self._sessions.items(), key=lambda item: item[1].slot)
+        out: list[dict[str, Any]] = []
+        for identity, session in sessions:
+            manager = self._managers[session.slot]
+            video = await manager.video_state()
+            out.append(
+                {
+                    **self._describe(identity, session),
+                    "state": video["state"],
+                    "last_error": video["last_error"],
+                    **(await manager.runtime_status()),
+                }
+            )
+        return out
+
+    async def start(self, serial: str, **options: Any) -> dict[str, Any]:
+        identity = self._identity(serial)
+        session = await self._claim(identity, serial)
+        manager = self._managers[session.slot]
+        try:
+            result = await manager.start(serial=session.serial, **options)
+        except Exception:
+            async with self._lock:
+                if self._sessions.get(identity) is session and not await manager.in_use():
+                    del self._sessions[identity]
+            raise
+        finally:
+            session.starting = False
+        return {**self._describe(identity, session), **result}
+
+    async def stop(self, serial: str) -> dict[str, Any]:
+        identity = self._identity(serial)
+        async with self._lock:
+            await self._adopt_primary()
+            session = self._sessions.get(identity)
+        if session is None:
+            raise validation_error("no camera session for this device", {"serial": serial})
+        result = await self._managers[session.slot].stop()
+        async with self._lock:
+            if self._sessions.get(identity) is session:
+                del self._sessions[identity]
+        return {**self._describe(identity, session), **result}
+
+    async def adopt(self) -> list[str]:
+        """Resumes the sessions whose backends survived a daemon restart; returns their serials."""
+        adopted: list[str] = []
+        for slot in range(self._pool.max_devices):
+            if not self._supervisor.running(self._proc_name(slot)):
+                continue
+            manager = self._manager(slot)
+            if not await manager.adopt():
+                continue
+            serial = manager.active_serial
+            if serial is None:
+                continue
+            async with self._lock:
+                self._sessions[self._identity(serial)] = _SessionSlot(slot=slot, serial=serial)
+            adopted.append(serial)
+        return adopted
+
+    async def stop_background(self) -> None:
+        for manager in list(self._managers.values()):
+            await manager.stop_background()
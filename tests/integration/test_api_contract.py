@@ -92,6 +92,25 @@ class ApiContractTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(status, 400)
         self._assert_error_envelope(body, code="E_VALIDATION")
 
+    async def test_video_session_start_requires_serial(self) -> None:
+        if not HAS_AIOHTTP:
+            self.skipTest("aiohttp not installed in this environment")
+        status, body = await self._request("POST", "/video/sessions/start", {"camera_facing": "back"})
+        self.assertEqual(status, 400)
+        self._assert_error_envelope(body, code="E_VALIDATION")
+
+    async def test_video_log_tail_validation(self) -> None:
+        if not HAS_AIOHTTP:
+            self.skipTest("aiohttp not installed in this environment")
+        status, body = await self._request("GET", "/video/log?tail=0")
+        self.assertEqual(status, 400)
+        self._assert_error_envelope(body, code="E_VALIDATION")
+
+        status, body = await self._request("GET", "/video/log?tail=20")
+        self.assertEqual(status, 200)
+        self._assert_success_envelope(body)
+        self.assertEqual(body["data"]["lines"], [])
+
     async def test_android_devices_envelope(self) -> None:
         if not HAS_AIOHTTP:
             self.skipTest("aiohttp not installed in this environment")
@@ -105,6 +124,13 @@ class ApiContractTests(unittest.IsolatedAsyncioTestCase):
         self.assertIn("devices", body["data"])
         self.assertIn("recommended", body["data"])
 
+    async def test_android_devices_fields_validation(self) -> None:
+        if not HAS_AIOHTTP:
+            self.skipTest("aiohttp not installed in this environment")
+        status, body = await self._request("GET", "/android/devices?fields=id,bogus")
+        self.assertEqual(status, 400)
+        self._assert_error_envelope(body, code="E_VALIDATION")
+
     async def test_android_wifi_setup_port_validation(self) -> None:
         if not HAS_AIOHTTP:
             self.skipTest("aiohttp not installed in this environment")
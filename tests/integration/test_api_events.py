@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from aiohttp import ClientSession, UnixConnector
+    from avreamd.app import AvreamDaemon
+    from avreamd.config import resolve_paths
+    from avreamd.core.state_store import SubsystemState
+    HAS_AIOHTTP = True
+except ImportError:  # pragma: no cover - environment dependency
+    ClientSession = None  # type: ignore[assignment]
+    UnixConnector = None  # type: ignore[assignment]
+    AvreamDaemon = None  # type: ignore[assignment]
+    resolve_paths = None  # type: ignore[assignment]
+    SubsystemState = None  # type: ignore[assignment]
+    HAS_AIOHTTP = False
+
+
+async def _next_event(resp) -> tuple[int, dict]:
+    event_id = -1
+    while True:
+        line = (await asyncio.wait_for(resp.content.readline(), timeout=2.0)).decode("utf-8").strip()
+        if line.startswith("id: "):
+            event_id = int(line[4:])
+        elif line.startswith("data: "):
+            return event_id, json.loads(line[6:])
+
+
+class ApiEventsTests(unittest.IsolatedAsyncioTestCase):
+    async def test_events_stream_publishes_and_resumes(self) -> None:
+        if not HAS_AIOHTTP:
+            self.skipTest("aiohttp not installed in this environment")
+
+        assert resolve_paths is not None
+        assert AvreamDaemon is not None
+        assert ClientSession is not None
+        assert UnixConnector is not None
+        assert SubsystemState is not None
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = Path(tmp_dir) / "daemon.sock"
+            paths = resolve_paths(socket_override=str(socket_path))
+            daemon = AvreamDaemon(paths)
+
+            await daemon.start()
+            try:
+                connector = UnixConnector(path=str(paths.socket_path))
+                async with ClientSession(connector=connector) as session:
+                    async with session.get("http://localhost/events") as resp:
+                        self.assertEqual(resp.status, 200)
+                        self.assertTrue(resp.headers["Content-Type"].startswith("text/event-stream"))
+                        await daemon.state_store.transition_audio(SubsystemState.STARTING)
+                        first_id, first = await _next_event(resp)
+                        await daemon.state_store.transition_audio(SubsystemState.ERROR)
+
+                    self.assertEqual(first["type"], "audio.state")
+                    self.assertEqual(first["data"]["state"], "STARTING")
+                    self.assertEqual(first_id, first["seq"])
+
+                    headers = {"Last-Event-ID": str(first_id)}
+                    async with session.get("http://localhost/events", headers=headers) as resp:
+                        _, replayed = await _next_event(resp)
+                    self.assertEqual(replayed["seq"], first_id + 1)
+                    self.assertEqual(replayed["data"]["state"], "ERROR")
+
+                    async with session.get("http://localhost/events?since=999999") as resp:
+                        _, reset = await _next_event(resp)
+                    self.assertEqual(reset["type"], "stream.reset")
+
+                    async with session.get("http://localhost/events?since=abc") as resp:
+                        self.assertEqual(resp.status, 400)
+
+                    # An open stream must not hold up daemon shutdown.
+                    resp = await session.get("http://localhost/events")
+                    await asyncio.wait_for(daemon.stop(), timeout=5.0)
+                    resp.close()
+            finally:
+                await daemon.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
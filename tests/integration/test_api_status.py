@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import tempfile
 import unittest
 from pathlib import Path
@@ -8,12 +9,14 @@ try:
     from aiohttp import ClientSession, UnixConnector
     from avreamd.app import AvreamDaemon
     from avreamd.config import resolve_paths
+    from avreamd.core.state_store import SubsystemState
     HAS_AIOHTTP = True
 except ImportError:  # pragma: no cover - environment dependency
     ClientSession = None  # type: ignore[assignment]
     UnixConnector = None  # type: ignore[assignment]
     AvreamDaemon = None  # type: ignore[assignment]
     resolve_paths = None  # type: ignore[assignment]
+    SubsystemState = None  # type: ignore[assignment]
     HAS_AIOHTTP = False
 
 
@@ -48,6 +51,128 @@ class ApiStatusTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(body["data"]["service"]["daemon"], "avreamd")
         self.assertIn("video_runtime", body["data"])
 
+    async def test_status_conditional_get_returns_304_until_state_changes(self) -> None:
+        if not HAS_AIOHTTP:
+            self.skipTest("aiohttp not installed in this environment")
+
+        assert resolve_paths is not None
+        assert AvreamDaemon is not None
+        assert ClientSession is not None
+        assert UnixConnector is not None
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = Path(tmp_dir) / "daemon.sock"
+            paths = resolve_paths(socket_override=str(socket_path))
+            daemon = AvreamDaemon(paths)
+
+            await daemon.start()
+            try:
+                connector = UnixConnector(path=str(paths.socket_path))
+                async with ClientSession(connector=connector) as session:
+                    async with session.get("http://localhost/status") as resp:
+                        etag = resp.headers.get("ETag")
+                    assert etag is not None
+                    async with session.get("http://localhost/status", headers={"If-None-Match": etag}) as resp:
+                        unchanged_status = resp.status
+                        unchanged_body = await resp.read()
+                    await daemon.state_store.transition_audio(SubsystemState.STARTING)
+                    async with session.get("http://localhost/status", headers={"If-None-Match": etag}) as resp:
+                        changed_status = resp.status
+                        changed_etag = resp.headers.get("ETag")
+            finally:
+                await daemon.stop()
+
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(unchanged_status, 304)
+        self.assertEqual(unchanged_body, b"")
+        self.assertEqual(changed_status, 200)
+        self.assertNotEqual(changed_etag, etag)
+
+    async def test_status_etag_changes_with_fps_report(self) -> None:
+        if not HAS_AIOHTTP:
+            self.skipTest("aiohttp not installed in this environment")
+
+        assert resolve_paths is not None
+        assert AvreamDaemon is not None
+        assert ClientSession is not None
+        assert UnixConnector is not None
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = resolve_paths(socket_override=str(Path(tmp_dir) / "daemon.sock"))
+            daemon = AvreamDaemon(paths)
+
+            await daemon.start()
+            try:
+                connector = UnixConnector(path=str(paths.socket_path))
+                async with ClientSession(connector=connector) as session:
+                    async with session.get("http://localhost/status") as resp:
+                        etag = resp.headers.get("ETag")
+                    assert etag is not None
+                    version = daemon.state_store.version
+                    # fps reports are not state changes and move no counter.
+                    daemon.video_manager._session._on_output_line("INFO: 30 fps")
+                    async with session.get("http://localhost/status", headers={"If-None-Match": etag}) as resp:
+                        status = resp.status
+                        body = await resp.json()
+            finally:
+                await daemon.stop()
+
+        self.assertEqual(daemon.state_store.version, version)
+        self.assertEqual(status, 200)
+        self.assertEqual(body["data"]["video_runtime"]["backend"]["fps"], 30)
+
+    async def test_status_wait_returns_when_condition_holds(self) -> None:
+        if not HAS_AIOHTTP:
+            self.skipTest("aiohttp not installed in this environment")
+
+        assert resolve_paths is not None
+        assert AvreamDaemon is not None
+        assert ClientSession is not None
+        assert UnixConnector is not None
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = Path(tmp_dir) / "daemon.sock"
+            paths = resolve_paths(socket_override=str(socket_path))
+            daemon = AvreamDaemon(paths)
+
+            await daemon.start()
+            try:
+                connector = UnixConnector(path=str(paths.socket_path))
+                async with ClientSession(connector=connector) as session:
+
+                    async def wait(query: str) -> tuple[int, dict]:
+                        async with session.get(f"http://localhost/status/wait?{query}") as resp:
+                            return resp.status, await resp.json()
+
+                    waiter = asyncio.create_task(wait("audio=STARTING&timeout=5"))
+                    await asyncio.sleep(0.05)
+                    self.assertFalse(waiter.done())
+                    await daemon.state_store.transition_audio(SubsystemState.STARTING)
+                    matched_status, matched = await asyncio.wait_for(waiter, timeout=2.0)
+
+                    timeout_status, timed_out = await wait("video=RUNNING&timeout=0.05")
+                    bad_status, bad = await wait("video=FLYING")
+                    none_status, _ = await wait("timeout=1")
+
+                    # A parked long poll must not hold up daemon shutdown.
+                    parked = asyncio.create_task(wait("video=RUNNING&timeout=30"))
+                    await asyncio.sleep(0.05)
+                    await asyncio.wait_for(daemon.stop(), timeout=5.0)
+                    parked_status, parked_body = await asyncio.wait_for(parked, timeout=1.0)
+            finally:
+                await daemon.stop()
+
+        self.assertEqual(matched_status, 200)
+        self.assertTrue(matched["data"]["matched"])
+        self.assertEqual(matched["data"]["runtime"]["audio"]["state"], "STARTING")
+        self.assertEqual(timeout_status, 200)
+        self.assertFalse(timed_out["data"]["matched"])
+        self.assertEqual(bad_status, 400)
+        self.assertEqual(bad["error"]["code"], "E_VALIDATION")
+        self.assertEqual(none_status, 400)
+        self.assertEqual(parked_status, 200)
+        self.assertFalse(parked_body["data"]["matched"])
+
 
 if __name__ == "__main__":
     unittest.main()
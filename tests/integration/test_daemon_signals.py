@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import signal
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+try:
+    from avreamd.app import AvreamDaemon
+    from avreamd.config import resolve_paths
+    from avreamd.constants import HANDOVER_FILENAME
+    from avreamd.main import handle_signal
+    HAS_AIOHTTP = True
+except ImportError:  # pragma: no cover - environment dependency
+    AvreamDaemon = None  # type: ignore[assignment]
+    resolve_paths = None  # type: ignore[assignment]
+    HANDOVER_FILENAME = "handover"
+    handle_signal = None  # type: ignore[assignment]
+    HAS_AIOHTTP = False
+
+
+def _alive(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as fh:
+            return fh.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except OSError:
+        return False
+
+
+class DaemonSignalTests(unittest.IsolatedAsyncioTestCase):
+    async def _stop_on_sigterm(self, *, handover_owner: int | None) -> tuple[bool, bool]:
+        assert resolve_paths is not None
+        assert AvreamDaemon is not None
+        assert handle_signal is not None
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            env = {
+                "XDG_RUNTIME_DIR": str(Path(tmp_dir) / "run"),
+                "XDG_STATE_HOME": str(Path(tmp_dir) / "state"),
+                "XDG_CONFIG_HOME": str(Path(tmp_dir) / "config"),
+                "XDG_CACHE_HOME": str(Path(tmp_dir) / "cache"),
+            }
+            with mock.patch.dict(os.environ, env):
+                paths = resolve_paths(socket_override=str(Path(tmp_dir) / "daemon.sock"))
+                daemon = AvreamDaemon(paths)
+                await daemon.start()
+                managed = await daemon.supervisor.start("video-android", ["sleep", "30"])
+                pid = managed.process.pid
+                if handover_owner is not None:
+                    (paths.runtime_dir / HANDOVER_FILENAME).write_text(str(handover_owner), encoding="utf-8")
+                try:
+                    handle_signal(daemon, signal.SIGTERM)
+                    await daemon.stop()
+                    alive = _alive(pid)
+                    manifest_kept = (paths.runtime_dir / "processes" / "video-android.json").exists()
+                finally:
+                    if _alive(pid):
+                        os.killpg(managed.pgid, signal.SIGKILL)
+        return alive, manifest_kept
+
+    async def test_plain_sigterm_stops_sessions(self) -> None:
+        if not HAS_AIOHTTP:
+            self.skipTest("aiohttp not installed in this environment")
+
+        alive, manifest_kept = await self._stop_on_sigterm(handover_owner=None)
+
+        self.assertFalse(alive)
+        self.assertFalse(manifest_kept)
+
+    async def test_sigterm_after_restart_request_hands_sessions_over(self) -> None:
+        if not HAS_AIOHTTP:
+            self.skipTest("aiohttp not installed in this environment")
+
+        alive, manifest_kept = await self._stop_on_sigterm(handover_owner=os.getpid())
+
+        self.assertTrue(alive)
+        self.assertTrue(manifest_kept)
+
+    async def test_stale_handover_marker_is_ignored(self) -> None:
+        if not HAS_AIOHTTP:
+            self.skipTest("aiohttp not installed in this environment")
+
+        alive, _manifest_kept = await self._stop_on_sigterm(handover_owner=os.getpid() + 1)
+
+        self.assertFalse(alive)
@@ -44,6 +44,8 @@ class VideoPhoneIntegrationTests(unittest.IsolatedAsyncioTestCase):
                 mock_bin / "adb",
                 textwrap.dedent(
                     """#!/usr/bin/env bash
+                    [ "$3" = "shell" ] && echo "$*" >> "$(dirname "$0")/shell_calls.log"
+                    [ "$1" = "devices" ] && echo "$*" >> "$(dirname "$0")/devices_calls.log"
                     if [ "$1" = "devices" ]; then
                       echo "List of devices attached"
                       echo "ABC123\tdevice"
@@ -92,6 +94,7 @@ class VideoPhoneIntegrationTests(unittest.IsolatedAsyncioTestCase):
                       exit 0
                     fi
                     trap 'exit 0' TERM INT
+                    echo "INFO: v4l2 sink started to device: /dev/video10"
                     while true; do sleep 1; done
                     """
                 ),
@@ -132,6 +135,7 @@ class VideoPhoneIntegrationTests(unittest.IsolatedAsyncioTestCase):
             os.environ["PATH"] = f"{mock_bin}:{old_path}"
             os.environ["AVREAM_HELPER_MODE"] = "direct"
             os.environ["AVREAM_HELPER_BIN"] = str(helper)
+            os.environ["AVREAM_ADB_NATIVE"] = "0"
 
             socket_path = tmp / "daemon.sock"
             paths = resolve_paths(socket_override=str(socket_path))
@@ -141,13 +145,43 @@ class VideoPhoneIntegrationTests(unittest.IsolatedAsyncioTestCase):
             try:
                 connector = UnixConnector(path=str(paths.socket_path))
                 async with ClientSession(connector=connector) as session:
+                    devices_log = mock_bin / "devices_calls.log"
+                    list_calls = devices_log.read_text().count("\n") if devices_log.exists() else 0
                     async with session.get("http://localhost/android/devices") as resp:
                         self.assertEqual(resp.status, 200)
+                        # One device-list query per request, even without tracking.
+                        self.assertEqual(devices_log.read_text().count("\n"), list_calls + 1)
                         devices = await resp.json()
                         self.assertTrue(devices["ok"])
                         self.assertEqual(len(devices["data"]["devices"]), 1)
                         self.assertEqual(set(devices["data"]["devices"][0]["transports"]), {"usb", "wifi"})
                         self.assertIn("wifi_candidate_endpoint", devices["data"]["devices"][0])
+                        devices_etag = resp.headers.get("ETag")
+                    assert devices_etag is not None
+                    shell_log = mock_bin / "shell_calls.log"
+                    shell_calls = shell_log.read_text().count("\n") if shell_log.exists() else 0
+                    async with session.get(
+                        "http://localhost/android/devices", headers={"If-None-Match": devices_etag}
+                    ) as resp:
+                        self.assertEqual(resp.status, 304)
+                    # Answered from the registry version: no device was probed again.
+                    self.assertEqual(shell_log.read_text().count("\n") if shell_log.exists() else 0, shell_calls)
+                    async with session.get(
+                        "http://localhost/android/devices?fields=id,state", headers={"If-None-Match": devices_etag}
+                    ) as resp:
+                        self.assertEqual(resp.status, 200)
+
+                    async with session.get("http://localhost/android/devices?probe=false&fields=id,state") as resp:
+                        self.assertEqual(resp.status, 200)
+                        light = await resp.json()
+                        self.assertEqual(set(light["data"]["devices"][0]), {"id", "state"})
+
+                    async with session.get("http://localhost/android/endpoints/192.168.1.20") as resp:
+                        self.assertEqual(resp.status, 200)
+                        endpoint = await resp.json()
+                        self.assertEqual(endpoint["data"]["endpoint"], "192.168.1.20:5555")
+                        self.assertEqual(endpoint["data"]["state"], "device")
+                        self.assertTrue(endpoint["data"]["connected"])
 
                     async with session.post("http://localhost/android/wifi/setup", json={"serial": "ABC123"}) as resp:
                         self.assertEqual(resp.status, 200)
@@ -179,6 +213,23 @@ class VideoPhoneIntegrationTests(unittest.IsolatedAsyncioTestCase):
                         self.assertTrue(stopped["ok"])
                         self.assertEqual(stopped["data"]["audio"]["state"], "STOPPED")
 
+                    async with session.post("http://localhost/video/sessions/start", json={"serial": "ABC123"}) as resp:
+                        self.assertEqual(resp.status, 200)
+                        session_started = await resp.json()
+                        self.assertEqual(session_started["data"]["device"], "/dev/video10")
+                        self.assertEqual(session_started["data"]["state"], "RUNNING")
+
+                    async with session.get("http://localhost/video/sessions") as resp:
+                        self.assertEqual(resp.status, 200)
+                        sessions = await resp.json()
+                        self.assertEqual([s["serial"] for s in sessions["data"]["sessions"]], ["ABC123"])
+                        self.assertEqual(sessions["data"]["max_sessions"], 4)
+
+                    async with session.post("http://localhost/video/sessions/stop", json={"serial": "ABC123"}) as resp:
+                        self.assertEqual(resp.status, 200)
+                        session_stopped = await resp.json()
+                        self.assertEqual(session_stopped["data"]["state"], "STOPPED")
+
                     async with session.post("http://localhost/android/wifi/disconnect", json={"endpoint": "192.168.1.20"}) as resp:
                         self.assertEqual(resp.status, 200)
                         wifi_disconnect = await resp.json()
@@ -189,6 +240,7 @@ class VideoPhoneIntegrationTests(unittest.IsolatedAsyncioTestCase):
                 os.environ["PATH"] = old_path
                 os.environ.pop("AVREAM_HELPER_MODE", None)
                 os.environ.pop("AVREAM_HELPER_BIN", None)
+                os.environ.pop("AVREAM_ADB_NATIVE", None)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import unittest
+from unittest import mock
 
-from avreamd.integrations.adb import AdbAdapter
+from avreamd.integrations.adb import AdbAdapter, AdbTransportError
+from avreamd.integrations.command_runner import CommandResult
 
 
 class _StubAdbAdapter(AdbAdapter):
@@ -67,6 +71,101 @@ class AdbAdapterTests(unittest.IsolatedAsyncioTestCase):
         self.assertNotEqual(result.get("returncode"), 0)
         self.assertIn("no authorized adb device", str(result.get("stderr", "")))
 
+    async def test_probe_device_collects_fingerprint_in_one_call(self) -> None:
+        adb = _ProbeAdbAdapter()
+
+        identity = await adb.device_identity(serial="USB123")
+        ip = await adb.detect_device_ip(serial="USB123")
+        fingerprint = await adb.probe_device(serial="USB123")
+
+        self.assertEqual(identity, "PHONE123")
+        self.assertEqual(ip, "192.168.1.20")
+        assert fingerprint is not None
+        self.assertEqual(fingerprint.model, "Pixel 7")
+        self.assertEqual(fingerprint.android_version, "14")
+        self.assertEqual(fingerprint.sdk, 34)
+        self.assertEqual(fingerprint.ipv4_addresses, (("rmnet_data0", "10.1.2.3"), ("wlan0", "192.168.1.20")))
+        self.assertEqual(len(adb.calls), 3)
+
+    async def test_probe_device_falls_back_when_script_did_not_run(self) -> None:
+        adb = _StubAdbAdapter()
+        self.assertIsNone(await adb.probe_device(serial="USB123"))
+        self.assertEqual(await adb.detect_device_ip(serial="USB123"), "192.168.1.20")
+
+    async def test_probe_device_raises_when_device_is_unreachable(self) -> None:
+        adb = _StubAdbAdapter()
+
+        async def _offline(args: list[str]) -> dict[str, object]:
+            return {"returncode": 1, "stdout": "", "stderr": "error: device 'USB123' not found"}
+
+        adb._run = _offline  # type: ignore[method-assign]
+
+        with self.assertRaises(AdbTransportError):
+            await adb.probe_device(serial="USB123")
+        self.assertIsNone(await adb.device_identity(serial="USB123"))
+
+    def test_parse_probe_prefers_private_address_without_wifi_iface(self) -> None:
+        stdout = (
+            "avream:ro.serialno=\n"
+            "avream:ro.boot.serialno=BOOT1\n"
+            "5: rmnet0    inet 100.64.1.2/30 scope global rmnet0\n"
+            "6: eth0    inet 10.0.0.7/24 scope global eth0\n"
+            "avream:end\n"
+        )
+        fingerprint = AdbAdapter.parse_probe("USB123", stdout)
+        assert fingerprint is not None
+        self.assertEqual(fingerprint.serialno, "BOOT1")
+        self.assertEqual(fingerprint.wifi_ip, "10.0.0.7")
+        self.assertIsNone(AdbAdapter.parse_probe("USB123", "PHONE123\n"))
+
+
+class _ProbeAdbAdapter(AdbAdapter):
+    def __init__(self) -> None:
+        super().__init__(adb_bin="/usr/bin/adb")
+        self.calls: list[list[str]] = []
+
+    async def _run(self, args: list[str]) -> dict[str, object]:
+        self.calls.append(list(args))
+        stdout = (
+            "avream:ro.serialno=PHONE123\n"
+            "avream:ro.boot.serialno=PHONE123\n"
+            "avream:ro.product.model=Pixel 7\n"
+            "avream:ro.build.version.release=14\n"
+            "avream:ro.build.version.sdk=34\n"
+            "1: lo    inet 127.0.0.1/8 scope host lo\\       valid_lft forever preferred_lft forever\n"
+            "12: rmnet_data0    inet 10.1.2.3/27 scope global rmnet_data0\n"
+            "30: wlan0    inet 192.168.1.20/24 brd 192.168.1.255 scope global wlan0\n"
+            "avream:end\n"
+        )
+        return {"returncode": 0, "stdout": stdout, "stderr": "", "args": [self.adb_bin, *args]}
+
+
+class _SlowRunnerStub:
+    def __init__(self) -> None:
+        self.finished: list[str] = []
+
+    async def run_async(self, command: list[str]) -> CommandResult:
+        serial = command[2]
+        await asyncio.sleep(0.3 if serial == "SLOW" else 0.01)
+        self.finished.append(serial)
+        return CommandResult(returncode=0, stdout=f"{serial}\n", stderr="", args=list(command))
+
+
+class AdbAdapterLockingTests(unittest.IsolatedAsyncioTestCase):
+    async def test_slow_device_does_not_block_other_devices(self) -> None:
+        with mock.patch.dict(os.environ, {"AVREAM_ADB_NATIVE": "0"}):
+            adb = AdbAdapter(adb_bin="/usr/bin/adb")
+        runner = _SlowRunnerStub()
+        adb._runner = runner  # type: ignore[assignment]
+
+        slow = asyncio.create_task(adb.get_device_property(serial="SLOW", prop="ro.serialno"))
+        await asyncio.sleep(0)
+        fast = await asyncio.wait_for(adb.get_device_property(serial="FAST", prop="ro.serialno"), timeout=0.2)
+
+        self.assertEqual(fast, "FAST")
+        self.assertEqual(runner.finished, ["FAST"])
+        self.assertEqual(await slow, "SLOW")
+
 
 if __name__ == "__main__":
     unittest.main()
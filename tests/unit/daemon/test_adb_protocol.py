@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import statistics
+import struct
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from avreamd.integrations.adb import AdbAdapter
+from avreamd.integrations.adb_protocol import AdbServerClient
+
+
+_DEVICES_L = "ABC123               device usb:1-1 product:panther model:Pixel_7 device:panther transport_id:1\n"
+_IP_WLAN0 = "30: wlan0    inet 192.168.1.20/24 brd 192.168.1.255 scope global wlan0\n"
+
+_SHELL = {
+    "getprop ro.serialno": ("PHONE123\n", "", 0),
+    "ip -4 -o addr show wlan0": (_IP_WLAN0, "", 0),
+    "ip -4 -o addr show": ("1: lo    inet 127.0.0.1/8 scope host lo\n" + _IP_WLAN0, "", 0),
+}
+
+_MOCK_ADB = f"""#!/usr/bin/env bash
+case "$*" in
+  "devices -l") printf 'List of devices attached\\n{_DEVICES_L}\\n' ;;
+  "-s ABC123 shell getprop ro.serialno") printf 'PHONE123\\n' ;;
+  "-s ABC123 shell ip -4 -o addr show wlan0") printf '{_IP_WLAN0}' ;;
+  "-s ABC123 shell ip -4 -o addr show") printf '1: lo    inet 127.0.0.1/8 scope host lo\\n{_IP_WLAN0}' ;;
+  *) exit 1 ;;
+esac
+"""
+
+
+def _encode(payload: str) -> bytes:
+    data = payload.encode("utf-8")
+    return b"%04x" % len(data) + data
+
+
+class _FakeAdbServer:
+    """Speaks just enough of the adb smart-socket protocol for the adapter."""
+
+    def __init__(self, *, shell_v2: bool = True) -> None:
+        self.shell_v2 = shell_v2
+        self.requests: list[str] = []
+        self._server: asyncio.AbstractServer | None = None
+        self.port = 0
+
+    async def __aenter__(self) -> "_FakeAdbServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = int(self._server.sockets[0].getsockname()[1])
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        serial: str | None = None
+        try:
+            while True:
+                length = int((await reader.readexactly(4)).decode("ascii"), 16)
+                request = (await reader.readexactly(length)).decode("utf-8")
+                self.requests.append(request)
+                if request == "host:devices-l":
+                    writer.write(b"OKAY" + _encode(_DEVICES_L))
+                    break
+                if request == "host:devices":
+                    writer.write(b"OKAY" + _encode("ABC123\tdevice\n"))
+                    break
+                if request.startswith("host:transport:"):
+                    serial = request.split(":", 2)[2]
+                    if serial != "ABC123":
+                        writer.write(b"FAIL" + _encode(f"device '{serial}' not found"))
+                        break
+                    writer.write(b"OKAY")
+                    continue
+                if serial and request.startswith("shell,v2,raw:") and self.shell_v2:
+                    stdout, stderr, rc = _SHELL.get(request.split(":", 1)[1], ("", "not found\n", 127))
+                    writer.write(b"OKAY")
+                    for packet_id, data in ((1, stdout.encode()), (2, stderr.encode()), (3, bytes([rc]))):
+                        if data:
+                            writer.write(struct.pack("<BI", packet_id, len(data)) + data)
+                    break
+                if serial and request.startswith("shell:"):
+                    command, _, _marker = request.split(":", 1)[1].partition("; echo ")
+                    stdout, stderr, rc = _SHELL.get(command, ("", "not found\n", 127))
+                    writer.write(b"OKAY" + (stdout + stderr + f"__AVREAM_RC__:{rc}\n").encode())
+                    break
+                writer.write(b"FAIL" + _encode("closed"))
+                break
+            await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+
+def _closed_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+class AdbProtocolTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.adb_bin = Path(self._tmp.name) / "adb"
+        self.adb_bin.write_text(_MOCK_ADB, encoding="utf-8")
+        self.adb_bin.chmod(0o755)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _subprocess_adapter(self) -> AdbAdapter:
+        with mock.patch.dict(os.environ, {"AVREAM_ADB_NATIVE": "0"}):
+            return AdbAdapter(adb_bin=str(self.adb_bin))
+
+    async def test_native_path_matches_subprocess_path(self) -> None:
+        async with _FakeAdbServer() as server:
+            native = AdbAdapter(adb_bin=str(self.adb_bin), server=AdbServerClient(port=server.port))
+            legacy = self._subprocess_adapter()
+
+            for adapter in (native, legacy):
+                self.assertEqual(
+                    await adapter.list_devices(),
+                    [
+                        {
+                            "serial": "ABC123",
+                            "state": "device",
+                            "product": "panther",
+                            "model": "Pixel_7",
+                            "device": "panther",
+                            "transport_id": "1",
+                        }
+                    ],
+                )
+            self.assertEqual(await native.device_identity(serial="ABC123"), await legacy.device_identity(serial="ABC123"))
+            self.assertEqual(await native.detect_device_ip(serial="ABC123"), "192.168.1.20")
+            self.assertEqual(await legacy.detect_device_ip(serial="ABC123"), "192.168.1.20")
+            self.assertIn("host:devices-l", server.requests)
+            self.assertIn("shell,v2,raw:getprop ro.serialno", server.requests)
+
+    async def test_shell_falls_back_to_legacy_service_and_keeps_exit_code(self) -> None:
+        async with _FakeAdbServer(shell_v2=False) as server:
+            client = AdbServerClient(port=server.port)
+            ok = await client.shell("ABC123", "getprop ro.serialno")
+            missing = await client.shell("ABC123", "nope")
+
+        self.assertEqual((ok.returncode, ok.stdout), (0, "PHONE123\n"))
+        self.assertEqual(missing.returncode, 127)
+
+    async def test_unknown_serial_reports_failure_without_fallback(self) -> None:
+        async with _FakeAdbServer() as server:
+            adapter = AdbAdapter(adb_bin=str(self.adb_bin), server=AdbServerClient(port=server.port))
+            result = await adapter._run(["-s", "GONE", "shell", "getprop", "ro.serialno"])
+
+        self.assertEqual(result["returncode"], 1)
+        self.assertIn("not found", str(result["stderr"]))
+
+    async def test_unreachable_server_falls_back_to_adb_binary(self) -> None:
+        adapter = AdbAdapter(adb_bin=str(self.adb_bin), server=AdbServerClient(port=_closed_port()))
+        self.assertEqual(await adapter.device_identity(serial="ABC123"), "PHONE123")
+
+    async def test_native_path_is_faster_than_spawning_adb(self) -> None:
+        # Debug mode (on by default in IsolatedAsyncioTestCase) inflates socket I/O costs.
+        asyncio.get_running_loop().set_debug(False)
+
+        async def _median_ms(adapter: AdbAdapter) -> float:
+            samples: list[float] = []
+            for _ in range(15):
+                started = time.perf_counter()
+                await adapter.get_device_property(serial="ABC123", prop="ro.serialno")
+                samples.append((time.perf_counter() - started) * 1000.0)
+            return statistics.median(samples)
+
+        async with _FakeAdbServer() as server:
+            native_ms = await _median_ms(AdbAdapter(adb_bin=str(self.adb_bin), server=AdbServerClient(port=server.port)))
+            subprocess_ms = await _median_ms(self._subprocess_adapter())
+
+        self.assertLess(native_ms, subprocess_ms)
+
+
+if __name__ == "__main__":
+    unittest.main()
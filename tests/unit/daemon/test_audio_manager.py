@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import unittest
 import tempfile
 from pathlib import Path
@@ -18,39 +19,56 @@ class _PipewireStub:
     def available(self) -> bool:
         return self._available
 
-    def running(self) -> bool:
+    async def running(self) -> bool:
         return self._running
 
-    def supports_native_virtual_mic(self) -> bool:
+    async def supports_native_virtual_mic(self) -> bool:
         return False
 
 
+class _IdleSubscription:
+    """A `pactl subscribe` on which nothing happens."""
+
+    def __aiter__(self) -> _IdleSubscription:
+        return self
+
+    async def __anext__(self) -> tuple[str, str, int]:
+        await asyncio.Event().wait()
+        raise StopAsyncIteration
+
+    async def aclose(self) -> None:
+        return None
+
+
 class AudioManagerTests(unittest.IsolatedAsyncioTestCase):
     async def test_audio_start_pipewire(self) -> None:
         class _PactlStub:
             available = True
 
-            def list_modules(self) -> list[dict[str, str]]:
+            async def list_modules(self) -> list[dict[str, str]]:
                 return []
 
-            def default_source(self) -> str:
+            async def default_source(self) -> str:
                 return "alsa_input.usb-test-mic"
 
-            def list_sources(self) -> list[str]:
+            async def list_sources(self) -> list[str]:
                 return ["alsa_input.usb-test-mic"]
 
-            def load_module(self, _name: str, _args: list[str]) -> int:
+            async def load_module(self, _name: str, _args: list[str]) -> int:
                 return 1
 
-            def list_sink_inputs_detailed(self) -> list[dict[str, object]]:
+            async def list_sink_inputs_detailed(self) -> list[dict[str, object]]:
                 return [{"id": "12", "properties": {"application.name": "scrcpy"}}]
 
-            def move_sink_input(self, _sink_input_id: int, _sink_name: str) -> None:
+            async def move_sink_input(self, _sink_input_id: int, _sink_name: str) -> None:
                 return
 
-            def unload_module(self, _module_id: int) -> None:
+            async def unload_module(self, _module_id: int) -> None:
                 return
 
+            async def unload_modules(self, module_ids: list[int]) -> list[int]:
+                return list(module_ids)
+
         class _PrivStub:
             async def call(self, _action: str, _params: dict) -> dict:
                 return {}
@@ -65,15 +83,70 @@ class AudioManagerTests(unittest.IsolatedAsyncioTestCase):
             )
             result = await manager.start("pipewire")
             self.assertEqual(result["backend"], "pipewire")
+            self.assertEqual(manager.stream_env()["PULSE_SINK"], "avream_sink")
+
+    async def test_route_source_pid_moves_stream_of_that_process(self) -> None:
+        class _PactlStub:
+            available = True
+
+            def __init__(self) -> None:
+                self.moved: list[tuple[int, str]] = []
+
+            async def list_modules(self) -> list[dict[str, str]]:
+                return []
+
+            async def load_module(self, name: str, _args: list[str]) -> int:
+                return 1 if name == "module-null-sink" else 2
+
+            async def subscribe(self) -> _IdleSubscription:
+                return _IdleSubscription()
+
+            async def list_sinks(self) -> list[dict[str, str]]:
+                return [{"id": "5", "name": "avream_sink"}]
+
+            async def list_sink_inputs_detailed(self) -> list[dict[str, object]]:
+                return [
+                    {"id": "12", "sink": "0", "properties": {"application.process.id": "4242"}},
+                    {"id": "13", "sink": "0", "properties": {"application.process.id": "999"}},
+                ]
+
+            async def move_sink_input(self, sink_input_id: int, sink_name: str) -> None:
+                self.moved.append((sink_input_id, sink_name))
+
+            async def unload_modules(self, module_ids: list[int]) -> list[int]:
+                return list(module_ids)
+
+        class _PrivStub:
+            async def call(self, _action: str, _params: dict) -> dict:
+                return {}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pactl = _PactlStub()
+            manager = AudioManager(
+                state_store=DaemonStateStore(),
+                pipewire=cast(Any, _PipewireStub(True, True)),
+                pactl=cast(Any, pactl),
+                privilege_client=cast(Any, _PrivStub()),
+                state_dir=Path(tmp),
+            )
+            await manager.start("pipewire")
+            await asyncio.sleep(0)
+            self.assertEqual(pactl.moved, [])
+
+            result = await manager.route_source_pid(4242)
+            assert result is not None
+            self.assertEqual((result["matched"], result["moved"]), (1, 1))
+            self.assertEqual(pactl.moved, [(12, "avream_sink")])
+            await manager.stop()
 
     async def test_audio_start_fallback(self) -> None:
         class _PactlStub:
             available = False
 
-            def list_sink_inputs_detailed(self) -> list[dict[str, object]]:
+            async def list_sink_inputs_detailed(self) -> list[dict[str, object]]:
                 return []
 
-            def move_sink_input(self, _sink_input_id: int, _sink_name: str) -> None:
+            async def move_sink_input(self, _sink_input_id: int, _sink_name: str) -> None:
                 return
 
         class _PrivStub:
@@ -90,6 +163,53 @@ class AudioManagerTests(unittest.IsolatedAsyncioTestCase):
             )
             result = await manager.start("pipewire")
             self.assertEqual(result["backend"], "snd_aloop")
+            self.assertEqual(manager.stream_env(), {})
+
+    async def test_adopt_resumes_mic_left_by_previous_daemon(self) -> None:
+        class _PactlStub:
+            available = True
+
+            def __init__(self) -> None:
+                self.unloaded: list[int] = []
+
+            async def list_modules(self) -> list[dict[str, str]]:
+                return [
+                    {"id": "7", "name": "module-null-sink", "args": "sink_name=avream_sink"},
+                    {"id": "8", "name": "module-remap-source", "args": "source_name=avream_mic"},
+                ]
+
+            async def subscribe(self) -> _IdleSubscription:
+                return _IdleSubscription()
+
+            async def list_sink_inputs_detailed(self) -> list[dict[str, object]]:
+                return []
+
+            async def unload_modules(self, module_ids: list[int]) -> list[int]:
+                self.unloaded.extend(module_ids)
+                return list(module_ids)
+
+        class _PrivStub:
+            async def call(self, _action: str, _params: dict) -> dict:
+                return {}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / "audio_state.json").write_text('{"backend": "pipewire", "modules": [7, 8]}')
+            pactl = _PactlStub()
+            store = DaemonStateStore()
+            manager = AudioManager(
+                state_store=store,
+                pipewire=cast(Any, _PipewireStub(True, True)),
+                pactl=cast(Any, pactl),
+                privilege_client=cast(Any, _PrivStub()),
+                state_dir=Path(tmp),
+            )
+
+            self.assertTrue(await manager.adopt())
+            self.assertEqual(store.current()["audio"]["state"], "RUNNING")
+            self.assertEqual(manager.stream_env()["PULSE_SINK"], "avream_sink")
+
+            await manager.stop()
+            self.assertEqual(sorted(pactl.unloaded), [7, 8])
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import contextlib
+import io
 import unittest
 
 from avreamd import cli
@@ -36,6 +38,12 @@ class CliParserTests(unittest.TestCase):
         self.assertEqual(args.rotation, "90")
         self.assertTrue(args.preview_window)
 
+    def test_parse_camera_start_on_demand(self) -> None:
+        parser = cli.build_parser()
+        args = parser.parse_args(["camera", "start", "--on-demand", "--idle-grace", "30"])
+        self.assertTrue(args.on_demand)
+        self.assertEqual(args.idle_grace, 30.0)
+
     def test_parse_start_defaults(self) -> None:
         parser = cli.build_parser()
         args = parser.parse_args(["start"])
@@ -51,6 +59,17 @@ class CliParserTests(unittest.TestCase):
         self.assertEqual(args.update_cmd, "install")
         self.assertTrue(args.allow_stop_streams)
 
+    def test_parse_status_wait_conditions(self) -> None:
+        parser = cli.build_parser()
+        args = parser.parse_args(["status", "--wait", "video=RUNNING", "--wait", "audio=STOPPED", "--wait-timeout", "5"])
+        self.assertEqual(args.wait, [("video", "RUNNING"), ("audio", "STOPPED")])
+        self.assertEqual(args.wait_timeout, 5.0)
+
+    def test_parse_status_wait_rejects_unknown_condition(self) -> None:
+        parser = cli.build_parser()
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            parser.parse_args(["status", "--wait", "camera=RUNNING"])
+
 
 if __name__ == "__main__":
     unittest.main()
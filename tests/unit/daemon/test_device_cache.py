@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from avreamd.domain.models import AndroidDeviceFingerprint
+from avreamd.managers.device_cache import DeviceInfoCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fingerprint(serial: str, ip: str | None = "192.168.1.20") -> AndroidDeviceFingerprint:
+    return AndroidDeviceFingerprint(serial=serial, serialno="PHONE123", model="Pixel 7", wifi_ip=ip)
+
+
+class DeviceInfoCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_file = Path(self._tmp.name) / "devices.json"
+        self.clock = _Clock()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_identity_survives_restart_and_ip_expires(self) -> None:
+        cache = DeviceInfoCache(cache_file=self.cache_file, ip_ttl_s=30, clock=self.clock)
+        cache.put(_fingerprint("USB123"), persist=True)
+
+        reloaded = DeviceInfoCache(cache_file=self.cache_file, ip_ttl_s=30, clock=self.clock)
+        cached = reloaded.get("USB123")
+        assert cached is not None
+        self.assertEqual((cached.serialno, cached.model, cached.wifi_ip), ("PHONE123", "Pixel 7", "192.168.1.20"))
+
+        self.clock.now += 31
+        cached = reloaded.get("USB123")
+        assert cached is not None
+        self.assertEqual(cached.serialno, "PHONE123")
+        self.assertIsNone(cached.wifi_ip)
+        self.assertFalse(reloaded.ip_fresh("USB123"))
+
+    def test_invalidate_ip_keeps_identity(self) -> None:
+        cache = DeviceInfoCache(cache_file=self.cache_file, clock=self.clock)
+        cache.put(_fingerprint("USB123"), persist=True)
+        cache.invalidate_ip("USB123")
+
+        cached = cache.get("USB123")
+        assert cached is not None
+        self.assertEqual(cached.serialno, "PHONE123")
+        self.assertIsNone(cached.wifi_ip)
+        self.assertFalse(cache.ip_fresh("USB123"))
+
+    def test_missing_ip_is_cached_as_fresh(self) -> None:
+        cache = DeviceInfoCache(clock=self.clock)
+        cache.put(_fingerprint("USB123", ip=None), persist=False)
+        self.assertTrue(cache.ip_fresh("USB123"))
+
+    def test_non_persistent_records_stay_in_memory(self) -> None:
+        cache = DeviceInfoCache(cache_file=self.cache_file, clock=self.clock)
+        cache.put(_fingerprint("USB123"), persist=True)
+        cache.put(_fingerprint("192.168.1.20:5555"), persist=False, with_ip=False)
+
+        data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        self.assertEqual(list(data["devices"]), ["USB123"])
+        self.assertIsNotNone(cache.get("192.168.1.20:5555"))
+
+        cache.forget("192.168.1.20:5555")
+        self.assertIsNone(cache.get("192.168.1.20:5555"))
+
+    def test_corrupt_cache_file_is_ignored(self) -> None:
+        self.cache_file.write_text("{not json", encoding="utf-8")
+        cache = DeviceInfoCache(cache_file=self.cache_file, clock=self.clock)
+        self.assertIsNone(cache.get("USB123"))
+
+
+
+class DeviceInfoCacheWriteTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_file = Path(self._tmp.name) / "devices.json"
+        self.clock = _Clock()
+
+    async def asyncTearDown(self) -> None:
+        self._tmp.cleanup()
+
+    async def test_changes_in_the_loop_are_coalesced_into_one_deferred_write(self) -> None:
+        cache = DeviceInfoCache(cache_file=self.cache_file, clock=self.clock, flush_delay_s=60)
+        cache.put(_fingerprint("USB123"), persist=True)
+        cache.put(_fingerprint("USB456"), persist=True)
+        cache.invalidate_ip("USB123")
+        self.assertFalse(self.cache_file.exists())
+
+        await cache.flush()
+
+        data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        self.assertEqual(list(data["devices"]), ["USB123", "USB456"])
+        self.assertIsNone(data["devices"]["USB123"]["wifi_ip"])
+
+    async def test_pending_change_is_written_after_the_delay(self) -> None:
+        cache = DeviceInfoCache(cache_file=self.cache_file, clock=self.clock, flush_delay_s=0.01)
+        cache.put(_fingerprint("USB123"), persist=True)
+
+        for _ in range(100):
+            if self.cache_file.exists():
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertTrue(self.cache_file.exists())
+
+    async def test_unchanged_record_is_not_written_again(self) -> None:
+        cache = DeviceInfoCache(cache_file=self.cache_file, clock=self.clock, flush_delay_s=0)
+        cache.put(_fingerprint("USB123"), persist=True)
+        await cache.flush()
+        self.cache_file.unlink()
+
+        cache.put(_fingerprint("USB123"), persist=True)
+        await cache.flush()
+
+        self.assertFalse(self.cache_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from avreamd.domain.models import AndroidDeviceFingerprint
+from avreamd.integrations.adb import AdbAdapter
+from avreamd.integrations.adb_protocol import AdbServerUnavailable
+from avreamd.managers.device_cache import DeviceInfoCache
+from avreamd.managers.device_registry import AndroidDeviceRegistry
+
+
+class _TrackingAdbStub(AdbAdapter):
+    def __init__(self, *, can_track: bool = True) -> None:
+        super().__init__(adb_bin="/usr/bin/adb")
+        self._can_track = can_track
+        self.updates: asyncio.Queue[list[dict[str, str]]] = asyncio.Queue()
+        self.scanned: list[dict[str, str]] = []
+        self.scan_calls = 0
+        self.identity_calls: list[str] = []
+
+    @property
+    def can_track(self) -> bool:
+        return self._can_track
+
+    async def track_devices(self):
+        if not self._can_track:
+            raise AdbServerUnavailable("disabled")
+        while True:
+            yield await self.updates.get()
+
+    async def list_devices(self) -> list[dict[str, str]]:
+        self.scan_calls += 1
+        return list(self.scanned)
+
+    async def probe_device(self, *, serial: str) -> AndroidDeviceFingerprint | None:
+        self.identity_calls.append(serial)
+        if serial == "SLOW":
+            await asyncio.sleep(5)
+        return AndroidDeviceFingerprint(serial=serial, serialno="PHONE123", model="Pixel 7", wifi_ip="192.168.1.20")
+
+
+class AndroidDeviceRegistryTests(unittest.IsolatedAsyncioTestCase):
+    async def _wait_tracking(self, registry: AndroidDeviceRegistry) -> None:
+        for _ in range(100):
+            if registry.tracking:
+                return
+            await asyncio.sleep(0.01)
+        self.fail("registry did not start tracking")
+
+    async def test_tracked_devices_are_served_from_memory(self) -> None:
+        adb = _TrackingAdbStub()
+        registry = AndroidDeviceRegistry(adb=adb)
+        await registry.start_background()
+        try:
+            adb.updates.put_nowait([{"serial": "USB123", "state": "device"}])
+            await self._wait_tracking(registry)
+
+            devices = await registry.devices()
+            again = await registry.devices()
+
+            self.assertEqual(devices, again)
+            self.assertEqual(devices[0]["identity"], "PHONE123")
+            self.assertEqual(devices[0]["wifi_candidate_ip"], "192.168.1.20")
+            self.assertEqual(devices[0]["model"], "Pixel 7")
+            self.assertEqual(adb.scan_calls, 0)
+            self.assertEqual(adb.identity_calls, ["USB123"])
+        finally:
+            await registry.stop_background()
+
+    async def test_wait_for_state_resolves_on_track_event(self) -> None:
+        adb = _TrackingAdbStub()
+        registry = AndroidDeviceRegistry(adb=adb)
+        await registry.start_background()
+        try:
+            adb.updates.put_nowait([])
+            await self._wait_tracking(registry)
+
+            waiter = asyncio.create_task(registry.wait_for_state("192.168.1.20:5555", timeout_s=2.0))
+            await asyncio.sleep(0)
+            adb.updates.put_nowait([{"serial": "192.168.1.20:5555", "state": "offline"}])
+            adb.updates.put_nowait([{"serial": "192.168.1.20:5555", "state": "device"}])
+
+            self.assertTrue(await asyncio.wait_for(waiter, timeout=1.0))
+            self.assertEqual(adb.scan_calls, 0)
+        finally:
+            await registry.stop_background()
+
+    async def test_detached_devices_are_dropped(self) -> None:
+        adb = _TrackingAdbStub()
+        registry = AndroidDeviceRegistry(adb=adb)
+        await registry.start_background()
+        try:
+            adb.updates.put_nowait([{"serial": "USB123", "state": "device"}])
+            await self._wait_tracking(registry)
+            version = registry.version
+            adb.updates.put_nowait([])
+            await registry.wait_for_state("USB123", state="gone", timeout_s=0.2)
+
+            self.assertEqual(await registry.devices(), [])
+            self.assertGreater(registry.version, version)
+        finally:
+            await registry.stop_background()
+
+    async def test_falls_back_to_scanning_without_tracking(self) -> None:
+        adb = _TrackingAdbStub(can_track=False)
+        adb.scanned = [{"serial": "USB123", "state": "device"}]
+        registry = AndroidDeviceRegistry(adb=adb, poll_interval_s=0.01)
+        await registry.start_background()
+        try:
+            devices = await registry.devices()
+            self.assertFalse(registry.tracking)
+            self.assertEqual(devices[0]["identity"], "PHONE123")
+            self.assertFalse(await registry.wait_for_state("192.168.1.20:5555", timeout_s=0.05))
+            self.assertGreater(adb.scan_calls, 1)
+        finally:
+            await registry.stop_background()
+
+    async def test_unresponsive_device_does_not_stall_scan(self) -> None:
+        adb = _TrackingAdbStub(can_track=False)
+        adb.scanned = [{"serial": "SLOW", "state": "device"}, {"serial": "USB123", "state": "device"}]
+        registry = AndroidDeviceRegistry(adb=adb, probe_timeout_s=0.1)
+
+        devices = await asyncio.wait_for(registry.devices(), timeout=1.0)
+
+        by_serial = {d["serial"]: d for d in devices}
+        self.assertIsNone(by_serial["SLOW"]["identity"])
+        self.assertEqual(by_serial["USB123"]["identity"], "PHONE123")
+        await registry.stop_background()
+
+    async def test_failed_probe_is_not_retried_before_backoff(self) -> None:
+        adb = _TrackingAdbStub(can_track=False)
+        adb.scanned = [{"serial": "SLOW", "state": "device"}]
+        registry = AndroidDeviceRegistry(adb=adb, probe_timeout_s=0.1, probe_retry_s=60.0)
+
+        await registry.devices()
+        await asyncio.wait_for(registry.devices(), timeout=0.05)
+
+        self.assertEqual(adb.identity_calls, ["SLOW"])
+        self.assertFalse(registry.probe_pending())
+        await registry.stop_background()
+
+    async def test_retry_of_failed_probe_runs_in_background(self) -> None:
+        adb = _TrackingAdbStub(can_track=False)
+        adb.scanned = [{"serial": "SLOW", "state": "device"}]
+        registry = AndroidDeviceRegistry(adb=adb, probe_timeout_s=0.1, probe_retry_s=0.0)
+
+        await registry.devices()
+        await asyncio.wait_for(registry.devices(), timeout=0.05)
+
+        self.assertEqual(adb.identity_calls, ["SLOW", "SLOW"])
+        await registry.stop_background()
+
+    async def test_failed_batched_probe_is_not_repeated_by_fallback(self) -> None:
+        class _OldShellAdb(_TrackingAdbStub):
+            def __init__(self) -> None:
+                super().__init__(can_track=False)
+                self.shell_calls: list[list[str]] = []
+
+            async def probe_device(self, *, serial: str) -> AndroidDeviceFingerprint | None:
+                self.identity_calls.append(serial)
+                return None
+
+            async def _run(self, args: list[str]) -> dict[str, object]:
+                self.shell_calls.append(args)
+                if args[3:] == ["getprop", "ro.serialno"]:
+                    return {"returncode": 0, "stdout": "PHONE123\n"}
+                if args[3:6] == ["ip", "-4", "-o"]:
+                    return {"returncode": 0, "stdout": "30: wlan0    inet 192.168.1.20/24 brd 192.168.1.255\n"}
+                return {"returncode": 1, "stdout": ""}
+
+        adb = _OldShellAdb()
+        adb.scanned = [{"serial": "USB123", "state": "device"}]
+        registry = AndroidDeviceRegistry(adb=adb)
+
+        devices = await registry.devices()
+
+        self.assertEqual(devices[0]["identity"], "PHONE123")
+        self.assertEqual(devices[0]["wifi_candidate_ip"], "192.168.1.20")
+        self.assertEqual(adb.identity_calls, ["USB123"])
+        self.assertEqual(len(adb.shell_calls), 2)
+
+    async def test_unreachable_device_gets_no_per_property_fallback(self) -> None:
+        class _OfflineAdb(_TrackingAdbStub):
+            def __init__(self) -> None:
+                super().__init__(can_track=False)
+                self.shell_calls: list[list[str]] = []
+
+            probe_device = AdbAdapter.probe_device
+
+            async def _run(self, args: list[str]) -> dict[str, object]:
+                self.shell_calls.append(args)
+                return {"returncode": 1, "stdout": "", "stderr": "error: device offline"}
+
+        adb = _OfflineAdb()
+        adb.scanned = [{"serial": "USB123", "state": "device"}]
+        registry = AndroidDeviceRegistry(adb=adb)
+
+        devices = await registry.devices()
+
+        self.assertIsNone(devices[0]["identity"])
+        self.assertEqual(len(adb.shell_calls), 1)
+
+    async def test_cached_identity_and_fresh_ip_skip_probe(self) -> None:
+        cache = DeviceInfoCache()
+        cache.put(AndroidDeviceFingerprint(serial="USB123", serialno="PHONE123", wifi_ip="192.168.1.20"), persist=False)
+        adb = _TrackingAdbStub(can_track=False)
+        adb.scanned = [{"serial": "USB123", "state": "device"}]
+        registry = AndroidDeviceRegistry(adb=adb, cache=cache)
+
+        devices = await registry.devices()
+
+        self.assertEqual(devices[0]["identity"], "PHONE123")
+        self.assertEqual(devices[0]["wifi_candidate_ip"], "192.168.1.20")
+        self.assertEqual(adb.identity_calls, [])
+
+    async def test_offline_transport_invalidates_cached_ip(self) -> None:
+        cache = DeviceInfoCache()
+        adb = _TrackingAdbStub(can_track=False)
+        adb.scanned = [{"serial": "USB123", "state": "device"}]
+        registry = AndroidDeviceRegistry(adb=adb, cache=cache)
+        await registry.devices()
+        self.assertTrue(cache.ip_fresh("USB123"))
+
+        adb.scanned = [{"serial": "USB123", "state": "offline"}]
+        await registry.devices()
+        self.assertFalse(cache.ip_fresh("USB123"))
+
+        adb.scanned = [{"serial": "USB123", "state": "device"}]
+        await registry.devices()
+        self.assertEqual(adb.identity_calls, ["USB123", "USB123"])
+
+    async def test_endpoint_status_answers_without_probing(self) -> None:
+        adb = _TrackingAdbStub(can_track=False)
+        adb.scanned = [{"serial": "USB123", "state": "device"}]
+        registry = AndroidDeviceRegistry(adb=adb)
+
+        await registry.scan(probe=False)
+        self.assertEqual(registry.endpoint_status("192.168.1.20:5555")["state"], None)
+        self.assertEqual(adb.identity_calls, [])
+
+        await registry.devices()
+        status = registry.endpoint_status("192.168.1.20:5555")
+        self.assertEqual((status["serial"], status["match"]), ("USB123", "candidate"))
+
+
+if __name__ == "__main__":
+    unittest.main()
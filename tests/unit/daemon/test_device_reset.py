@@ -5,7 +5,9 @@ from pathlib import Path
 from typing import Any, cast
 
 from avreamd.api.errors import ApiError, busy_device_error
+from avreamd.managers.privilege_client import PrivilegedResult
 from avreamd.managers.video.device_reset import VideoDeviceResetService
+from avreamd.managers.video.loopback_pool import LoopbackDevicePool
 
 
 # ---------------------------------------------------------------------------
@@ -26,11 +28,14 @@ class _PrivilegeStub:
         self._raise_busy = raise_busy
         self._raise_other = raise_other
         self.calls: list[str] = []
+        self.batches: list[list[str]] = []
 
     async def call(self, action: str, payload: dict[str, Any]) -> dict[str, Any]:
         self.calls.append(action)
         if action == "v4l2.status":
             return {"requires_reload": self._requires_reload}
+        if action == "v4l2.reload" and not (self._requires_reload or payload.get("always_reload", True)):
+            return {"reloaded": False, "reason": "already_ready"}
         if self._raise_busy:
             raise ApiError(
                 code="E_BUSY_DEVICE",
@@ -44,21 +49,41 @@ class _PrivilegeStub:
                 message="helper error",
                 status=502,
             )
-        return {"status_after": {"loaded": True}}
+        return {"reloaded": True, "status_after": {"loaded": True}}
+
+    async def call_batch(self, requests: list[tuple[str, dict[str, Any]]]) -> list[PrivilegedResult]:
+        self.batches.append([action for action, _params in requests])
+        results: list[PrivilegedResult] = []
+        for action, params in requests:
+            try:
+                results.append(PrivilegedResult(action=action, data=await self.call(action, params)))
+            except ApiError as exc:
+                results.append(PrivilegedResult(action=action, error=exc))
+        return results
 
 
 class _V4L2Stub:
     video_nr = 10
     device_path = Path("/dev/video10")
 
+    def __init__(self, native: dict[str, Any] | None = None) -> None:
+        self._native = native or {"conclusive": False}
+        self.busy = False
+
     def device_blockers(self) -> list[int]:
         return [1234]
 
+    def device_busy(self) -> bool:
+        return self.busy
+
+    def inspect(self, **_kwargs) -> dict[str, Any]:
+        return dict(self._native)
 
-def _make_service(priv: _PrivilegeStub) -> VideoDeviceResetService:
+
+def _make_service(priv: _PrivilegeStub, v4l2: _V4L2Stub | None = None) -> VideoDeviceResetService:
     return VideoDeviceResetService(
         privilege_client=cast(Any, priv),
-        v4l2=cast(Any, _V4L2Stub()),
+        v4l2=cast(Any, v4l2 or _V4L2Stub()),
     )
 
 
@@ -68,33 +93,102 @@ def _make_service(priv: _PrivilegeStub) -> VideoDeviceResetService:
 
 class VideoDeviceResetServiceTests(unittest.IsolatedAsyncioTestCase):
 
-    async def test_ensure_ready_no_reload_when_not_required(self) -> None:
+    async def test_ensure_ready_fallback_uses_one_batch(self) -> None:
         priv = _PrivilegeStub(requires_reload=False)
         svc = _make_service(priv)
+        svc.note_writer_exit(-9)
         await svc.ensure_ready()
-        self.assertIn("v4l2.status", priv.calls)
-        self.assertNotIn("v4l2.reload", priv.calls)
+        self.assertEqual(priv.batches, [["v4l2.status", "v4l2.reload"]])
+        # The helper skipped the reload, so the crashed writer still leaves the device dirty.
+        self.assertEqual(svc.dirty_reasons, ["writer_exit_-9"])
 
     async def test_ensure_ready_triggers_reload_when_required(self) -> None:
         priv = _PrivilegeStub(requires_reload=True)
         svc = _make_service(priv)
         await svc.ensure_ready()
         self.assertIn("v4l2.reload", priv.calls)
+        self.assertEqual(svc.dirty_reasons, [])
+
+    async def test_ensure_ready_native_inspect_skips_helper(self) -> None:
+        priv = _PrivilegeStub(requires_reload=True)
+        svc = _make_service(priv, _V4L2Stub({"conclusive": True, "requires_reload": False}))
+        await svc.ensure_ready()
+        self.assertEqual(priv.calls, [])
+
+    async def test_ensure_ready_native_mismatch_reloads_without_status_call(self) -> None:
+        priv = _PrivilegeStub()
+        svc = _make_service(
+            priv, _V4L2Stub({"conclusive": True, "requires_reload": True, "reasons": ["label_mismatch"]})
+        )
+        await svc.ensure_ready()
+        self.assertEqual(priv.calls, ["v4l2.reload"])
+
+    async def test_best_effort_reload_skipped_after_clean_stop(self) -> None:
+        priv = _PrivilegeStub()
+        svc = _make_service(priv)
+        svc.note_writer_exit(0)
+        result = await svc.best_effort_reload_after_stop()
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["action"], "skipped")
+        self.assertEqual(result["duration_ms"], 0)
+        self.assertEqual(priv.calls, [])
 
     async def test_best_effort_reload_returns_ok_true_on_success(self) -> None:
         priv = _PrivilegeStub()
         svc = _make_service(priv)
+        svc.note_writer_exit(-9)
         result = await svc.best_effort_reload_after_stop()
         self.assertTrue(result["ok"])
+        self.assertEqual(result["action"], "reload")
+        self.assertEqual(result["reasons"], ["writer_exit_-9"])
         self.assertIn("result", result)
+        self.assertIn("duration_ms", result)
+        # Reloaded: the next stop is clean again.
+        self.assertEqual((await svc.best_effort_reload_after_stop())["action"], "skipped")
 
     async def test_best_effort_reload_returns_ok_false_on_failure(self) -> None:
         priv = _PrivilegeStub(raise_other=True)
         svc = _make_service(priv)
+        svc.note_writer_exit(1)
         result = await svc.best_effort_reload_after_stop()
         self.assertFalse(result["ok"])
         self.assertIn("error", result)
         self.assertIn("helper error", result["error"])
+        self.assertEqual(svc.dirty_reasons, ["writer_exit_1"])
+
+    async def test_reload_is_deferred_while_another_session_streams(self) -> None:
+        nodes = {10: _V4L2Stub(), 11: _V4L2Stub()}
+        nodes[11].video_nr = 11
+        pool = LoopbackDevicePool(base_nr=10, max_devices=2, device_factory=lambda nr: cast(Any, nodes[nr]))
+        priv = _PrivilegeStub()
+        primary = VideoDeviceResetService(privilege_client=cast(Any, priv), v4l2=cast(Any, nodes[10]), pool=pool)
+        secondary = VideoDeviceResetService(privilege_client=cast(Any, priv), v4l2=cast(Any, nodes[11]), pool=pool)
+
+        nodes[10].busy = True
+        secondary.note_writer_exit(-9)
+        deferred = await secondary.best_effort_reload_after_stop()
+
+        self.assertTrue(deferred["ok"])
+        self.assertEqual(deferred["action"], "deferred")
+        self.assertEqual(deferred["busy_slots"], [0])
+        self.assertEqual(priv.calls, [])
+
+        # The primary's clean stop frees the last node and performs the pending reload.
+        nodes[10].busy = False
+        primary.note_writer_exit(0)
+        reloaded = await primary.best_effort_reload_after_stop()
+
+        self.assertEqual(reloaded["action"], "reload")
+        self.assertEqual(reloaded["reasons"], ["writer_exit_-9"])
+        self.assertEqual(priv.calls, ["v4l2.reload"])
+        self.assertEqual(secondary.dirty_reasons, [])
+
+    async def test_failed_config_reload_leaves_device_dirty(self) -> None:
+        priv = _PrivilegeStub(requires_reload=True, raise_other=True)
+        svc = _make_service(priv)
+        with self.assertRaises(ApiError):
+            await svc.ensure_ready()
+        self.assertEqual(svc.dirty_reasons, ["config_mismatch"])
 
     async def test_reset_raises_busy_device_error(self) -> None:
         priv = _PrivilegeStub(raise_busy=True)
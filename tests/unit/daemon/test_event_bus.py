@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import unittest
+
+from avreamd.core.event_bus import EventBus
+from avreamd.core.state_store import DaemonStateStore, SubsystemState
+
+
+class EventBusTests(unittest.IsolatedAsyncioTestCase):
+    async def test_sequence_is_monotonic_and_fanned_out(self) -> None:
+        bus = EventBus()
+        a = bus.subscribe()
+        b = bus.subscribe()
+
+        bus.publish("video.state", {"state": "STARTING"})
+        bus.publish("video.state", {"state": "RUNNING"})
+
+        for sub in (a, b):
+            first = await sub.get()
+            second = await sub.get()
+            assert first is not None and second is not None
+            self.assertEqual((first.seq, second.seq), (1, 2))
+        self.assertEqual(bus.last_seq, 2)
+
+    async def test_resume_replays_missed_events(self) -> None:
+        bus = EventBus()
+        for i in range(5):
+            bus.publish("tick", {"i": i})
+
+        sub = bus.subscribe(since=3)
+        replayed = [await sub.get(), await sub.get()]
+        self.assertEqual([e.seq for e in replayed if e is not None], [4, 5])
+
+    async def test_resume_outside_history_requests_reset(self) -> None:
+        bus = EventBus(history=2)
+        for i in range(5):
+            bus.publish("tick", {"i": i})
+
+        sub = bus.subscribe(since=1)
+        event = await sub.get()
+        assert event is not None
+        self.assertEqual(event.type, "stream.reset")
+        self.assertEqual(event.seq, 5)
+
+    async def test_slow_subscriber_is_cut_off(self) -> None:
+        bus = EventBus(history=1, queue_size=3)
+        sub = bus.subscribe()
+        for i in range(10):
+            bus.publish("tick", {"i": i})
+
+        seen = []
+        while True:
+            event = await sub.get()
+            if event is None:
+                break
+            seen.append(event.seq)
+        self.assertTrue(sub.closed)
+        self.assertLess(len(seen), 10)
+
+    async def test_close_ends_open_subscriptions(self) -> None:
+        bus = EventBus()
+        sub = bus.subscribe()
+        bus.close()
+        self.assertIsNone(await sub.get())
+        self.assertIsNone(await bus.subscribe().get())
+
+    async def test_state_store_publishes_transitions(self) -> None:
+        bus = EventBus()
+        sub = bus.subscribe()
+        store = DaemonStateStore(event_bus=bus)
+
+        await store.transition_video(SubsystemState.STARTING)
+        await store.set_video_error("E_TEST", "boom")
+
+        starting = await sub.get()
+        error = await sub.get()
+        assert starting is not None and error is not None
+        self.assertEqual(starting.type, "video.state")
+        self.assertEqual((starting.data["previous"], starting.data["state"]), ("STOPPED", "STARTING"))
+        self.assertEqual(error.data["state"], "ERROR")
+        self.assertEqual(error.data["last_error"]["code"], "E_TEST")
+
+
+if __name__ == "__main__":
+    unittest.main()
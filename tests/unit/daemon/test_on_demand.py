@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, AsyncIterator, cast
+
+from avreamd.integrations.inotify import IN_CLOSE_NOWRITE, IN_OPEN, InotifyWatch
+from avreamd.managers.video.on_demand import VideoOnDemandController
+
+
+class _FakeWatch:
+    """Replaces inotify: tests push event masks into a shared queue."""
+
+    queue: asyncio.Queue[int]
+
+    def __init__(self, _path: Path, _mask: int) -> None:
+        pass
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    async def events(self) -> AsyncIterator[int]:
+        while True:
+            yield await self.queue.get()
+
+
+class _V4L2Stub:
+    device_path = Path("/dev/video10")
+
+    def __init__(self) -> None:
+        self.openers: list[int] = []
+        self.scans = 0
+
+    def device_openers(self) -> list[int]:
+        self.scans += 1
+        return list(self.openers)
+
+
+class VideoOnDemandControllerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        _FakeWatch.queue = asyncio.Queue()
+        self.v4l2 = _V4L2Stub()
+        self.controller = VideoOnDemandController(v4l2=cast(Any, self.v4l2), watch_factory=cast(Any, _FakeWatch))
+        self.controller.DEBOUNCE_S = 0.01
+        self.calls: list[str] = []
+        self.started = asyncio.Event()
+        self.stopped = asyncio.Event()
+
+    async def asyncTearDown(self) -> None:
+        self.controller.disarm()
+
+    async def _on_demand(self) -> None:
+        self.calls.append("start")
+        self.started.set()
+
+    async def _on_idle(self) -> None:
+        self.calls.append("stop")
+        self.stopped.set()
+
+    def _arm(self, idle_grace_s: float = 0.05) -> None:
+        self.controller.arm(
+            on_demand=self._on_demand,
+            on_idle=self._on_idle,
+            writer_pgid=lambda: None,
+            idle_grace_s=idle_grace_s,
+        )
+
+    async def test_consumer_open_starts_and_close_stops_after_grace(self) -> None:
+        self._arm()
+        await asyncio.sleep(0)
+        self.assertEqual(self.controller.runtime_status()["state"], "waiting")
+
+        self.v4l2.openers = [999999]
+        _FakeWatch.queue.put_nowait(IN_OPEN)
+        await asyncio.wait_for(self.started.wait(), timeout=1.0)
+        await asyncio.sleep(0)
+        self.assertEqual(self.controller.runtime_status()["state"], "streaming")
+        self.assertEqual(self.controller.runtime_status()["consumers"], [999999])
+
+        self.v4l2.openers = []
+        _FakeWatch.queue.put_nowait(IN_CLOSE_NOWRITE)
+        await asyncio.wait_for(self.stopped.wait(), timeout=1.0)
+        await asyncio.sleep(0)
+        self.assertEqual(self.calls, ["start", "stop"])
+        self.assertEqual(self.controller.runtime_status()["state"], "waiting")
+
+    async def test_consumer_returning_within_grace_keeps_streaming(self) -> None:
+        self._arm(idle_grace_s=0.2)
+        self.v4l2.openers = [999999]
+        _FakeWatch.queue.put_nowait(IN_OPEN)
+        await asyncio.wait_for(self.started.wait(), timeout=1.0)
+
+        self.v4l2.openers = []
+        _FakeWatch.queue.put_nowait(IN_CLOSE_NOWRITE)
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.controller.runtime_status()["state"], "idle")
+        self.v4l2.openers = [999999]
+        _FakeWatch.queue.put_nowait(IN_OPEN)
+        await asyncio.sleep(0.3)
+
+        self.assertEqual(self.calls, ["start"])
+        self.assertEqual(self.controller.runtime_status()["state"], "streaming")
+
+    async def test_open_without_consumer_does_not_start(self) -> None:
+        # The daemon's own opens (VIDIOC_QUERYCAP, placeholder, readiness probe) show no foreign holder.
+        self._arm()
+        await asyncio.sleep(0.02)
+        _FakeWatch.queue.put_nowait(IN_OPEN)
+        _FakeWatch.queue.put_nowait(IN_CLOSE_NOWRITE)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.controller.runtime_status()["state"], "waiting")
+
+    async def test_burst_of_events_is_scanned_once(self) -> None:
+        self._arm()
+        await asyncio.sleep(0.02)
+        scans_before = self.v4l2.scans
+        for _ in range(5):
+            _FakeWatch.queue.put_nowait(IN_OPEN)
+            _FakeWatch.queue.put_nowait(IN_CLOSE_NOWRITE)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.v4l2.scans - scans_before, 1)
+
+    async def test_disarm_stops_watching(self) -> None:
+        self._arm()
+        await asyncio.sleep(0)
+        self.controller.disarm()
+        self.v4l2.openers = [999999]
+        _FakeWatch.queue.put_nowait(IN_OPEN)
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.calls, [])
+        status = self.controller.runtime_status()
+        self.assertEqual(status["state"], "off")
+        self.assertFalse(status["enabled"])
+
+
+@unittest.skipUnless(InotifyWatch.available(), "inotify not available")
+class InotifyWatchTests(unittest.IsolatedAsyncioTestCase):
+    async def test_reports_open_and_close(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "video10"
+            path.touch()
+            watch = InotifyWatch(path, IN_OPEN | IN_CLOSE_NOWRITE)
+            watch.open()
+            try:
+                events = watch.events()
+                with open(path, "rb"):
+                    pass
+                first = await asyncio.wait_for(events.__anext__(), timeout=1.0)
+                second = await asyncio.wait_for(events.__anext__(), timeout=1.0)
+                await events.aclose()
+            finally:
+                watch.close()
+        self.assertTrue(first & IN_OPEN)
+        self.assertTrue(second & IN_CLOSE_NOWRITE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from avreamd.integrations.pactl import PactlIntegration
+
+
+_JSON_PACTL = textwrap.dedent(
+    """\
+    #!/bin/sh
+    if [ "$1" = "-f" ] && [ "$2" = "json" ]; then
+      shift 2
+      case "$*" in
+        "list short modules") echo '[{"index":5,"name":"module-null-sink","argument":"sink_name=avream_sink"}]' ;;
+        "list sink-inputs") echo '[{"index":12,"sink":3,"properties":{"application.process.id":"4242"}}]' ;;
+        *) echo '[]' ;;
+      esac
+      exit 0
+    fi
+    if [ "$1" = "unload-module" ]; then
+      [ "$2" = "99" ] && exit 1
+      exit 0
+    fi
+    echo "unexpected: $*" >&2
+    exit 1
+    """
+)
+
+_TEXT_PACTL = textwrap.dedent(
+    """\
+    #!/bin/sh
+    if [ "$1" = "-f" ]; then
+      echo "Invalid format" >&2
+      exit 1
+    fi
+    case "$*" in
+      "list short modules") printf '5\\tmodule-null-sink\\tsink_name=avream_sink\\n' ;;
+      "list sink-inputs") printf 'Sink Input #12\\n\\tSink: 3\\n\\tProperties:\\n\\t\\tapplication.process.id = "4242"\\n' ;;
+      *) exit 1 ;;
+    esac
+    """
+)
+
+
+class PactlIntegrationTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _integration(self, script: str) -> PactlIntegration:
+        path = Path(self._tmp.name) / "pactl"
+        path.write_text(script, encoding="utf-8")
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+        integration = PactlIntegration()
+        integration.pactl = str(path)
+        return integration
+
+    async def test_json_output_is_parsed(self) -> None:
+        pactl = self._integration(_JSON_PACTL)
+        modules = await pactl.list_modules()
+        inputs = await pactl.list_sink_inputs_detailed()
+
+        self.assertEqual(modules, [{"id": "5", "name": "module-null-sink", "args": "sink_name=avream_sink"}])
+        self.assertEqual(inputs, [{"id": "12", "sink": "3", "properties": {"application.process.id": "4242"}}])
+
+    async def test_falls_back_to_text_without_json_support(self) -> None:
+        pactl = self._integration(_TEXT_PACTL)
+        modules = await pactl.list_modules()
+        inputs = await pactl.list_sink_inputs_detailed()
+
+        self.assertEqual(modules, [{"id": "5", "name": "module-null-sink", "args": "sink_name=avream_sink"}])
+        self.assertEqual(inputs, [{"id": "12", "sink": "3", "properties": {"application.process.id": "4242"}}])
+        self.assertIs(pactl._json_supported, False)
+
+    async def test_transient_json_failure_does_not_disable_json(self) -> None:
+        # The first call fails like a sound server that is not up yet; later calls succeed.
+        marker = Path(self._tmp.name) / "started"
+        pactl = self._integration(
+            _JSON_PACTL.replace(
+                "#!/bin/sh\n",
+                f"#!/bin/sh\nif [ ! -e {marker} ]; then touch {marker}; echo 'Connection failure: Connection refused' >&2; exit 1; fi\n",
+                1,
+            )
+        )
+
+        with self.assertRaises(RuntimeError):
+            await pactl.list_modules()
+        self.assertIsNone(pactl._json_supported)
+        modules = await pactl.list_modules()
+
+        self.assertEqual(modules, [{"id": "5", "name": "module-null-sink", "args": "sink_name=avream_sink"}])
+        self.assertTrue(pactl._json_supported)
+
+    async def test_unload_modules_reports_successful_ids(self) -> None:
+        pactl = self._integration(_JSON_PACTL)
+        self.assertEqual(await pactl.unload_modules([7, 99, 8, 7]), [7, 8])
+
+    async def test_subscribe_parses_events_and_closes_process(self) -> None:
+        pactl = self._integration(
+            "#!/bin/sh\n"
+            "echo \"Event 'new' on sink-input #7\"\n"
+            "echo \"Event 'change' on sink #3\"\n"
+            "exec sleep 30\n"
+        )
+        subscription = await pactl.subscribe()
+        try:
+            events = [await anext(subscription), await anext(subscription)]
+        finally:
+            await subscription.aclose()
+
+        self.assertEqual(events, [("new", "sink-input", 7), ("change", "sink", 3)])
+        self.assertIsNotNone(subscription._proc.returncode)
+
+
+if __name__ == "__main__":
+    unittest.main()
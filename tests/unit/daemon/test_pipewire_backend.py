@@ -35,7 +35,7 @@ class _PactlStub:
     def available(self) -> bool:
         return self._available
 
-    def load_module(self, name: str, args: list[str]) -> int:
+    async def load_module(self, name: str, args: list[str]) -> int:
         self._load_count += 1
         if self._fail_load:
             raise RuntimeError("load-module failed")
@@ -46,24 +46,28 @@ class _PactlStub:
         self.loaded.append((name, args))
         return mid
 
-    def unload_module(self, module_id: int) -> None:
+    async def unload_module(self, module_id: int) -> None:
         self.unloaded.append(module_id)
 
-    def list_modules(self) -> list[dict[str, str]]:
+    async def unload_modules(self, module_ids: list[int]) -> list[int]:
+        self.unloaded.extend(module_ids)
+        return list(module_ids)
+
+    async def list_modules(self) -> list[dict[str, str]]:
         if not self._available:
             raise FileNotFoundError("pactl not found")
         return list(self._modules)
 
-    def list_sink_inputs_detailed(self) -> list[dict[str, Any]]:
+    async def list_sink_inputs_detailed(self) -> list[dict[str, Any]]:
         return []
 
-    def move_sink_input(self, sink_input_id: int, sink_name: str) -> None:
+    async def move_sink_input(self, sink_input_id: int, sink_name: str) -> None:
         pass
 
-    def default_source(self) -> str | None:
+    async def default_source(self) -> str | None:
         return None
 
-    def list_sources(self) -> list[str]:
+    async def list_sources(self) -> list[str]:
         return []
 
 
@@ -72,19 +76,24 @@ class _PipewireStub:
 
     pw_loopback: str | None = None
 
-    def supports_native_virtual_mic(self) -> bool:
+    async def supports_native_virtual_mic(self) -> bool:
         return False
 
     def available(self) -> bool:
         return False
 
-    def running(self) -> bool:
+    async def running(self) -> bool:
         return False
 
 
 class _FastRouterStub:
     """Router stub that returns immediately."""
 
+    active = False
+
+    def set_source_pid(self, pid: int | None) -> None:
+        self.source_pid = pid
+
     async def move_once(self) -> dict[str, Any]:
         return {"moved": 0, "attempts": 0, "matched": 0, "error": None}
 
@@ -120,7 +129,7 @@ class PipeWireAudioBackendTests(unittest.IsolatedAsyncioTestCase):
 
     # -- cleanup_stale_pactl_modules --
 
-    def test_cleanup_removes_avream_modules_only(self) -> None:
+    async def test_cleanup_removes_avream_modules_only(self) -> None:
         pactl = _PactlStub(
             modules=[
                 {"id": "5", "name": "module-null-sink", "args": "sink_name=avream_sink something"},
@@ -129,26 +138,26 @@ class PipeWireAudioBackendTests(unittest.IsolatedAsyncioTestCase):
             ]
         )
         backend = _make_backend(pactl)
-        removed = backend.cleanup_stale_pactl_modules()
+        removed = await backend.cleanup_stale_pactl_modules()
         self.assertEqual(sorted(removed), [5, 6])
         self.assertIn(5, pactl.unloaded)
         self.assertIn(6, pactl.unloaded)
         self.assertNotIn(7, pactl.unloaded)
 
-    def test_cleanup_returns_empty_when_pactl_unavailable(self) -> None:
+    async def test_cleanup_returns_empty_when_pactl_unavailable(self) -> None:
         pactl = _PactlStub(available=False)
         backend = _make_backend(pactl)
-        result = backend.cleanup_stale_pactl_modules()
+        result = await backend.cleanup_stale_pactl_modules()
         self.assertEqual(result, [])
 
-    def test_cleanup_returns_empty_when_no_avream_modules(self) -> None:
+    async def test_cleanup_returns_empty_when_no_avream_modules(self) -> None:
         pactl = _PactlStub(
             modules=[
                 {"id": "3", "name": "module-alsa-card", "args": "device=hw:0"},
             ]
         )
         backend = _make_backend(pactl)
-        result = backend.cleanup_stale_pactl_modules()
+        result = await backend.cleanup_stale_pactl_modules()
         self.assertEqual(result, [])
 
     # -- start() via pactl path --
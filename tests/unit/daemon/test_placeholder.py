@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from avreamd.managers.video.placeholder import PlaceholderFrameWriter, reconnecting_frame_i420
+
+
+class ReconnectingFrameTests(unittest.TestCase):
+    def test_frame_is_i420_sized_with_neutral_chroma(self) -> None:
+        frame = reconnecting_frame_i420(64, 40)
+
+        self.assertEqual(len(frame), 64 * 40 * 3 // 2)
+        self.assertEqual(frame[0], 0x20)
+        self.assertEqual(frame[20 * 64], 0x80)
+        self.assertEqual(set(frame[64 * 40 :]), {0x80})
+
+    def test_frame_is_fitted_to_driver_sizeimage(self) -> None:
+        self.assertEqual(len(reconnecting_frame_i420(64, 40, size=4096)), 4096)
+        self.assertEqual(len(reconnecting_frame_i420(64, 40, size=100)), 100)
+
+
+class PlaceholderFrameWriterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_start_refuses_non_v4l2_node(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            node = Path(tmp) / "video10"
+            node.write_bytes(b"")
+            writer = PlaceholderFrameWriter(node)
+
+            self.assertFalse(writer.start())
+            self.assertFalse(writer.active)
+            self.assertEqual(node.read_bytes(), b"")
+            writer.stop()
+
+    async def test_start_on_missing_node_returns_false(self) -> None:
+        writer = PlaceholderFrameWriter(Path("/nonexistent/video10"))
+        self.assertFalse(writer.start())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import unittest
 from unittest.mock import patch
 
@@ -12,8 +13,10 @@ class _ProcStub:
         self.returncode = returncode
         self._stdout = stdout
         self._stderr = stderr
+        self.request: dict[str, object] | None = None
 
-    async def communicate(self, _payload: bytes) -> tuple[bytes, bytes]:
+    async def communicate(self, payload: bytes) -> tuple[bytes, bytes]:
+        self.request = json.loads(payload)
         return self._stdout, self._stderr
 
 
@@ -57,6 +60,69 @@ class PrivilegeClientTests(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(data.get("reloaded"))
         self.assertEqual(create_proc.call_count, 2)
 
+    async def test_call_batch_uses_one_elevation_and_maps_errors_per_action(self) -> None:
+        client = PrivilegeClient(helper_bin="/usr/libexec/avream-helper")
+        client.mode = "direct"
+        response = {
+            "ok": True,
+            "data": {
+                "results": [
+                    {"action": "v4l2.status", "ok": True, "data": {"requires_reload": True}},
+                    {"action": "v4l2.reload", "ok": False, "error": {"code": "E_BUSY_DEVICE", "message": "busy"}},
+                    {"action": "noop", "ok": False, "error": {"code": "E_SKIPPED", "message": "skipped"}},
+                ]
+            },
+        }
+        proc = _ProcStub(returncode=0, stdout=json.dumps(response).encode())
+
+        with patch("asyncio.create_subprocess_exec", return_value=proc) as create_proc:
+            results = await client.call_batch([("v4l2.status", {}), ("v4l2.reload", {"force": False}), ("noop", {})])
+
+        self.assertEqual(create_proc.call_count, 1)
+        assert proc.request is not None
+        self.assertEqual(proc.request["action"], "batch")
+        self.assertEqual(
+            proc.request["params"],
+            {
+                "requests": [
+                    {"action": "v4l2.status", "params": {}},
+                    {"action": "v4l2.reload", "params": {"force": False}},
+                    {"action": "noop", "params": {}},
+                ],
+                "stop_on_error": True,
+            },
+        )
+        self.assertEqual(results[0].unwrap(), {"requires_reload": True})
+        self.assertFalse(results[1].ok)
+        assert results[1].error is not None
+        self.assertEqual(results[1].error.code, "E_BUSY_DEVICE")
+        self.assertEqual((results[1].error.details or {})["action"], "v4l2.reload")
+        self.assertEqual(results[2].error.code if results[2].error else None, "E_BACKEND_FAILED")
+
+    async def test_call_batch_rejects_non_allowlisted_action_before_spawning(self) -> None:
+        client = PrivilegeClient(helper_bin="/usr/libexec/avream-helper")
+        with patch("asyncio.create_subprocess_exec") as create_proc:
+            with self.assertRaises(ApiError) as ctx:
+                await client.call_batch([("noop", {}), ("batch", {})])
+        self.assertEqual(ctx.exception.code, "E_UNSUPPORTED")
+        create_proc.assert_not_called()
+
+    async def test_call_batch_falls_back_for_helper_without_batch(self) -> None:
+        client = PrivilegeClient(helper_bin="/usr/libexec/avream-helper")
+        client.mode = "direct"
+        procs = [
+            _ProcStub(returncode=0, stdout=b'{"ok": false, "error": {"code": "E_ACTION", "message": "unsupported action"}}'),
+            _ProcStub(returncode=0, stdout=b'{"ok": true, "data": {"noop": true}}'),
+            _ProcStub(returncode=0, stdout=b'{"ok": true, "data": {"module_loaded": false}}'),
+        ]
+
+        with patch("asyncio.create_subprocess_exec", side_effect=procs) as create_proc:
+            results = await client.call_batch([("noop", {}), ("snd_aloop.status", {})])
+
+        self.assertEqual(create_proc.call_count, 3)
+        self.assertEqual([r.unwrap() for r in results], [{"noop": True}, {"module_loaded": False}])
+        self.assertIs(client._batch_supported, False)
+
 
 if __name__ == "__main__":
     unittest.main()
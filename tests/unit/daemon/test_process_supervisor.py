@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+import textwrap
+import time
+import unittest
+from pathlib import Path
+
+from avreamd.core.process_supervisor import ProcessSupervisor, _proc_stat
+
+
+def _script(body: str) -> list[str]:
+    return ["bash", "-c", textwrap.dedent(body)]
+
+
+class ProcessSupervisorTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_dir = Path(self._tmp.name)
+        self.supervisor = ProcessSupervisor(self.log_dir)
+
+    async def asyncTearDown(self) -> None:
+        await self.supervisor.stop_all()
+        self._tmp.cleanup()
+
+    async def test_output_is_teed_to_session_log_and_matched(self) -> None:
+        await self.supervisor.start(
+            "proc",
+            _script(
+                """
+                echo "INFO: starting"
+                sleep 0.1
+                echo "INFO: v4l2 sink started to device: /dev/video10" >&2
+                exec sleep 30
+                """
+            ),
+        )
+
+        line = await self.supervisor.wait_for_line("proc", lambda l: "v4l2 sink started" in l, timeout=5.0)
+        self.assertEqual(line, "INFO: v4l2 sink started to device: /dev/video10")
+
+        await self.supervisor.stop("proc")
+        log_text = (self.log_dir / "proc.log").read_text()
+        self.assertIn("INFO: starting\n", log_text)
+        self.assertIn("v4l2 sink started", log_text)
+
+    async def test_wait_for_line_returns_none_when_process_exits_first(self) -> None:
+        managed = await self.supervisor.start("proc", _script('echo "ERROR: device not found"; exit 2'))
+
+        line = await self.supervisor.wait_for_line("proc", lambda l: "v4l2 sink started" in l, timeout=5.0)
+
+        self.assertIsNone(line)
+        self.assertEqual(await managed.process.wait(), 2)
+        self.assertEqual(list(managed.output), ["ERROR: device not found"])
+
+    async def test_line_listeners_replay_ring_then_follow_output(self) -> None:
+        managed = await self.supervisor.start(
+            "proc",
+            _script(
+                """
+                echo "one"
+                echo "two"
+                sleep 0.3
+                echo "three"
+                exec sleep 30
+                """
+            ),
+        )
+        await self.supervisor.wait_for_line("proc", lambda l: l == "two", timeout=5.0)
+
+        seen: list[str] = []
+        managed.add_line_listener(seen.append)
+        self.assertEqual(seen, ["one", "two"])
+
+        await self.supervisor.wait_for_line("proc", lambda l: l == "three", timeout=5.0)
+        self.assertEqual(seen, ["one", "two", "three"])
+        self.assertEqual(managed.output_tail(2), ["two", "three"])
+
+    async def test_wait_for_line_times_out_on_silent_process(self) -> None:
+        await self.supervisor.start("proc", ["sleep", "30"])
+
+        started = time.monotonic()
+        line = await self.supervisor.wait_for_line("proc", lambda _l: True, timeout=0.2)
+
+        self.assertIsNone(line)
+        self.assertLess(time.monotonic() - started, 2.0)
+
+    async def test_stop_waits_for_whole_process_group(self) -> None:
+        pid_file = self.log_dir / "child.pid"
+        await self.supervisor.start(
+            "proc",
+            _script(
+                f"""
+                bash -c 'trap "" TERM; echo $$ > {pid_file}; exec >/dev/null 2>&1; while true; do sleep 0.05; done' &
+                trap 'exit 0' TERM
+                while [ ! -s {pid_file} ]; do sleep 0.01; done
+                echo ready
+                while true; do sleep 0.05; done
+                """
+            ),
+        )
+        self.assertEqual(await self.supervisor.wait_for_line("proc", lambda l: l == "ready", timeout=5.0), "ready")
+        child_pid = int(pid_file.read_text().strip())
+
+        await self.supervisor.stop("proc", graceful_timeout=0.5, kill_timeout=2.0)
+
+        # The TERM-ignoring child was killed with the group before stop returned
+        # (at most a zombie awaiting its reaper is left; it holds no files).
+        stat = _proc_stat(child_pid)
+        self.assertTrue(stat is None or stat[0] == "Z")
+        self.assertFalse(self.supervisor.running("proc"))
+        self.assertEqual(self.supervisor.last_exit_code("proc"), 0)
+
+    async def test_stop_all_stops_groups_concurrently_under_one_deadline(self) -> None:
+        for name in ("a", "b", "c"):
+            await self.supervisor.start(name, _script("trap '' TERM; echo ready; while true; do sleep 0.05; done"))
+        for name in ("a", "b", "c"):
+            await self.supervisor.wait_for_line(name, lambda l: l == "ready", timeout=5.0)
+
+        started = time.monotonic()
+        await self.supervisor.stop_all(timeout=1.0)
+
+        # Sequential stops of three TERM-ignoring groups would take 3x the budget.
+        self.assertLess(time.monotonic() - started, 2.0)
+        for name in ("a", "b", "c"):
+            self.assertFalse(self.supervisor.running(name))
+            stats = self.supervisor.stop_stats(name)
+            assert stats is not None
+            self.assertTrue(stats["escalated"])
+            self.assertEqual(stats["returncode"], -9)
+            self.assertGreaterEqual(stats["group_exit_ms"], stats["leader_exit_ms"])
+            self.assertEqual(stats["exit_watch"], "pidfd")
+
+
+class ProcessAdoptionTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_dir = Path(self._tmp.name)
+        self.manifest_dir = self.log_dir / "processes"
+
+    async def asyncTearDown(self) -> None:
+        self._tmp.cleanup()
+
+    async def test_restarted_supervisor_adopts_detached_process(self) -> None:
+        previous = ProcessSupervisor(self.log_dir, manifest_dir=self.manifest_dir)
+        managed = await previous.start(
+            "proc",
+            _script(
+                """
+                trap 'exit 0' TERM
+                echo before
+                sleep 0.3
+                echo after
+                while true; do sleep 0.05; done
+                """
+            ),
+            meta={"serial": "ABC123", "sink": "/dev/video10"},
+        )
+        pid = managed.process.pid
+        self.assertEqual(await previous.wait_for_line("proc", lambda l: l == "before", timeout=5.0), "before")
+
+        self.assertEqual(await previous.detach_all(), ["proc"])
+        self.assertFalse(previous.running("proc"))
+        os.kill(pid, 0)  # still running
+        # Stand in for the init process that reaps orphans of a real daemon.
+        reaper = asyncio.create_task(asyncio.to_thread(os.waitpid, pid, 0))
+
+        current = ProcessSupervisor(self.log_dir, manifest_dir=self.manifest_dir)
+        adopted = current.adopt()
+
+        self.assertEqual([m.name for m in adopted], ["proc"])
+        self.assertTrue(adopted[0].adopted)
+        self.assertEqual(adopted[0].process.pid, pid)
+        self.assertEqual(adopted[0].meta, {"serial": "ABC123", "sink": "/dev/video10"})
+        self.assertTrue(current.running("proc"))
+        # Output keeps flowing through the session log after the handover.
+        self.assertEqual(await current.wait_for_line("proc", lambda l: l == "after", timeout=5.0), "after")
+
+        await current.stop("proc", graceful_timeout=2.0)
+        await reaper
+        self.assertFalse(current.running("proc"))
+        self.assertEqual(current.last_exit_code("proc"), -15)
+        self.assertFalse((self.manifest_dir / "proc.json").exists())
+
+    async def test_stale_manifest_is_not_adopted(self) -> None:
+        supervisor = ProcessSupervisor(self.log_dir, manifest_dir=self.manifest_dir)
+        managed = await supervisor.start("proc", ["sleep", "30"])
+        record = json.loads((self.manifest_dir / "proc.json").read_text())
+        stat = _proc_stat(managed.process.pid)
+        assert stat is not None
+        self.assertEqual(record["start_time"], stat[2])
+
+        # Same pid, different start time: the pid was reused by another process.
+        record["start_time"] += 1
+        (self.manifest_dir / "proc-copy.json").write_text(json.dumps(record))
+
+        other = ProcessSupervisor(self.log_dir, manifest_dir=self.manifest_dir)
+        self.assertEqual([m.name for m in other.adopt()], ["proc"])
+        self.assertFalse((self.manifest_dir / "proc-copy.json").exists())
+        await other.detach_all()
+        await supervisor.stop_all()
+        self.assertEqual(list(self.manifest_dir.glob("*.json")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -71,16 +71,35 @@ class _StoppedStateStore:
         return 0
 
 
+class _PlaceholderStub:
+    def __init__(self, events: list[str]) -> None:
+        self._events = events
+        self.active = False
+
+    def start(self) -> bool:
+        if not self.active:
+            self.active = True
+            self._events.append("placeholder.start")
+        return True
+
+    def stop(self) -> None:
+        if self.active:
+            self.active = False
+            self._events.append("placeholder.stop")
+
+
 def _make_ctrl(
     *,
     supervisor: object | None = None,
     state_store: object | None = None,
+    placeholder: object | None = None,
 ) -> VideoReconnectController:
     from avreamd.core.state_store import DaemonStateStore
     return VideoReconnectController(
         state_store=cast(Any, state_store or DaemonStateStore()),
         supervisor=cast(Any, supervisor or _ImmediateExitSupervisor()),
         proc_name="test-proc",
+        placeholder=cast(Any, placeholder),
     )
 
 
@@ -207,6 +226,65 @@ class VideoReconnectControllerTests(unittest.IsolatedAsyncioTestCase):
         await asyncio.wait_for(ctrl._task, timeout=1.0)
         self.assertEqual(restart_calls, [])
 
+    async def test_placeholder_bridges_backoff_and_releases_before_restart(self) -> None:
+        events: list[str] = []
+        attempts = 0
+
+        async def on_restart() -> None:
+            nonlocal attempts
+            attempts += 1
+            events.append(f"restart.{attempts}")
+            if attempts == 1:
+                raise RuntimeError("device still gone")
+
+        async def on_exhausted(rc: int | None, n: int) -> None:
+            raise AssertionError("on_exhausted should not be called")
+
+        placeholder = _PlaceholderStub(events)
+        ctrl = _make_ctrl(
+            supervisor=_ImmediateExitSupervisor(exit_code=1),
+            state_store=_RunningStateStore(),
+            placeholder=placeholder,
+        )
+        ctrl.configure(ReconnectPolicy(enabled=True, max_attempts=3, backoff_ms=1))
+        ctrl.start_watch(on_restart=on_restart, on_exhausted=on_exhausted)
+        assert ctrl._task is not None
+        await asyncio.wait_for(ctrl._task, timeout=2.0)
+
+        self.assertEqual(
+            events,
+            [
+                "placeholder.start",
+                "placeholder.stop",
+                "restart.1",
+                "placeholder.start",
+                "placeholder.stop",
+                "restart.2",
+            ],
+        )
+        self.assertFalse(placeholder.active)
+
+    async def test_placeholder_released_before_exhausted_handler(self) -> None:
+        events: list[str] = []
+
+        async def on_restart() -> None:
+            raise RuntimeError("restart failed")
+
+        async def on_exhausted(rc: int | None, n: int) -> None:
+            events.append("exhausted")
+
+        ctrl = _make_ctrl(
+            supervisor=_ImmediateExitSupervisor(exit_code=1),
+            state_store=_RunningStateStore(),
+            placeholder=_PlaceholderStub(events),
+        )
+        ctrl.configure(ReconnectPolicy(enabled=True, max_attempts=1, backoff_ms=1))
+        ctrl.start_watch(on_restart=on_restart, on_exhausted=on_exhausted)
+        assert ctrl._task is not None
+        await asyncio.wait_for(ctrl._task, timeout=2.0)
+
+        self.assertEqual(events[-2:], ["placeholder.stop", "exhausted"])
+
 
 if __name__ == "__main__":
     unittest.main()
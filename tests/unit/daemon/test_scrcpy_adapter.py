@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import unittest
 
-from avreamd.integrations.scrcpy import ScrcpyAdapter
+from avreamd.integrations.scrcpy import ScrcpyAdapter, parse_output_line
 
 
 class ScrcpyAdapterTests(unittest.TestCase):
@@ -18,6 +18,7 @@ class ScrcpyAdapterTests(unittest.TestCase):
         self.assertIn("--no-window", cmd)
         self.assertIn("--camera-facing=front", cmd)
         self.assertIn("--video-source=camera", cmd)
+        self.assertNotIn("--print-fps", cmd)
 
     def test_command_enables_preview_window_when_requested(self) -> None:
         adapter = ScrcpyAdapter(scrcpy_bin="/usr/bin/scrcpy")
@@ -32,6 +33,7 @@ class ScrcpyAdapterTests(unittest.TestCase):
         self.assertIn("--window-width=640", cmd)
         self.assertIn("--window-height=360", cmd)
         self.assertNotIn("--no-window", cmd)
+        self.assertIn("--print-fps", cmd)
 
     def test_command_enables_phone_mic_when_audio_requested(self) -> None:
         adapter = ScrcpyAdapter(scrcpy_bin="/usr/bin/scrcpy")
@@ -55,6 +57,29 @@ class ScrcpyAdapterTests(unittest.TestCase):
         )
         self.assertIn("--capture-orientation=270", cmd)
 
+    def test_known_output_lines_parse_into_events(self) -> None:
+        cases = {
+            "scrcpy 2.4 <https://github.com/Genymobile/scrcpy>": ("version", {"version": "2.4"}),
+            "[server] INFO: Device: [Google] google Pixel 7 (Android 14)": (
+                "device",
+                {"manufacturer": "Google", "model": "google Pixel 7", "android": "14"},
+            ),
+            "[server] INFO: Using video encoder: 'c2.exynos.h264.encoder'": (
+                "encoder",
+                {"stream": "video", "encoder": "c2.exynos.h264.encoder"},
+            ),
+            "INFO: v4l2 sink started to device: /dev/video10": ("sink", {"device": "/dev/video10"}),
+            "INFO: 29 fps (+3 frames skipped)": ("fps", {"fps": 29, "skipped": 3}),
+            "[server] ERROR: Camera error": ("error", {"message": "Camera error", "origin": "server"}),
+        }
+        for line, (kind, data) in cases.items():
+            event = parse_output_line(line)
+            assert event is not None, line
+            self.assertEqual((event.kind, event.data), (kind, data))
+
+        self.assertIsNone(parse_output_line("INFO: Renderer: opengl"))
+        self.assertIsNone(parse_output_line("adb: no devices/emulators found"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from typing import Any, cast
+
+from avreamd.managers.audio.routing.scrcpy_router import ScrcpyAudioRouter
+
+
+class _Subscription:
+    def __init__(self, events: asyncio.Queue[tuple[str, str, int] | None]) -> None:
+        self._events = events
+
+    def __aiter__(self) -> _Subscription:
+        return self
+
+    async def __anext__(self) -> tuple[str, str, int]:
+        event = await self._events.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    async def aclose(self) -> None:
+        return None
+
+
+class _PactlStub:
+    available = True
+
+    def __init__(self) -> None:
+        self.inputs: list[dict[str, object]] = []
+        self.moves: list[tuple[int, str]] = []
+        self.list_calls = 0
+        self.events: asyncio.Queue[tuple[str, str, int] | None] = asyncio.Queue()
+        self.subscribed = asyncio.Event()
+        self.appears_during_first_list: dict[str, object] | None = None
+
+    async def list_sink_inputs_detailed(self) -> list[dict[str, object]]:
+        self.list_calls += 1
+        inputs = list(self.inputs)
+        if self.list_calls == 1 and self.appears_during_first_list is not None:
+            # The server only reports it to clients subscribed by now.
+            self.inputs.append(self.appears_during_first_list)
+            if self.subscribed.is_set():
+                await self.events.put(("new", "sink-input", int(str(self.appears_during_first_list["id"]))))
+        return inputs
+
+    async def list_sinks(self) -> list[dict[str, str]]:
+        return [{"id": "0", "name": "alsa_output.speakers"}, {"id": "8", "name": "avream_sink"}]
+
+    async def move_sink_input(self, sink_input_id: int, sink_name: str) -> None:
+        self.moves.append((sink_input_id, sink_name))
+
+    async def subscribe(self) -> _Subscription:
+        self.subscribed.set()
+        return _Subscription(self.events)
+
+
+def _sink_input(sid: int, pid: int, name: str = "scrcpy", sink: str = "alsa_output.speakers") -> dict[str, object]:
+    return {
+        "id": str(sid),
+        "sink": sink,
+        "properties": {
+            "application.name": name,
+            "application.process.binary": name,
+            "application.process.id": str(pid),
+        },
+    }
+
+
+class ScrcpyAudioRouterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_move_once_matches_supervised_pid_only(self) -> None:
+        pactl = _PactlStub()
+        pactl.inputs = [_sink_input(3, pid=100), _sink_input(4, pid=200), _sink_input(5, pid=300, name="firefox")]
+        router = ScrcpyAudioRouter(pactl=cast(Any, pactl), sink_name="avream_sink")
+        router.set_source_pid(200)
+
+        result = await router.move_once()
+
+        self.assertEqual(pactl.moves, [(4, "avream_sink")])
+        self.assertEqual(result["matched"], 1)
+
+    async def test_already_routed_stream_is_not_moved_again(self) -> None:
+        pactl = _PactlStub()
+        # pactl reports the sink by index.
+        pactl.inputs = [_sink_input(3, pid=100, sink="8")]
+        router = ScrcpyAudioRouter(pactl=cast(Any, pactl), sink_name="avream_sink")
+        router.set_source_pid(100)
+
+        result = await router.move_once()
+
+        self.assertEqual(pactl.moves, [])
+        self.assertEqual((result["matched"], result["moved"]), (1, 0))
+
+    async def test_background_reacts_only_to_new_sink_input_events(self) -> None:
+        pactl = _PactlStub()
+        router = ScrcpyAudioRouter(pactl=cast(Any, pactl), sink_name="avream_sink")
+        router.set_source_pid(100)
+        router.start_background(is_active=lambda: True)
+        try:
+            await asyncio.wait_for(pactl.subscribed.wait(), timeout=1.0)
+            await asyncio.sleep(0)
+            initial_lists = pactl.list_calls
+
+            pactl.inputs = [_sink_input(7, pid=100)]
+            await pactl.events.put(("change", "sink-input", 7))
+            await pactl.events.put(("new", "sink", 9))
+            await pactl.events.put(("new", "sink-input", 7))
+            for _ in range(20):
+                if pactl.moves:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            router.stop_background()
+
+        self.assertEqual(pactl.moves, [(7, "avream_sink")])
+        self.assertEqual(pactl.list_calls, initial_lists + 1)
+
+    async def test_stream_created_during_initial_sweep_is_routed(self) -> None:
+        pactl = _PactlStub()
+        pactl.appears_during_first_list = _sink_input(9, pid=100)
+        router = ScrcpyAudioRouter(pactl=cast(Any, pactl), sink_name="avream_sink")
+        router.set_source_pid(100)
+        router.start_background(is_active=lambda: True)
+        try:
+            for _ in range(50):
+                if pactl.moves:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            router.stop_background()
+
+        self.assertEqual(pactl.moves, [(9, "avream_sink")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import gzip
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from avreamd.core.session_logs import SessionLogRetention, SessionLogStore
+
+
+class SessionLogStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_dir = Path(self._tmp.name)
+        self.t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write_logs(self, store: SessionLogStore, name: str, count: int, size: int = 1000) -> list[Path]:
+        paths = []
+        for i in range(count):
+            path = store.new_log(name, self.t0 + timedelta(minutes=i))
+            path.write_bytes(b"x" * (size - 1) + b"\n")
+            paths.append(path)
+        return paths
+
+    def test_rotated_logs_are_compressed_and_latest_is_kept(self) -> None:
+        store = SessionLogStore(self.log_dir)
+        paths = self._write_logs(store, "video-android", 3)
+
+        result = store.maintain(now=self.t0.timestamp())
+
+        self.assertEqual(result, {"compressed": 2, "removed": 0})
+        self.assertTrue(paths[2].exists())
+        self.assertFalse(paths[0].exists())
+        with gzip.open(paths[0].with_name(paths[0].name + ".gz")) as fh:
+            self.assertEqual(len(fh.read()), 1000)
+        self.assertEqual(store.latest("video-android"), paths[2])
+        self.assertEqual(store.summary()["compressed"], 2)
+
+    def test_retention_by_age_count_and_size(self) -> None:
+        store = SessionLogStore(
+            self.log_dir,
+            SessionLogRetention(max_files=5, max_total_bytes=10_000, max_age_s=3600, compress=False),
+        )
+        old = store.new_log("video-android-11", self.t0 - timedelta(days=1))
+        old.write_text("old\n")
+        current = store.new_log("video-android-11", self.t0 - timedelta(days=1, minutes=-1))
+        current.write_text("cur\n")
+        paths = self._write_logs(store, "video-android", 6, size=3000)
+
+        result = store.maintain(now=self.t0.timestamp() + 600)
+
+        # Age drops the rotated day-old log; count then size drop the three oldest others.
+        self.assertEqual(result, {"compressed": 0, "removed": 4})
+        self.assertFalse(old.exists())
+        # A name's latest log is never removed, however old.
+        self.assertTrue(current.exists())
+        self.assertEqual([p.exists() for p in paths], [False, False, False, True, True, True])
+        self.assertEqual(store.summary()["files"], 4)
+
+    def test_index_is_reloaded_and_built_once_from_existing_logs(self) -> None:
+        for stamp in ("20260101T100000Z", "20260101T110000Z"):
+            (self.log_dir / f"video-android-{stamp}.log").write_text("line\n")
+        (self.log_dir / "video-android.log").symlink_to("video-android-20260101T110000Z.log")
+
+        store = SessionLogStore(self.log_dir)
+        self.assertEqual(store.latest("video-android"), self.log_dir / "video-android-20260101T110000Z.log")
+        self.assertEqual(store.summary()["files"], 2)
+
+        index = json.loads((self.log_dir / "index.json").read_text())
+        self.assertEqual(index["latest"], {"video-android": "video-android-20260101T110000Z.log"})
+        new = store.new_log("video-android", self.t0 + timedelta(days=1))
+        self.assertEqual(SessionLogStore(self.log_dir).latest("video-android"), new)
+
+
+if __name__ == "__main__":
+    unittest.main()
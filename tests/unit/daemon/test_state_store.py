@@ -27,6 +27,78 @@ class StateStoreTests(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(InvalidTransitionError):
             await store.transition_video(SubsystemState.RUNNING)
 
+    async def test_snapshot_is_versioned_and_copy_on_write(self) -> None:
+        store = DaemonStateStore()
+        before = await store.snapshot()
+        self.assertEqual(before["version"], 0)
+        self.assertEqual(store.current(), before)
+
+        await store.transition_video(SubsystemState.STARTING)
+        after = await store.snapshot()
+        self.assertEqual(after["version"], 1)
+        self.assertEqual(store.version, 1)
+        self.assertEqual(before["video"]["state"], "STOPPED")
+        self.assertEqual(after["video"]["state"], "STARTING")
+
+        # No-op transitions do not bump the version.
+        await store.transition_video(SubsystemState.STARTING)
+        self.assertEqual(store.version, 1)
+
+    async def test_mutating_a_snapshot_leaves_the_store_unchanged(self) -> None:
+        store = DaemonStateStore()
+        await store.set_video_error("E_TEST", "boom", {"output": ["line"]})
+        expected = await store.snapshot()
+
+        snapshot = await store.snapshot()
+        snapshot["extra"] = True
+        snapshot["video"]["state"] = "RUNNING"
+        snapshot["video"]["last_error"]["details"]["output"].append("more")
+        with self.assertRaises(TypeError):
+            store.current()["video"]["last_error"]["details"]["injected"] = True  # type: ignore[index]
+
+        self.assertEqual(await store.snapshot(), expected)
+        self.assertEqual(store.current()["video"]["last_error"]["details"]["output"], ("line",))
+
+    async def test_changed_wakes_on_next_transition(self) -> None:
+        store = DaemonStateStore()
+        waiter = asyncio.create_task(store.changed(store.version))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        await store.set_audio_error("E_TEST", "boom")
+        snapshot = await asyncio.wait_for(waiter, timeout=1.0)
+        self.assertEqual(snapshot["version"], 1)
+        self.assertEqual(snapshot["audio"]["state"], "ERROR")
+
+    async def test_changed_returns_immediately_when_behind_and_on_timeout(self) -> None:
+        store = DaemonStateStore()
+        await store.transition_audio(SubsystemState.STARTING)
+        self.assertEqual((await store.changed(0))["version"], 1)
+        snapshot = await store.changed(1, timeout_s=0.01)
+        self.assertEqual(snapshot["version"], 1)
+
+    async def test_video_session_view_tracks_its_own_state(self) -> None:
+        events: list[tuple[str, dict]] = []
+
+        class _Bus:
+            def publish(self, event_type: str, data: dict) -> None:
+                events.append((event_type, data))
+
+        store = DaemonStateStore(event_bus=_Bus())  # type: ignore[arg-type]
+        view = store.video_session("video11")
+        self.assertEqual((await view.snapshot())["video"]["state"], "STOPPED")
+
+        await view.transition_video(SubsystemState.STARTING)
+        await view.set_video_error("E_TEST", "boom")
+
+        snapshot = await store.snapshot()
+        self.assertEqual(snapshot["video"]["state"], "STOPPED")
+        self.assertEqual(snapshot["video_sessions"]["video11"]["state"], "ERROR")
+        self.assertEqual((await view.snapshot())["video"]["last_error"]["code"], "E_TEST")
+        self.assertEqual([(t, d["session"]) for t, d in events], [("video_session.state", "video11")] * 2)
+        with self.assertRaises(InvalidTransitionError):
+            await view.transition_video(SubsystemState.RUNNING)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from avreamd.integrations.v4l2loopback import VIDIOC_QUERYCAP, V4L2LoopbackIntegration
+
+
+class V4L2LoopbackInspectTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.dev = root / "dev"
+        self.sys = root / "sys"
+        self.modules = root / "modules"
+        self.dev.mkdir()
+        self.params = self.sys / "module" / "v4l2loopback" / "parameters"
+        self.params.mkdir(parents=True)
+        self.name_file = self.sys / "class" / "video4linux" / "video10" / "name"
+        self.name_file.parent.mkdir(parents=True)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _integration(self) -> V4L2LoopbackIntegration:
+        return V4L2LoopbackIntegration(video_nr=10, dev_dir=self.dev, sys_dir=self.sys, proc_modules=self.modules)
+
+    def _loaded(self, *, video_nr: str = "10", exclusive_caps: str = "Y", card: str = "AVream Camera") -> None:
+        self.modules.write_text("videodev 1 0 - Live 0x0\nv4l2loopback 49152 0 - Live 0x0\n")
+        (self.params / "video_nr").write_text(video_nr + "\n")
+        (self.params / "exclusive_caps").write_text(exclusive_caps + "\n")
+        self.name_file.write_text(card + "\n")
+        (self.dev / "video10").touch()
+
+    def test_querycap_request_number(self) -> None:
+        self.assertEqual(VIDIOC_QUERYCAP, 0x80685600)
+
+    def test_matching_config_needs_no_reload(self) -> None:
+        self._loaded(video_nr="3,10", exclusive_caps="N,Y")
+
+        status = self._integration().inspect(label="AVream Camera", exclusive_caps=True)
+
+        self.assertTrue(status["conclusive"])
+        self.assertFalse(status["requires_reload"])
+        self.assertEqual(status["slot_index"], 1)
+        self.assertEqual(status["reasons"], [])
+
+    def test_label_and_caps_mismatch_require_reload(self) -> None:
+        self._loaded(exclusive_caps="N", card="Dummy video device (0x0000)")
+
+        status = self._integration().inspect(label="AVream Camera", exclusive_caps=True)
+
+        self.assertTrue(status["conclusive"])
+        self.assertTrue(status["requires_reload"])
+        self.assertEqual(status["reasons"], ["label_mismatch", "exclusive_caps_mismatch"])
+
+    def test_module_not_loaded_is_conclusive(self) -> None:
+        self.modules.write_text("videodev 1 0 - Live 0x0\n")
+
+        status = self._integration().inspect(label="AVream Camera", exclusive_caps=True)
+
+        self.assertTrue(status["conclusive"])
+        self.assertTrue(status["requires_reload"])
+        self.assertEqual(status["reasons"], ["module_not_loaded", "device_missing"])
+
+    def test_device_openers_scans_proc_fds(self) -> None:
+        (self.dev / "video10").touch()
+        integration = self._integration()
+        self.assertNotIn(os.getpid(), integration.device_openers())
+
+        with open(self.dev / "video10", "rb"):
+            self.assertIn(os.getpid(), integration.device_openers())
+            self.assertTrue(integration.device_busy())
+
+    def test_unreadable_params_are_inconclusive(self) -> None:
+        self._loaded()
+        (self.params / "exclusive_caps").unlink()
+
+        status = self._integration().inspect(label="AVream Camera", exclusive_caps=True)
+
+        self.assertFalse(status["conclusive"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,31 +1,65 @@
 from __future__ import annotations
 
+import asyncio
 import unittest
 from pathlib import Path
 from typing import Any, cast
 
+from avreamd.api.errors import ApiError
 from avreamd.core.state_store import DaemonStateStore
+from avreamd.managers.privilege_client import PrivilegedResult
 from avreamd.managers.video_manager import VideoManager
 
 
 class _Process:
     def __init__(self) -> None:
         self.returncode: int | None = None
+        self.pid = 4242
+
+    async def wait(self) -> int:
+        await asyncio.Event().wait()
+        return 0
 
 
 class _Managed:
     def __init__(self) -> None:
         self.process = _Process()
+        self.output = ["INFO: v4l2 sink started to device: /dev/video10"]
+        self.listeners: list = []
+
+    def add_line_listener(self, listener, *, replay: bool = True) -> None:
+        if replay:
+            for line in self.output:
+                listener(line)
+        self.listeners.append(listener)
+
+    def output_tail(self, count: int) -> list[str]:
+        return self.output[-count:]
+
+    def feed(self, line: str) -> None:
+        self.output.append(line)
+        for listener in self.listeners:
+            listener(line)
 
 
 class _SupervisorStub:
     def __init__(self) -> None:
         self._running = False
         self._last_exit = None
-
-    async def start(self, _name: str, _command: list[str]) -> _Managed:
+        self.calls: list[str] = []
+        self.env: dict[str, str] | None = None
+
+    async def start(
+        self, _name: str, _command: list[str], env: dict[str, str] | None = None, meta=None
+    ) -> _Managed:
+        self.calls.append("supervisor.start")
+        self.env = env
         self._running = True
-        return _Managed()
+        self.managed = _Managed()
+        return self.managed
+
+    async def wait_for_line(self, _name: str, predicate, _timeout: float) -> str | None:
+        return "INFO: v4l2 sink started to device: /dev/video10"
 
     async def stop(self, _name: str) -> None:
         self._running = False
@@ -44,6 +78,12 @@ class _SupervisorStub:
     def latest_log_path(self, _name: str) -> str:
         return "/tmp/video-android.log"
 
+    def stop_stats(self, _name: str) -> dict[str, object] | None:
+        return None
+
+    def log_summary(self) -> dict[str, object]:
+        return {"files": 0, "bytes": 0, "compressed": 0}
+
 
 class _BackendStub:
     class _Source:
@@ -66,6 +106,9 @@ class _PrivilegeStub:
             return {"requires_reload": False}
         return {}
 
+    async def call_batch(self, requests: list[tuple[str, dict[str, object]]]) -> list[PrivilegedResult]:
+        return [PrivilegedResult(action=action, data=await self.call(action, params)) for action, params in requests]
+
 
 class _V4L2Stub:
     video_nr = 10
@@ -74,10 +117,26 @@ class _V4L2Stub:
     def device_blockers(self) -> list[int]:
         return []
 
+    def inspect(self, **_kwargs) -> dict[str, object]:
+        # Native state unreadable: readiness goes through the helper.
+        return {"conclusive": False}
+
 
 class _AudioStub:
+    def __init__(self, calls: list[str] | None = None) -> None:
+        self.calls = calls if calls is not None else []
+        self.routed_pid: int | None = None
+
     async def start(self, backend: str = "pipewire") -> dict[str, object]:
-        return {"state": "RUNNING", "backend": backend}
+        self.calls.append("audio.start")
+        return {"state": "RUNNING", "already_running": False, "backend": backend}
+
+    def stream_env(self) -> dict[str, str]:
+        return {"PULSE_SINK": "avream_sink"}
+
+    async def route_source_pid(self, pid: int | None) -> dict[str, object] | None:
+        self.routed_pid = pid
+        return None
 
     async def stop(self) -> dict[str, object]:
         return {"state": "STOPPED"}
@@ -85,18 +144,25 @@ class _AudioStub:
 
 class VideoManagerTests(unittest.IsolatedAsyncioTestCase):
     async def test_start_and_stop(self) -> None:
+        supervisor = _SupervisorStub()
+        audio = _AudioStub(supervisor.calls)
         manager = VideoManager(
             state_store=DaemonStateStore(),
             backend=cast(Any, _BackendStub()),
-            supervisor=cast(Any, _SupervisorStub()),
+            supervisor=cast(Any, supervisor),
             privilege_client=cast(Any, _PrivilegeStub()),
             v4l2=cast(Any, _V4L2Stub()),
-            audio_manager=cast(Any, _AudioStub()),
+            audio_manager=cast(Any, audio),
         )
 
         started = await manager.start(serial="ABC123", camera_facing="front", camera_rotation=0, preview_window=False)
         self.assertEqual(started["state"], "RUNNING")
         self.assertEqual(started["source"]["serial"], "ABC123")
+        # Audio sink exists before scrcpy starts, and scrcpy is pointed at it.
+        self.assertEqual(supervisor.calls, ["audio.start", "supervisor.start"])
+        self.assertEqual(supervisor.env, {"PULSE_SINK": "avream_sink"})
+        self.assertEqual(audio.routed_pid, 4242)
+        self.assertTrue({"v4l2_ready", "select_source", "audio_start", "launch", "total"} <= set(started["timings_ms"]))
 
         stopped = await manager.stop()
         self.assertEqual(stopped["state"], "STOPPED")
@@ -115,6 +181,163 @@ class VideoManagerTests(unittest.IsolatedAsyncioTestCase):
         self.assertIn("reconnect", status)
         self.assertIn("log_pointers", status)
 
+    async def test_backend_output_feeds_state_and_log(self) -> None:
+        supervisor = _SupervisorStub()
+        store = DaemonStateStore()
+        manager = VideoManager(
+            state_store=store,
+            backend=cast(Any, _BackendStub()),
+            supervisor=cast(Any, supervisor),
+            privilege_client=cast(Any, _PrivilegeStub()),
+            v4l2=cast(Any, _V4L2Stub()),
+        )
+        await manager.start(serial="ABC123")
+
+        managed = supervisor.managed
+        managed.feed("[server] INFO: Device: [Google] google Pixel 7 (Android 14)")
+        managed.feed("[server] INFO: Using video encoder: 'c2.exynos.h264.encoder'")
+        managed.feed("INFO: 30 fps")
+        managed.feed("INFO: Renderer: opengl")
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        backend = store.current()["video"]["backend"]
+        self.assertEqual(backend["sink"], "/dev/video10")
+        self.assertEqual(backend["device"]["model"], "google Pixel 7")
+        self.assertEqual(backend["encoders"], {"video": "c2.exynos.h264.encoder"})
+        # Per-second fps reports stay out of the state store.
+        self.assertNotIn("fps", backend)
+
+        log = manager.output_log(3)
+        self.assertEqual(len(log["lines"]), 3)
+        self.assertEqual([e["kind"] for e in log["events"]], ["device", "encoder", "fps"])
+        self.assertEqual(log["backend"]["fps"], 30)
+
+        await manager.stop()
+        # The last session's output stays readable after a stop.
+        self.assertEqual(manager.output_log(1)["lines"], ["INFO: Renderer: opengl"])
+
+    async def test_start_runs_readiness_and_source_selection_concurrently(self) -> None:
+        helper_called = asyncio.Event()
+
+        class _SlowPrivilegeStub(_PrivilegeStub):
+            async def call(self, action: str, payload: dict[str, object]) -> dict[str, object]:
+                helper_called.set()
+                await asyncio.sleep(0.05)
+                return await super().call(action, payload)
+
+        class _WaitingBackendStub(_BackendStub):
+            async def select_default_source(self, preferred_serial: str | None = None):
+                # Deadlocks (and times out) if readiness ran strictly before selection.
+                await asyncio.wait_for(helper_called.wait(), timeout=1.0)
+                return await super().select_default_source(preferred_serial)
+
+        manager = VideoManager(
+            state_store=DaemonStateStore(),
+            backend=cast(Any, _WaitingBackendStub()),
+            supervisor=cast(Any, _SupervisorStub()),
+            privilege_client=cast(Any, _SlowPrivilegeStub()),
+            v4l2=cast(Any, _V4L2Stub()),
+            audio_manager=cast(Any, _AudioStub()),
+        )
+        started = await manager.start(serial="ABC123")
+        self.assertEqual(started["state"], "RUNNING")
+
+    async def test_failed_readiness_rolls_back_state_and_audio(self) -> None:
+        class _FailingPrivilegeStub(_PrivilegeStub):
+            async def call(self, _action: str, _payload: dict[str, object]) -> dict[str, object]:
+                raise RuntimeError("helper failed")
+
+        class _TrackingAudioStub(_AudioStub):
+            stopped = False
+
+            async def stop(self) -> dict[str, object]:
+                self.stopped = True
+                return await super().stop()
+
+        store = DaemonStateStore()
+        supervisor = _SupervisorStub()
+        audio = _TrackingAudioStub()
+        manager = VideoManager(
+            state_store=store,
+            backend=cast(Any, _BackendStub()),
+            supervisor=cast(Any, supervisor),
+            privilege_client=cast(Any, _FailingPrivilegeStub()),
+            v4l2=cast(Any, _V4L2Stub()),
+            audio_manager=cast(Any, audio),
+        )
+        with self.assertRaises(RuntimeError):
+            await manager.start(serial="ABC123")
+
+        self.assertEqual(store.current()["video"]["state"], "STOPPED")
+        self.assertTrue(audio.stopped)
+        self.assertNotIn("supervisor.start", supervisor.calls)
+
+    async def test_backend_exit_before_sink_ready_is_reported(self) -> None:
+        class _ExitingSupervisor(_SupervisorStub):
+            async def start(
+                self, _name: str, _command: list[str], env: dict[str, str] | None = None, meta=None
+            ) -> _Managed:
+                managed = await super().start(_name, _command, env=env)
+                managed.process.returncode = 1
+                managed.output = ["ERROR: Could not find any ADB device"]
+                self._running = False
+                return managed
+
+            async def wait_for_line(self, _name: str, predicate, _timeout: float) -> str | None:
+                return None
+
+        store = DaemonStateStore()
+        manager = VideoManager(
+            state_store=store,
+            backend=cast(Any, _BackendStub()),
+            supervisor=cast(Any, _ExitingSupervisor()),
+            privilege_client=cast(Any, _PrivilegeStub()),
+            v4l2=cast(Any, _V4L2Stub()),
+        )
+        with self.assertRaises(ApiError) as ctx:
+            await manager.start(serial="ABC123")
+
+        self.assertEqual(ctx.exception.details["output"], ["ERROR: Could not find any ADB device"])
+        self.assertEqual(store.current()["video"]["last_error"]["code"], "E_BACKEND_FAILED")
+
+    async def test_backend_without_readiness_is_stopped_not_assumed_running(self) -> None:
+        class _SilentSupervisor(_SupervisorStub):
+            silent = True
+
+            async def wait_for_line(self, _name: str, predicate, _timeout: float) -> str | None:
+                return None if self.silent else await super().wait_for_line(_name, predicate, _timeout)
+
+        class _TrackingAudioStub(_AudioStub):
+            stopped = False
+
+            async def stop(self) -> dict[str, object]:
+                self.stopped = True
+                return await super().stop()
+
+        store = DaemonStateStore()
+        supervisor = _SilentSupervisor()
+        audio = _TrackingAudioStub()
+        manager = VideoManager(
+            state_store=store,
+            backend=cast(Any, _BackendStub()),
+            supervisor=cast(Any, supervisor),
+            privilege_client=cast(Any, _PrivilegeStub()),
+            v4l2=cast(Any, _V4L2Stub()),
+            audio_manager=cast(Any, audio),
+        )
+        with self.assertRaises(ApiError) as ctx:
+            await manager.start(serial="ABC123")
+
+        self.assertEqual(ctx.exception.code, "E_TIMEOUT")
+        self.assertFalse(supervisor.running("video-android"))
+        self.assertTrue(audio.stopped)
+        video = store.current()["video"]
+        self.assertEqual((video["state"], video["last_error"]["code"]), ("ERROR", "E_BACKEND_TIMEOUT"))
+
+        supervisor.silent = False
+        self.assertEqual((await manager.start(serial="ABC123"))["state"], "RUNNING")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from pathlib import Path
+from typing import Any, cast
+
+from avreamd.api.errors import ApiError, busy_device_error
+from avreamd.core.state_store import DaemonStateStore
+from avreamd.domain.models import AndroidDeviceEntry
+from avreamd.managers.privilege_client import PrivilegedResult
+from avreamd.managers.video import LoopbackDevicePool
+from avreamd.managers.video_manager import VideoManager
+from avreamd.managers.video_sessions import VideoSessionRegistry
+
+
+class _Process:
+    def __init__(self, pid: int) -> None:
+        self.returncode: int | None = None
+        self.pid = pid
+
+    async def wait(self) -> int:
+        await asyncio.Event().wait()
+        return 0
+
+
+class _Managed:
+    def __init__(self, pid: int, meta: dict[str, Any] | None = None) -> None:
+        self.process = _Process(pid)
+        self.output: list[str] = []
+        self.meta = meta or {}
+
+    def add_line_listener(self, _listener, *, replay: bool = True) -> None:
+        pass
+
+    def output_tail(self, count: int) -> list[str]:
+        return self.output[-count:]
+
+
+class _SupervisorStub:
+    """Tracks processes per name, like the real supervisor."""
+
+    def __init__(self) -> None:
+        self.running_names: set[str] = set()
+        self.started: list[str] = []
+        self.managed: dict[str, _Managed] = {}
+
+    async def start(
+        self, name: str, _command: list[str], env: dict[str, str] | None = None, meta=None
+    ) -> _Managed:
+        self.started.append(name)
+        self.running_names.add(name)
+        self.managed[name] = _Managed(4000 + len(self.started), meta)
+        return self.managed[name]
+
+    def seed(self, name: str, meta: dict[str, Any]) -> None:
+        """A process adopted from a previous daemon."""
+        self.running_names.add(name)
+        self.managed[name] = _Managed(3000, meta)
+
+    async def wait_for_line(self, _name: str, _predicate, _timeout: float) -> str | None:
+        return "INFO: v4l2 sink started"
+
+    async def stop(self, name: str) -> None:
+        self.running_names.discard(name)
+
+    async def wait(self, _name: str) -> int:
+        await asyncio.Event().wait()
+        return 0
+
+    def running(self, name: str) -> bool:
+        return name in self.running_names
+
+    def get(self, name: str) -> _Managed | None:
+        return self.managed.get(name) if name in self.running_names else None
+
+    def last_exit_code(self, _name: str) -> int | None:
+        return None
+
+    def latest_log_path(self, name: str) -> str:
+        return f"/tmp/{name}.log"
+
+    def stop_stats(self, _name: str) -> dict[str, object] | None:
+        return None
+
+    def log_summary(self) -> dict[str, object]:
+        return {"files": 0, "bytes": 0, "compressed": 0}
+
+
+class _BackendStub:
+    class _Source:
+        def __init__(self, serial: str) -> None:
+            self.serial = serial
+
+    def __init__(self) -> None:
+        self.commands: list[dict[str, Any]] = []
+        self.gates: dict[str, asyncio.Event] = {}
+
+    async def select_default_source(self, preferred_serial: str | None = None):
+        gate = self.gates.get(preferred_serial or "")
+        if gate is not None:
+            await gate.wait()
+        return _BackendStub._Source(preferred_serial or "ABC123")
+
+    def build_start_command(self, **kwargs) -> list[str]:
+        self.commands.append(kwargs)
+        return ["/usr/bin/scrcpy"]
+
+
+class _PrivilegeStub:
+    """Reloads load every requested node, and fail like the helper while a node is open."""
+
+    def __init__(self, loaded: set[int], busy: set[int]) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self._loaded = loaded
+        self._busy = busy
+
+    async def call(self, action: str, payload: dict[str, Any]) -> dict[str, Any]:
+        self.calls.append((action, payload))
+        if action == "v4l2.reload":
+            if self._busy:
+                raise busy_device_error("device busy", {"busy": sorted(self._busy)})
+            base = int(payload["video_nr"])
+            self._loaded.clear()
+            self._loaded.update(range(base, base + int(payload.get("devices", 1))))
+        return {"reloaded": True}
+
+    async def call_batch(self, requests: list[tuple[str, dict[str, Any]]]) -> list[PrivilegedResult]:
+        return [PrivilegedResult(action=action, data=await self.call(action, params)) for action, params in requests]
+
+
+class _V4L2Stub:
+    def __init__(self, video_nr: int, loaded: set[int]) -> None:
+        self.video_nr = video_nr
+        self.device_path = Path(f"/dev/video{video_nr}")
+        self._loaded = loaded
+
+    def device_blockers(self) -> list[int]:
+        return []
+
+    def inspect(self, **_kwargs) -> dict[str, object]:
+        ready = self.video_nr in self._loaded
+        return {"conclusive": True, "requires_reload": not ready}
+
+
+class _DeviceRegistryStub:
+    def __init__(self, identities: dict[str, str]) -> None:
+        self._identities = identities
+
+    def get(self, serial: str) -> AndroidDeviceEntry | None:
+        identity = self._identities.get(serial)
+        if identity is None:
+            return None
+        return AndroidDeviceEntry(serial=serial, state="device", transport="usb", identity=identity)
+
+
+class VideoSessionRegistryTests(unittest.IsolatedAsyncioTestCase):
+    def _make(self, *, max_devices: int = 4, identities: dict[str, str] | None = None) -> VideoSessionRegistry:
+        self.loaded = {10}
+        self.busy: set[int] = set()
+        self.store = DaemonStateStore()
+        self.supervisor = _SupervisorStub()
+        self.backend = _BackendStub()
+        self.privilege = _PrivilegeStub(self.loaded, self.busy)
+        self.pool = LoopbackDevicePool(
+            base_nr=10,
+            max_devices=max_devices,
+            device_factory=lambda nr: cast(Any, _V4L2Stub(nr, self.loaded)),
+        )
+        primary = VideoManager(
+            state_store=self.store,
+            backend=cast(Any, self.backend),
+            supervisor=cast(Any, self.supervisor),
+            privilege_client=cast(Any, self.privilege),
+            v4l2=self.pool.device(0),
+            pool=self.pool,
+        )
+        return VideoSessionRegistry(
+            primary=primary,
+            pool=self.pool,
+            state_store=self.store,
+            backend=cast(Any, self.backend),
+            supervisor=cast(Any, self.supervisor),
+            privilege_client=cast(Any, self.privilege),
+            device_registry=cast(Any, _DeviceRegistryStub(identities or {})),
+        )
+
+    async def test_phones_get_separate_devices_processes_and_state(self) -> None:
+        registry = self._make()
+
+        first = await registry.start("PHONE_A")
+        second = await registry.start("PHONE_B", camera_facing="back")
+
+        self.assertEqual((first["slot"], first["device"], first["label"]), (0, "/dev/video10", "AVream Camera"))
+        self.assertEqual((second["slot"], second["device"], second["label"]), (1, "/dev/video11", "AVream Camera 2"))
+        self.assertEqual(self.supervisor.started, ["video-android", "video-android-11"])
+        # Only the primary session carries phone audio into the virtual mic.
+        self.assertEqual([c["enable_audio"] for c in self.backend.commands], [True, False])
+        self.assertEqual(self.backend.commands[1]["sink_path"], "/dev/video11")
+
+        snapshot = self.store.current()
+        self.assertEqual(snapshot["video"]["state"], "RUNNING")
+        self.assertEqual(snapshot["video_sessions"]["video11"]["state"], "RUNNING")
+
+        # Only video10 was loaded: the first start reloads the module with the whole pool.
+        reloads = [params for action, params in self.privilege.calls if action == "v4l2.reload"]
+        self.assertEqual(len(reloads), 1)
+        self.assertEqual(reloads[0]["devices"], 4)
+        self.assertEqual(reloads[0]["video_nr"], 10)
+
+        sessions = await registry.list_sessions()
+        self.assertEqual([(s["serial"], s["state"]) for s in sessions], [("PHONE_A", "RUNNING"), ("PHONE_B", "RUNNING")])
+        self.assertEqual(sessions[1]["active_source"]["camera_facing"], "back")
+
+    async def test_second_phone_starts_while_first_streams(self) -> None:
+        registry = self._make()
+        await registry.start("PHONE_A")
+        # The helper refuses to reload the module while /dev/video10 is open.
+        self.busy.add(10)
+
+        second = await registry.start("PHONE_B")
+
+        self.assertEqual((second["state"], second["device"]), ("RUNNING", "/dev/video11"))
+        self.assertEqual(self.store.current()["video_sessions"]["video11"]["state"], "RUNNING")
+        reloads = [params for action, params in self.privilege.calls if action == "v4l2.reload"]
+        self.assertEqual([r["devices"] for r in reloads], [4])
+
+    async def test_same_phone_over_usb_and_wifi_shares_one_session(self) -> None:
+        registry = self._make(identities={"USB123": "PHONE123", "192.168.1.20:5555": "PHONE123"})
+
+        first = await registry.start("USB123")
+        again = await registry.start("192.168.1.20:5555")
+
+        self.assertEqual(again["slot"], first["slot"])
+        self.assertTrue(again["already_running"])
+        self.assertEqual(again["identity"], "PHONE123")
+        self.assertEqual(self.supervisor.started, ["video-android"])
+
+    async def test_sessions_start_concurrently(self) -> None:
+        registry = self._make()
+        self.backend.gates["SLOW"] = asyncio.Event()
+
+        slow = asyncio.create_task(registry.start("SLOW"))
+        await asyncio.sleep(0)
+        # A session whose phone is still being selected does not hold up another.
+        fast = await asyncio.wait_for(registry.start("FAST"), timeout=1.0)
+        self.assertEqual(fast["slot"], 1)
+        self.assertFalse(slow.done())
+
+        self.backend.gates["SLOW"].set()
+        self.assertEqual((await slow)["slot"], 0)
+
+    async def test_slots_are_released_on_stop_and_bounded(self) -> None:
+        registry = self._make(max_devices=2)
+        await registry.start("PHONE_A")
+        await registry.start("PHONE_B")
+
+        with self.assertRaises(ApiError) as ctx:
+            await registry.start("PHONE_C")
+        self.assertEqual(ctx.exception.code, "E_CONFLICT")
+
+        stopped = await registry.stop("PHONE_B")
+        self.assertEqual(stopped["state"], "STOPPED")
+        self.assertEqual(self.store.current()["video_sessions"]["video11"]["state"], "STOPPED")
+
+        third = await registry.start("PHONE_C")
+        self.assertEqual(third["device"], "/dev/video11")
+
+        with self.assertRaises(ApiError) as ctx:
+            await registry.stop("PHONE_B")
+        self.assertEqual(ctx.exception.code, "E_VALIDATION")
+
+    async def test_primary_started_through_video_start_is_listed(self) -> None:
+        registry = self._make()
+        primary = registry._manager(0)
+        await primary.start(serial="PHONE_A")
+
+        sessions = await registry.list_sessions()
+        self.assertEqual([(s["serial"], s["slot"], s["primary"]) for s in sessions], [("PHONE_A", 0, True)])
+
+        second = await registry.start("PHONE_B")
+        self.assertEqual(second["slot"], 1)
+
+        await primary.stop()
+        self.assertEqual([s["serial"] for s in await registry.list_sessions()], ["PHONE_B"])
+
+    async def test_sessions_adopted_after_daemon_restart(self) -> None:
+        registry = self._make()
+        self.supervisor.seed(
+            "video-android-11",
+            {"serial": "PHONE_B", "sink": "/dev/video11", "camera_facing": "back", "camera_rotation": 90},
+        )
+        # Started for a different node than the slot it is named after: not adopted.
+        self.supervisor.seed("video-android-12", {"serial": "PHONE_C", "sink": "/dev/video10"})
+
+        self.assertEqual(await registry.adopt(), ["PHONE_B"])
+
+        self.assertFalse(self.supervisor.running("video-android-12"))
+        sessions = await registry.list_sessions()
+        self.assertEqual([(s["serial"], s["slot"], s["state"]) for s in sessions], [("PHONE_B", 1, "RUNNING")])
+        self.assertEqual(sessions[0]["active_source"]["camera_facing"], "back")
+        self.assertEqual(sessions[0]["active_source"]["camera_rotation"], 90)
+
+        again = await registry.start("PHONE_B")
+        self.assertTrue(again["already_running"])
+        self.assertEqual(self.supervisor.started, [])
+        self.assertEqual(self.privilege.calls, [])
+
+
+class LoopbackDevicePoolTests(unittest.TestCase):
+    def test_helper_params_describe_whole_pool(self) -> None:
+        pool = LoopbackDevicePool(base_nr=10, max_devices=4)
+        self.assertEqual(
+            pool.helper_params(), {"video_nr": 10, "label": "AVream Camera", "exclusive_caps": True, "devices": 4}
+        )
+        self.assertEqual(pool.helper_params(force=True)["devices"], 4)
+        single = LoopbackDevicePool(base_nr=10, max_devices=1)
+        self.assertNotIn("devices", single.helper_params())
+        self.assertEqual(pool.label_for(2), "AVream Camera 3")
+        self.assertEqual(pool.device(3).video_nr, 13)
+        self.assertIs(pool.device(3), pool.device(3))
+        with self.assertRaises(ValueError):
+            pool.device(4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,15 +11,24 @@ from aiohttp import ClientSession, ClientTimeout, UnixConnector
 class ApiClient:
     def __init__(self, socket_path: str | None = None) -> None:
         self.socket_path = socket_path or os.getenv("AVREAM_SOCKET_PATH") or f"{os.getenv('XDG_RUNTIME_DIR', '/tmp')}/avream/daemon.sock"
+        # path -> (etag, body) of the last 200 GET; replayed on 304.
+        self._etag_cache: dict[str, tuple[str, dict]] = {}
 
     async def request(self, method: str, path: str, payload: dict | None = None) -> dict:
         connector = UnixConnector(path=self.socket_path)
         timeout = ClientTimeout(total=20, connect=5, sock_connect=5, sock_read=20)
+        cached = self._etag_cache.get(path) if method == "GET" else None
+        headers = {"If-None-Match": cached[0]} if cached else None
         async with ClientSession(connector=connector, timeout=timeout) as session:
-            async with session.request(method, f"http://localhost{path}", json=payload) as resp:
+            async with session.request(method, f"http://localhost{path}", json=payload, headers=headers) as resp:
+                if resp.status == 304 and cached:
+                    return {"status": 200, "body": cached[1], "not_modified": True}
                 try:
                     # Allow JSON decoding even if daemon returns wrong content-type.
                     body = await resp.json(content_type=None)
+                    etag = resp.headers.get("ETag")
+                    if method == "GET" and resp.status == 200 and etag and isinstance(body, dict):
+                        self._etag_cache[path] = (etag, body)
                     return {"status": resp.status, "body": body}
                 except Exception:
                     text = await resp.text()
@@ -47,12 +56,15 @@ class ApiClient:
         return asyncio.run(self.request(method, path, payload))
 
     async def _stream_sse(self, path: str, stop_event: threading.Event, on_event) -> None:
+        last_event_id: str | None = None
         while not stop_event.is_set():
             try:
                 connector = UnixConnector(path=self.socket_path)
                 timeout = ClientTimeout(total=None, connect=5, sock_connect=5, sock_read=60)
+                # Resume after the last delivered event so reconnects do not lose updates.
+                headers = {"Last-Event-ID": last_event_id} if last_event_id else None
                 async with ClientSession(connector=connector, timeout=timeout) as session:
-                    async with session.get(f"http://localhost{path}") as resp:
+                    async with session.get(f"http://localhost{path}", headers=headers) as resp:
                         if resp.status != 200:
                             await asyncio.sleep(1)
                             continue
@@ -61,6 +73,9 @@ class ApiClient:
                             if not line:
                                 break
                             text = line.decode("utf-8", errors="replace").strip()
+                            if text.startswith("id: "):
+                                last_event_id = text[4:].strip() or last_event_id
+                                continue
                             if not text.startswith("data: "):
                                 continue
                             payload = text[6:].strip()
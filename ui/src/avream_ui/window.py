@@ -488,5 +488,6 @@ class AvreamWindow(WindowBehaviorMixin, Adw.ApplicationWindow):
         self._refresh_status()
         self._refresh_passwordless_status()
         self._refresh_saved_wifi_endpoint_status()
+        self._start_event_stream()
 
         self.connect("close-request", self._on_close_request)
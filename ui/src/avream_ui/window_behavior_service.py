@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+
 from avream_ui.i18n import _
 from gi.repository import GLib  # type: ignore[import-not-found]
 
@@ -28,6 +30,39 @@ class WindowServiceMixin:
     def _on_show_manual_commands(self, _btn) -> None:
         self._show_info_dialog(_("Manual setup commands"), self._service_enable_commands())
 
+    def _start_event_stream(self) -> None:
+        """Follows daemon /events in a background thread; reconnects on its own."""
+        if getattr(self, "_event_stream_stop", None) is not None:
+            return
+        stop = threading.Event()
+        self._event_stream_stop = stop
+
+        def on_event(event: dict) -> None:
+            GLib.idle_add(self._on_daemon_event, event)
+
+        threading.Thread(
+            target=self.services.stream_events_sync,
+            args=(stop, on_event),
+            daemon=True,
+        ).start()
+
+    def _stop_event_stream(self) -> None:
+        stop = getattr(self, "_event_stream_stop", None)
+        if stop is not None:
+            stop.set()
+            self._event_stream_stop = None
+
+    def _on_daemon_event(self, event: dict) -> bool:
+        event_type = str(event.get("type", "")) if isinstance(event, dict) else ""
+        if event_type == "stream.reset" or event_type.startswith(("video.", "audio.", "update.state")):
+            self._refresh_status()
+        elif event_type == "devices.changed":
+            self._refresh_saved_wifi_endpoint_status()
+        elif self._daemon_locked:
+            # Any event means the daemon is reachable again.
+            self._refresh_status()
+        return False
+
     def _on_retry_service(self, _btn) -> None:
         self._refresh_status()
 
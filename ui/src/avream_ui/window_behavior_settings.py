@@ -5,6 +5,7 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import quote
 
 from gi.repository import Adw, Gdk, GLib  # type: ignore[import-not-found]
 
@@ -81,6 +82,7 @@ class WindowSettingsMixin:
         if source_id:
             GLib.source_remove(source_id)
             self._wifi_status_refresh_source_id = 0
+        self._stop_event_stream()
         return False
 
     def _ui_settings_path(self) -> Path:
@@ -263,27 +265,8 @@ class WindowSettingsMixin:
                 return False
 
             data = body.get("data", {}) if isinstance(body, dict) else {}
-            devices = data.get("devices", []) if isinstance(data, dict) else []
-            if not isinstance(devices, list):
-                devices = []
-
-            matched_state = None
-            for dev in devices:
-                if not isinstance(dev, dict):
-                    continue
-                state = str(dev.get("state", "unknown"))
-                serials = dev.get("serials") if isinstance(dev.get("serials"), dict) else {}
-                wifi = str(serials.get("wifi", "")) if isinstance(serials, dict) else ""
-                cand = str(dev.get("wifi_candidate_endpoint", ""))
-                candidates = {
-                    self._normalize_wifi_endpoint(wifi),
-                    self._normalize_wifi_endpoint(cand),
-                    wifi.strip(),
-                    cand.strip(),
-                }
-                if endpoint in candidates or endpoint_raw in candidates:
-                    matched_state = state
-                    break
+            state = data.get("state") if isinstance(data, dict) else None
+            matched_state = str(state) if isinstance(state, str) and state else None
 
             if matched_state == "device":
                 self._set_wifi_endpoint_status(_("Endpoint status: connected ({endpoint})").format(endpoint=endpoint), connected=True)
@@ -303,7 +286,8 @@ class WindowSettingsMixin:
                 self._refresh_saved_wifi_endpoint_status()
             return False
 
-        self._call_async("GET", "/android/devices", None, done)
+        # Answered from the daemon's device table; does not probe phones.
+        self._call_async("GET", f"/android/endpoints/{quote(endpoint, safe=':')}", None, done)
 
     def _schedule_saved_wifi_endpoint_status_refresh(self, delay_ms: int = 250) -> None:
         source_id = int(getattr(self, "_wifi_status_refresh_source_id", 0))
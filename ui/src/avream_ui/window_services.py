@@ -52,6 +52,9 @@ class WindowServices:
 
         threading.Thread(target=run, daemon=True).start()
 
+    def stream_events_sync(self, stop_event: threading.Event, on_event) -> None:
+        self._api.stream_sse_sync("/events", stop_event, on_event)
+
     @staticmethod
     def run_cmd_async(command: list[str], on_done) -> None:
         def run() -> None: